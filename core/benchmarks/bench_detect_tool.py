@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for detecting tool invocations in agent Bash commands.
+
+Run from core/: python -m benchmarks.bench_detect_tool [--tools N]
+"""
+
+import argparse
+import re
+import timeit
+
+from src.claude_service import detect_tools_from_command
+from src.tools import TOOL_REGISTRY
+
+COMMANDS = [
+    'python -m src.tools.sanctions "Vladimir Putin"',
+    'cd /app/core && python -m src.tools.crypto_trace "0xdeadbeef"',
+    'python -m src.tools.pep_check "Jane Doe" && python -m src.tools.geo_risk "RU"',
+    "ls -la src/tools",
+    'cat .claude/skills/compliance/SKILL.md',
+]
+
+
+def per_tool_regex_detect(patterns: dict[str, re.Pattern], command: str) -> str | None:
+    """The previous approach: one compiled regex per tool, tried in turn."""
+    if not command.strip().startswith("python"):
+        return None  # also misses "cd x && python ..."
+    for tool_key, pattern in patterns.items():
+        if pattern.search(command):
+            return tool_key
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tools", type=int, default=len(TOOL_REGISTRY), help="registry size to simulate")
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    for i in range(max(0, args.tools - len(TOOL_REGISTRY))):
+        TOOL_REGISTRY[f"extra_tool_{i}"] = {"name": f"Extra {i}"}
+    # Put the real tools last so the per-tool loop sees a worst case for a big registry.
+    keys = sorted(TOOL_REGISTRY, key=lambda k: not k.startswith("extra_tool_"))
+    per_tool = {
+        key: re.compile(rf"(?:{key}\.py|src\.tools\.{key}|tools/{key})") for key in keys
+    }
+
+    for name, fn in (
+        ("combined", detect_tools_from_command),
+        ("per-tool", lambda c: per_tool_regex_detect(per_tool, c)),
+    ):
+        seconds = timeit.timeit(lambda: [fn(c) for c in COMMANDS], number=args.number)
+        per_call = seconds / (args.number * len(COMMANDS)) * 1e6
+        print(f"{name:>9}: {per_call:6.2f} us/command ({len(keys)} tools)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Sanctions and PEP name matching against synthetic lists of 10k-1M names.
+
+For each list size this builds the in-memory sanctions ``NameIndex``, the
+on-disk ``WatchlistStore`` (ingest, then a cold open as a worker would do)
+and a ``PepIndex``, then times three kinds of query: exact list names,
+perturbed ones (reordered, typo, dropped token) and names not on the list.
+
+Run from core/: python -m benchmarks.bench_matching [--sizes 10000 100000 1000000] [--json out.json]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from typing import Any, Callable
+
+from benchmarks.report import percentiles, write_json
+from src.tools.matching import NameIndex
+from src.tools.pep_data import PepIndex
+from src.tools.watchlist import WatchlistStore
+
+GIVEN = [
+    "ivan", "olga", "sergei", "anna", "mohammed", "fatima", "ali", "li", "wei", "maria", "jose", "juan",
+    "chen", "kim", "ahmed", "omar", "elena", "dmitri", "nikolai", "yusuf", "hassan", "laura", "peter", "igor",
+]
+SYLLABLES = ["ko", "va", "ren", "shi", "mar", "dov", "tan", "lei", "sar", "hov", "ber", "zan", "mil", "ros", "kar"]
+COMPANY_WORDS = ["trading", "holdings", "shipping", "energy", "capital", "metals", "logistics", "industries"]
+COMPANY_FORMS = ["llc", "ltd", "jsc", "gmbh", "sa", "fze"]
+COUNTRIES = ["RU", "IR", "KP", "SY", "BY", "VE", "CN", "AE", "TR", "GB", "US", "DE"]
+POSITIONS = ["Minister of Finance", "Member of Parliament", "Governor", "Ambassador", "Deputy Minister", "Mayor"]
+
+
+def surname(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def synthetic_name(rng: random.Random) -> tuple[str, str]:
+    if rng.random() < 0.7:
+        return "Person", f"{rng.choice(GIVEN)} {surname(rng)}".title()
+    return "Organization", f"{surname(rng)} {rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_FORMS)}".title()
+
+
+def sanctions_records(size: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    records = []
+    for i in range(size):
+        schema, name = synthetic_name(rng)
+        aliases = [synthetic_name(rng)[1] for _ in range(rng.choice((0, 0, 1, 2)))]
+        records.append({
+            "uid": f"ofac:{i}", "name": name, "schema": schema, "aliases": aliases,
+            "datasets": ["us_ofac_sdn"], "programs": ["SYN"], "countries": [rng.choice(COUNTRIES)],
+        })
+    return records
+
+
+def pep_records(size: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    records = []
+    for i in range(size):
+        country = rng.choice(COUNTRIES)
+        positions = [{"title": rng.choice(POSITIONS), "country": country}] if i % 4 else []
+        # Every fourth record is a relative of the PEP before it.
+        relations = [{"id": f"P{i - 1}", "relation": "spouse"}] if not positions and i else []
+        records.append({
+            "id": f"P{i}", "name": f"{rng.choice(GIVEN)} {surname(rng)}".title(), "countries": [country],
+            "positions": positions, "relations": relations,
+        })
+    return records
+
+
+def perturb(name: str, rng: random.Random) -> str:
+    tokens = name.split()
+    choice = rng.random()
+    if choice < 0.33 and len(tokens) > 1:
+        return " ".join(reversed(tokens))
+    if choice < 0.66:
+        t = rng.randrange(len(tokens))
+        word = tokens[t]
+        if len(word) > 3:
+            i = rng.randrange(1, len(word) - 1)
+            tokens[t] = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+        return " ".join(tokens)
+    return " ".join(tokens[:-1]) if len(tokens) > 2 else name.upper()
+
+
+def queries(names: list[str], count: int, seed: int) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    sample = [rng.choice(names) for _ in range(count)]
+    return {
+        "exact": sample,
+        "perturbed": [perturb(n, rng) for n in sample],
+        "miss": [f"{gibberish(rng)} {gibberish(rng)}" for _ in sample],
+    }
+
+
+def gibberish(rng: random.Random) -> str:
+    return "".join(rng.choice("bdfgjlpqwxz") for _ in range(8))
+
+
+def timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def bench_queries(search: Callable[[str], list], batches: dict[str, list[str]]) -> dict[str, dict[str, float]]:
+    rows = {}
+    for kind, names in batches.items():
+        samples, hits = [], 0
+        for name in names:
+            started = time.perf_counter()
+            hits += bool(search(name))
+            samples.append((time.perf_counter() - started) * 1000)
+        rows[kind] = {**percentiles(samples), "hit_rate": round(hits / len(names), 3)}
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="*", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=300, help="queries of each kind per list")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-store", action="store_true", help="skip the on-disk watchlist store")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = {}
+
+    def report(case: str, build_s: float, rows: dict[str, dict[str, float]], built: str = "built") -> None:
+        results[f"{case}:build"] = {"build_s": round(build_s, 3)}
+        print(f"{case:>24}: {built} in {build_s:6.2f} s")
+        for kind, row in rows.items():
+            results[f"{case}:{kind}"] = row
+            print(f"{'':>24}  {kind:>9}: p50 {row['p50_ms']:7.3f} ms  p99 {row['p99_ms']:7.3f} ms"
+                  f"  hits {row['hit_rate']:.0%}")
+
+    for size in args.sizes:
+        records = sanctions_records(size, args.seed)
+        batches = queries([r["name"] for r in records], args.queries, args.seed)
+
+        index, seconds = timed(lambda: NameIndex.from_records(records))
+        report(f"sanctions:memory:{size}", seconds, bench_queries(index.search, batches))
+        del index
+
+        if not args.skip_store:
+            with tempfile.TemporaryDirectory() as root:
+                _, ingest_s = timed(lambda: WatchlistStore(root).ingest("ofac", records))
+                store, open_s = timed(lambda: WatchlistStore(root))
+                results[f"sanctions:store:{size}:ingest"] = {"ingest_s": round(ingest_s, 3)}
+                rows = bench_queries(store.search, batches)
+                report(f"sanctions:store:{size}", open_s, rows, built=f"ingested in {ingest_s:.2f} s, opened")
+                del store
+
+        people = pep_records(size, args.seed)
+        batches = queries([p["name"] for p in people], args.queries, args.seed)
+        peps, seconds = timed(lambda: PepIndex(people))
+        report(f"pep:{size}", seconds, bench_queries(peps.search, batches))
+        del peps
+
+    write_json(args.json, "bench_matching", results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark converting and encoding agent SDK messages.
+
+Replays recorded trace logs (``logs/<project>.jsonl``; the ``message``
+entries are rebuilt into SDK message objects) or, without ``--log``, a
+synthetic stream shaped like one investigation with every tool.
+
+Run from core/: python -m benchmarks.bench_serialization [--log logs/x.jsonl ...]
+"""
+
+import argparse
+import json
+import timeit
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any
+
+from claude_agent_sdk.types import (
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ThinkingBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+from src.agent_backend import load_recorded
+from src.serialization import dumps, orjson, to_builtin
+from src.tools import TOOL_REGISTRY
+
+
+def legacy_to_dict(obj: Any) -> Any:
+    """The previous converter: probes every object and deep-copies dataclasses."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    if isinstance(obj, dict):
+        return {k: legacy_to_dict(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [legacy_to_dict(item) for item in obj]
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    if hasattr(obj, "__dict__"):
+        return {
+            key: legacy_to_dict(value)
+            for key, value in vars(obj).items()
+            if not callable(value) and not key.startswith("_")
+        }
+    return repr(obj)
+
+
+def synthetic_stream() -> list[Any]:
+    intro = AssistantMessage([TextBlock("I'll run all screening tools in parallel.")], "claude-sonnet-4-5")
+    messages: list[Any] = [intro]
+    for i, key in enumerate(TOOL_REGISTRY):
+        command = f'python -m src.tools.{key} "Vladimir Putin"'
+        thinking = ThinkingBlock("Checking " + key + ". " * 200, "sig" * 40)
+        messages.append(AssistantMessage(
+            [thinking, ToolUseBlock(f"tu{i}", "Bash", {"command": command})], "claude-sonnet-4-5"
+        ))
+        output = {
+            "id": f"{key}-1", "tool": key, "entity": "Vladimir Putin", "status": "match", "confidence": 95,
+            "findings": [{"source": f"list-{n}", "details": "x" * 120, "score": n / 10} for n in range(12)],
+            "sources": [f"https://example.org/{key}/{n}" for n in range(5)],
+        }
+        messages.append(UserMessage([ToolResultBlock(f"tu{i}", json.dumps(output, indent=2), False)]))
+    messages.append(ResultMessage(
+        "success", 48211, 45102, False, 20, "session-1", 0.42,
+        {"input_tokens": 51234, "output_tokens": 2481}, "## Risk Summary\n" + "High risk. " * 80,
+    ))
+    return messages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--log", type=Path, nargs="*", default=[], help="recorded trace logs to replay")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    messages = [m for path in args.log for m in load_recorded(path)] if args.log else synthetic_stream()
+    size = sum(len(dumps(m)) for m in messages)
+    print(f"{len(messages)} messages, {size / 1024:.0f} KiB encoded, orjson={'yes' if orjson else 'no'}")
+
+    for name, fn in (
+        ("legacy to_dict + json.dumps", lambda m: json.dumps(legacy_to_dict(m), default=str)),
+        ("to_builtin + dumps", lambda m: dumps(to_builtin(m))),
+        ("dumps (object)", dumps),
+    ):
+        seconds = timeit.timeit(lambda: [fn(m) for m in messages], number=args.number)
+        per_message = seconds / (args.number * len(messages)) * 1e6
+        print(f"{name:>28}: {per_message:8.2f} us/message")
+
+
+if __name__ == "__main__":
+    main()
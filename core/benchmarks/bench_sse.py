@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""End-to-end SSE throughput and concurrency ramp against the FastAPI app.
+
+The API runs in a child process (uvicorn) with the scripted agent backend
+replaying the synthetic investigation from ``bench_serialization`` (or,
+with ``--run-tools``, synthesizing a turn that really runs the tools), so
+everything from ``/start`` through the run manager, event log, trace writer
+and SSE framing is exercised without calling the model. ``--think-time``
+adds simulated model latency per assistant turn; with ``--run-tools``,
+adverse_media and business_registry still call their real upstreams
+unless left out of ``--tools``.
+
+For each concurrency level, that many clients each run ``--rounds``
+investigations back to back (start, then read the stream to the end), and
+the run reports p50/p95/p99 time to first event and to completion, plus
+events and sessions per second.
+
+Each client uses its own tenant id so the per-tenant session cap does not
+serialize the ramp; ``--max-sessions`` sets the global cap (SCOLO_MAX_SESSIONS).
+
+Run from core/: python -m benchmarks.bench_sse [--concurrency 1 4 16 64] [--json out.json]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.report import percentiles, write_json
+
+TOOLS = ["sanctions", "pep_check", "adverse_media", "geo_risk", "business_registry", "ubo_lookup"]
+
+
+def serve(port: int, think_time: float, run_tools: bool) -> None:
+    """Child process: run the API with a scripted agent backend."""
+    import uvicorn
+
+    from benchmarks.bench_serialization import synthetic_stream
+    from src.agent_backend import ScriptedBackend
+    from src.claude_service import claude_service
+
+    streams = [] if run_tools else [synthetic_stream()]
+    claude_service.backend = ScriptedBackend(streams, think_time=think_time)
+
+    from src.api.main import app
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def wait_ready(client: httpx.AsyncClient, server: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            sys.exit("API server exited during startup")
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    sys.exit("API server did not come up")
+
+
+async def session(client: httpx.AsyncClient, tenant: str, tools: list[str], stats: dict) -> None:
+    started = time.perf_counter()
+    r = await client.post(
+        "/api/projects/start",
+        json={"entity_name": "Vladimir Putin", "entity_type": "person", "tools": tools, "mode": "agent"},
+        headers={"x-tenant-id": tenant},
+    )
+    r.raise_for_status()
+    project_id = r.json()["project_id"]
+
+    first, events, size, completed = None, 0, 0, False
+    async with client.stream("GET", f"/api/projects/{project_id}/stream") as stream:
+        async for line in stream.aiter_lines():
+            size += len(line) + 1
+            if not line.startswith("data: "):
+                continue
+            if first is None:
+                first = time.perf_counter() - started
+            events += 1
+            completed = completed or '"type": "project_complete"' in line
+    stats["ttfe"].append((first or 0) * 1000)
+    stats["latency"].append((time.perf_counter() - started) * 1000)
+    stats["events"] += events
+    stats["bytes"] += size
+    stats["failed"] += not completed
+
+
+async def ramp_level(client: httpx.AsyncClient, concurrency: int, rounds: int, tools: list[str]) -> dict[str, float]:
+    stats = {"ttfe": [], "latency": [], "events": 0, "bytes": 0, "failed": 0}
+
+    async def worker(n: int) -> None:
+        for _ in range(rounds):
+            await session(client, f"bench-{n}", tools, stats)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    wall = time.perf_counter() - started
+    return {
+        **{f"ttfe_{k}": v for k, v in percentiles(stats["ttfe"]).items()},
+        **{f"session_{k}": v for k, v in percentiles(stats["latency"]).items()},
+        "events_per_s": round(stats["events"] / wall, 1),
+        "sessions_per_s": round(len(stats["latency"]) / wall, 2),
+        "mib_per_s": round(stats["bytes"] / wall / 2**20, 2),
+        "events_per_session": stats["events"] / max(len(stats["latency"]), 1),
+        "failed": stats["failed"],
+        "wall_s": round(wall, 3),
+    }
+
+
+async def run_ramp(args: argparse.Namespace, base_url: str, server: subprocess.Popen) -> dict[str, dict[str, float]]:
+    limits = httpx.Limits(max_connections=max(args.concurrency) * 2, max_keepalive_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits) as client:
+        await wait_ready(client, server)
+        await ramp_level(client, 1, 2, args.tools)  # warm imports, indexes and connections
+
+        results = {}
+        for concurrency in args.concurrency:
+            row = await ramp_level(client, concurrency, args.rounds, args.tools)
+            results[f"concurrency:{concurrency}"] = row
+            print(
+                f"c={concurrency:>4}: session p50 {row['session_p50_ms']:8.1f} p95 {row['session_p95_ms']:8.1f}"
+                f" p99 {row['session_p99_ms']:8.1f} ms | first event p50 {row['ttfe_p50_ms']:7.1f} ms"
+                f" | {row['events_per_s']:9.1f} events/s {row['sessions_per_s']:7.2f} sessions/s"
+                + (f" | {row['failed']} failed" if row["failed"] else "")
+            )
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, nargs="*", default=[1, 4, 16, 64])
+    parser.add_argument("--rounds", type=int, default=5, help="investigations per client at each level")
+    parser.add_argument("--think-time", type=float, default=0.0, help="seconds of simulated model time per turn")
+    parser.add_argument("--run-tools", action="store_true", help="run the selected tools instead of a replay")
+    parser.add_argument("--tools", nargs="*", default=TOOLS, help="tools selected for each investigation")
+    parser.add_argument("--max-sessions", type=int, default=None, help="SCOLO_MAX_SESSIONS for the server")
+    parser.add_argument("--serve", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    if args.serve is not None:
+        serve(args.serve, args.think_time, args.run_tools)
+        return
+
+    port = free_port()
+    env = dict(os.environ)
+    if args.max_sessions:
+        env["SCOLO_MAX_SESSIONS"] = str(args.max_sessions)
+    command = [sys.executable, "-m", "benchmarks.bench_sse", "--serve", str(port), "--think-time", str(args.think_time)]
+    if args.run_tools:
+        command.append("--run-tools")
+    server = subprocess.Popen(command, env=env)
+    try:
+        results = asyncio.run(run_ramp(args, f"http://127.0.0.1:{port}", server))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    write_json(args.json, "bench_sse", results, args)
+
+
+if __name__ == "__main__":
+    main()
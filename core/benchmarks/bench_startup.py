@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark: interpreter + import time for tool subprocesses and the API.
+
+Run from core/: python -m benchmarks.bench_startup [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "interpreter": [sys.executable, "-c", "pass"],
+    "import src.tools": [sys.executable, "-c", "import src.tools"],
+    "tool subprocess": [sys.executable, "-m", "src.tools.geo_risk", "RU"],
+    "import src.api.main": [sys.executable, "-c", "import src.api.main"],
+}
+
+
+def time_run(cmd: list[str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for name, cmd in SCENARIOS.items():
+        time_run(cmd)  # warm the filesystem and bytecode caches
+        samples = sorted(time_run(cmd) * 1000 for _ in range(args.runs))
+        print(f"{name:>20}: median {statistics.median(samples):7.1f} ms  min {samples[0]:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
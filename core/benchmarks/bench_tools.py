@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Per-tool ``check()`` micro-benchmarks.
+
+Each tool's simulated latency is zeroed so the numbers are the tool's own
+work (matching, scoring, building the result); pass ``--with-latency`` to
+keep it. Tools that call real upstreams (OpenCorporates, GDELT, Google
+News) only run with ``--network``.
+
+Run from core/: python -m benchmarks.bench_tools [--number N] [--json out.json]
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import time
+
+from benchmarks.report import percentiles, write_json
+from src.claude_service import build_tool_args
+from src.tools import TOOL_REGISTRY
+
+NETWORK_TOOLS = {"adverse_media", "business_registry"}
+
+ENTITIES = {
+    "hit": ("Vladimir Putin", "RU"),
+    "miss": ("Harbourview Logistics Ltd", "GB"),
+}
+
+
+def bench_tool(key: str, arg: str, number: int) -> list[float]:
+    check = importlib.import_module(f"src.tools.{key}").check
+    check(arg)  # build indexes and warm caches outside the timed loop
+    samples = []
+    for _ in range(number):
+        started = time.perf_counter()
+        check(arg)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--tools", nargs="*", default=None, help="tool keys (default: every offline tool)")
+    parser.add_argument("--network", action="store_true", help="include tools that call real upstreams")
+    parser.add_argument("--with-latency", action="store_true", help="keep each tool's SIMULATED_LATENCY")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    keys = args.tools or [k for k in TOOL_REGISTRY if args.network or k not in NETWORK_TOOLS]
+    if not args.with_latency:
+        for key in keys:
+            module = importlib.import_module(f"src.tools.{key}")
+            if hasattr(module, "SIMULATED_LATENCY"):
+                module.SIMULATED_LATENCY = 0
+
+    results = {}
+    for label, (entity, country) in ENTITIES.items():
+        tool_args = build_tool_args(entity, country)
+        for key in keys:
+            # Tools log every check to stderr; keep that out of the timings and the report.
+            with contextlib.redirect_stderr(io.StringIO()):
+                row = percentiles(bench_tool(key, tool_args.get(key, entity), args.number))
+            results[f"{key}:{label}"] = row
+            print(f"{key + ':' + label:>28}: p50 {row['p50_ms']:8.3f} ms  p99 {row['p99_ms']:8.3f} ms")
+
+    write_json(args.json, "bench_tools", results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Shared helpers for benchmark output, and a comparer for saved results.
+
+Benchmarks that take ``--json PATH`` write::
+
+    {"benchmark": "bench_tools", "created": ..., "git": ..., "python": ..., "args": {...},
+     "results": {"<case>": {"<metric>": number, ...}, ...}}
+
+Compare two runs of the same benchmark (from core/):
+
+    python -m benchmarks.report baseline.json current.json [--threshold 10]
+
+Metrics ending in ``_ms``/``_s``/``_us`` are lower-is-better, ``*_per_s``
+higher-is-better; changes beyond the threshold (percent) are flagged.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+Results = dict[str, dict[str, float]]
+
+
+def percentiles(samples: list[float], unit: str = "ms") -> dict[str, float]:
+    """Nearest-rank p50/p95/p99 plus mean and max of ``samples``, keyed ``p50_<unit>`` etc."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+
+    def rank(q: float) -> float:
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    row = {"p50": rank(0.50), "p95": rank(0.95), "p99": rank(0.99),
+           "mean": statistics.fmean(ordered), "max": ordered[-1]}
+    return {f"{k}_{unit}": round(v, 4) for k, v in row.items()}
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def write_json(path: str | Path | None, benchmark: str, results: Results, args: argparse.Namespace) -> None:
+    if not path:
+        return
+    document = {
+        "benchmark": benchmark,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": git_revision(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "args": {k: v for k, v in vars(args).items() if k != "json"},
+        "results": results,
+    }
+    Path(path).write_text(json.dumps(document, indent=2, default=str) + "\n")
+    print(f"wrote {path}")
+
+
+def _direction(metric: str) -> int:
+    """+1 when a bigger number is better, -1 when smaller is, 0 when neither."""
+    if metric.endswith("_per_s"):
+        return 1
+    if metric.endswith(("_ms", "_s", "_us")):
+        return -1
+    return 0
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+    """One line per shared metric; regressions beyond ``threshold`` percent are marked."""
+    lines = []
+    for case, metrics in current["results"].items():
+        before = baseline["results"].get(case, {})
+        for metric, value in metrics.items():
+            old = before.get(metric)
+            if not isinstance(value, (int, float)) or not isinstance(old, (int, float)) or not old:
+                continue
+            change = (value - old) / old * 100
+            direction = _direction(metric)
+            flag = ""
+            if direction and abs(change) > threshold:
+                flag = "  REGRESSION" if change * direction < 0 else "  improved"
+            lines.append(f"{case:>32} {metric:>14}: {old:12.3f} -> {value:12.3f} ({change:+6.1f}%){flag}")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change to flag")
+    args = parser.parse_args()
+
+    baseline, current = (json.loads(p.read_text()) for p in (args.baseline, args.current))
+    if baseline.get("benchmark") != current.get("benchmark"):
+        sys.exit(f"{args.baseline} is {baseline.get('benchmark')}, {args.current} is {current.get('benchmark')}")
+    lines = compare(baseline, current, args.threshold)
+    print("\n".join(lines) or "no shared metrics")
+    if any(line.endswith("REGRESSION") for line in lines):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
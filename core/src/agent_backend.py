@@ -0,0 +1,177 @@
+"""Agent backends for ``ClaudeService``.
+
+A backend is anything called like ``claude_agent_sdk.query`` — keyword
+``prompt`` and ``options``, returning an async iterator of SDK messages.
+The SDK itself is the default; :class:`ScriptedBackend` is a deterministic
+local stand-in that never calls a model, for profiling and load-testing the
+SSE, parsing and aggregation path offline:
+
+- **replay**: recorded trace logs (``logs/<project>.jsonl``) are rebuilt into
+  SDK messages and replayed, one log per investigation, round-robin. Tool
+  results are only in the log at ``SCOLO_TRACE_LEVEL=full`` (with
+  ``SCOLO_TRACE_MAX_TEXT=0`` so their JSON is not cut), so record with those
+  for replays that produce ``agent_complete`` events.
+- **synthesize**: the tool commands in the prompt become Bash ``tool_use``
+  blocks, the tools really run (in-process), and their JSON output comes back
+  as ``tool_result`` blocks as each finishes, like the agent's own turn.
+
+``SCOLO_AGENT_THINK_TIME`` seconds are slept before every assistant turn to
+stand in for model latency; 0 measures only our own overhead.
+"""
+
+import asyncio
+import glob
+import itertools
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Protocol
+
+from claude_agent_sdk import ClaudeAgentOptions
+from claude_agent_sdk.types import (
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ThinkingBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+AGENT_BACKENDS = ("claude", "scripted")
+DEFAULT_AGENT_BACKEND = os.getenv("SCOLO_AGENT_BACKEND", "claude")
+# Glob of trace logs for the scripted backend to replay; unset synthesizes instead.
+AGENT_REPLAY = os.getenv("SCOLO_AGENT_REPLAY")
+AGENT_THINK_TIME = float(os.getenv("SCOLO_AGENT_THINK_TIME", "0"))
+
+SCRIPTED_MODEL = "scripted"
+
+# The "- Name (id): `command`" lines ClaudeService._build_prompt writes.
+_PROMPT_COMMAND = re.compile(r"^- .*: `([^`]+)`$", re.MULTILINE)
+
+
+class AgentBackend(Protocol):
+    def __call__(self, *, prompt: str, options: ClaudeAgentOptions | None = None) -> AsyncIterator[Any]: ...
+
+
+def _block(data: dict) -> Any:
+    if "thinking" in data:
+        return ThinkingBlock(data["thinking"], data.get("signature", ""))
+    if "tool_use_id" in data:
+        return ToolResultBlock(data["tool_use_id"], data.get("content"), data.get("is_error"))
+    if "name" in data:
+        return ToolUseBlock(data["id"], data["name"], data.get("input", {}))
+    return TextBlock(data.get("text", ""))
+
+
+def rebuild_message(data: dict) -> Any:
+    """Turn a logged message dict back into the SDK message object it came from."""
+    content = data.get("content")
+    if "subtype" in data and "session_id" in data:
+        return ResultMessage(**{k: data.get(k) for k in (
+            "subtype", "duration_ms", "duration_api_ms", "is_error", "num_turns", "session_id",
+            "total_cost_usd", "usage", "result",
+        )})
+    blocks = [_block(b) for b in content] if isinstance(content, list) else content
+    if "model" in data:
+        return AssistantMessage(blocks, data["model"], data.get("parent_tool_use_id"))
+    return UserMessage(blocks, parent_tool_use_id=data.get("parent_tool_use_id"))
+
+
+def load_recorded(path: str | Path) -> list[Any]:
+    """The agent messages of one trace log, in order."""
+    messages = []
+    for line in Path(path).read_text().splitlines():
+        entry = json.loads(line)
+        if entry.get("type") == "message" and isinstance(entry.get("content"), dict):
+            messages.append(rebuild_message(entry["content"]))
+    return messages
+
+
+class ScriptedBackend:
+    """Replays recorded message streams, or synthesizes one that runs the prompt's tools."""
+
+    def __init__(self, streams: Iterable[list[Any]] = (), think_time: float = AGENT_THINK_TIME):
+        self.streams = [s for s in streams if s]
+        self.think_time = think_time
+        self._next_stream = itertools.cycle(self.streams) if self.streams else None
+        self._session = itertools.count(1)
+
+    @classmethod
+    def from_logs(cls, paths: Iterable[str | Path], think_time: float = AGENT_THINK_TIME) -> "ScriptedBackend":
+        return cls([load_recorded(p) for p in paths], think_time)
+
+    @classmethod
+    def from_env(cls) -> "ScriptedBackend":
+        if not AGENT_REPLAY:
+            return cls()
+        paths = sorted(glob.glob(AGENT_REPLAY))
+        if not paths:
+            raise ValueError(f"SCOLO_AGENT_REPLAY={AGENT_REPLAY!r} matches no trace logs")
+        return cls.from_logs(paths)
+
+    def __call__(self, *, prompt: str, options: ClaudeAgentOptions | None = None) -> AsyncIterator[Any]:
+        if self._next_stream is not None:
+            return self._replay(next(self._next_stream))
+        return self._synthesize(prompt)
+
+    async def _think(self) -> None:
+        # Always yield to the loop, as a real stream would between messages.
+        await asyncio.sleep(self.think_time)
+
+    async def _replay(self, messages: list[Any]) -> AsyncIterator[Any]:
+        for message in messages:
+            if isinstance(message, AssistantMessage):
+                await self._think()
+            yield message
+
+    async def _synthesize(self, prompt: str) -> AsyncIterator[Any]:
+        started = time.monotonic()
+        session = f"scripted-{next(self._session)}"
+        commands = _PROMPT_COMMAND.findall(prompt)
+
+        await self._think()
+        uses = [ToolUseBlock(f"{session}-{i}", "Bash", {"command": c}) for i, c in enumerate(commands)]
+        yield AssistantMessage([TextBlock(f"Running {len(uses)} screening tools in parallel."), *uses], SCRIPTED_MODEL)
+
+        async def run(use: ToolUseBlock) -> ToolResultBlock:
+            output, is_error = await run_command(use.input["command"])
+            return ToolResultBlock(use.id, output, is_error)
+
+        for finished in asyncio.as_completed([run(use) for use in uses]):
+            yield UserMessage([await finished])
+
+        await self._think()
+        summary = f"Scripted run: {len(uses)} tools executed; no model was called."
+        yield AssistantMessage([TextBlock(summary)], SCRIPTED_MODEL)
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        yield ResultMessage(
+            subtype="success", duration_ms=elapsed_ms, duration_api_ms=0, is_error=False,
+            num_turns=2, session_id=session, total_cost_usd=0.0, usage={}, result=summary,
+        )
+
+
+async def run_command(command: str) -> tuple[str, bool]:
+    """Run the tools in a Bash command in-process; returns (stdout, is_error) as the agent would see them."""
+    from src.claude_service import detect_tools_from_command
+    from src.tools import ATOOLS
+
+    calls = detect_tools_from_command(command)
+    if not calls:
+        return f"scripted backend cannot run: {command}", True
+    outputs = []
+    for key, arg in calls:
+        try:
+            outputs.append(json.dumps(await ATOOLS[key](arg), indent=2))
+        except Exception as e:
+            return f"Traceback (most recent call last):\n{type(e).__name__}: {e}", True
+    return "\n".join(outputs), False
+
+
+def load_backend(name: str = DEFAULT_AGENT_BACKEND) -> AgentBackend | None:
+    """The backend named by ``SCOLO_AGENT_BACKEND``; ``None`` means the Claude Agent SDK."""
+    if name not in AGENT_BACKENDS:
+        raise ValueError(f"SCOLO_AGENT_BACKEND must be one of {AGENT_BACKENDS}, got {name!r}")
+    return ScriptedBackend.from_env() if name == "scripted" else None
@@ -1,6 +1,11 @@
 import logging
 import os
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
 # Try loading from /secrets/.env first (Cloud Run), then fallback to local .env
 if os.path.exists('/secrets/.env'):
@@ -10,12 +15,26 @@ else:
 
 logging.basicConfig(level=logging.INFO, format='%(name)s - %(levelname)s - %(message)s')
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+# Our modules read their settings from the environment at import time, so they
+# can only be imported once the .env file above has been loaded.
+from src import metrics  # noqa: E402
+from src.api.routes import batches, projects  # noqa: E402
+from src.claude_service import trace_writer  # noqa: E402
+from src.runs import run_manager  # noqa: E402
+from src.store import project_store  # noqa: E402
+from src.tools import http_client  # noqa: E402
 
-from src.api.routes import projects
 
-app = FastAPI(title="Scolo API", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await run_manager.shutdown()
+    await http_client.aclose()
+    project_store.close()
+    trace_writer.close()
+
+
+app = FastAPI(title="Scolo API", version="0.1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -33,8 +52,15 @@ app.add_middleware(
 )
 
 app.include_router(projects.router, prefix="/api")
+app.include_router(batches.router, prefix="/api")
 
 
 @app.get("/health")
 async def health():
     return {"status": "ok"}
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Tool, agent, stream, queue, cache and upstream metrics for Prometheus to scrape."""
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
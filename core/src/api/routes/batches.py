@@ -0,0 +1,115 @@
+"""Bulk screening API routes."""
+
+import json
+from typing import Literal
+
+from cuid2 import cuid_wrapper
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+from src.batch_service import (
+    DEFAULT_BATCH_TOOLS,
+    MAX_BATCH_ENTITIES,
+    iter_uploaded_entities,
+    parse_entity,
+    run_batch,
+)
+from src.claude_service import format_sse_event
+from src.jobs import DEFAULT_TENANT, QueueFullError, job_scheduler
+from src.metrics import track_stream
+from src.tools import TOOL_REGISTRY
+
+router = APIRouter(prefix="/batches", tags=["batches"])
+
+cuid = cuid_wrapper()
+
+
+class BatchEntity(BaseModel):
+    entity_name: str
+    entity_type: str = "company"
+    country: str = ""
+    reference: str | None = None
+
+
+class BatchRequest(BaseModel):
+    entities: list[BatchEntity]
+    tools: list[str] = DEFAULT_BATCH_TOOLS
+    format: Literal["ndjson", "sse"] = "ndjson"
+
+
+@router.post("")
+async def create_batch(request: Request) -> StreamingResponse:
+    """Screen many entities in-process and stream per-entity results.
+
+    Accepts either a JSON ``BatchRequest`` body or a multipart upload with a
+    CSV/NDJSON ``file`` plus optional ``tools`` (comma separated) and
+    ``format`` fields. Results stream back as NDJSON (default) or SSE, one
+    line per entity as it finishes, followed by a ``batch_complete`` aggregate.
+
+    A JSON body with more than ``SCOLO_MAX_BATCH_ENTITIES`` entities is
+    rejected with 413; an upload is screened up to that many rows and the
+    rest are counted as ``truncated`` in the aggregate. Unknown tool keys
+    and uploads that are not UTF-8 are rejected with 400.
+    """
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=422, detail="Multipart batches need a 'file' field")
+        try:
+            entities = iter_uploaded_entities(await upload.read(), upload.filename or "")
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="Uploaded file must be UTF-8 encoded")
+        tools_field = form.get("tools")
+        tools = [t.strip() for t in tools_field.split(",") if t.strip()] if tools_field else DEFAULT_BATCH_TOOLS
+        fmt = form.get("format") or "ndjson"
+    else:
+        try:
+            req = BatchRequest.model_validate(await request.json())
+        except (ValidationError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if len(req.entities) > MAX_BATCH_ENTITIES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Batch has {len(req.entities)} entities; the limit is {MAX_BATCH_ENTITIES}",
+            )
+        entities = filter(None, (parse_entity(e.model_dump(exclude_none=True)) for e in req.entities))
+        tools, fmt = req.tools, req.format
+
+    if fmt not in ("ndjson", "sse"):
+        raise HTTPException(status_code=422, detail="format must be 'ndjson' or 'sse'")
+    unknown = [t for t in tools if t not in TOOL_REGISTRY]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown tools: {', '.join(unknown)}")
+
+    try:
+        job_scheduler.check_capacity()
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    batch_id = cuid()
+    tenant = request.headers.get("x-tenant-id") or DEFAULT_TENANT
+
+    def encode(item: dict) -> str:
+        item["batch_id"] = batch_id
+        if fmt == "sse":
+            return format_sse_event(item.pop("type"), batch_id, payload=item)
+        return json.dumps(item) + "\n"
+
+    async def event_generator():
+        # The whole batch holds one low-priority session slot.
+        ticket = job_scheduler.submit(tenant, "batch")
+        try:
+            async for position in job_scheduler.wait(ticket):
+                yield encode({"type": "queued", "position": position, "priority": "batch"})
+            async for item in run_batch(entities, tools):
+                yield encode(item)
+        finally:
+            job_scheduler.release(ticket)
+
+    return StreamingResponse(
+        track_stream(event_generator()),
+        media_type="text/event-stream" if fmt == "sse" else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Batch-Id": batch_id},
+    )
@@ -1,15 +1,20 @@
 """Project management API routes."""
 
 import time
-from typing import ClassVar
+from typing import AsyncIterator, Literal
 
 from cuid2 import cuid_wrapper
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from src.claude_service import claude_service
+from src.claude_service import format_sse_event
+from src.events import SSE_COMPRESSION, EventLog, event_hub, gzip_events, parse_last_event_id, with_event_id
+from src.jobs import DEFAULT_TENANT, QueueFullError
+from src.metrics import track_stream
+from src.runs import run_manager
+from src.store import ACTIVE_STATUSES, project_store
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -43,32 +48,6 @@ DEFAULT_TOOLS = [
 ]
 
 
-class ProjectStore:
-    """In-memory project storage (replace with database in production)."""
-
-    _projects: ClassVar[dict[str, dict]] = {}
-
-    @classmethod
-    def create(cls, project_id: str, data: dict) -> dict:
-        cls._projects[project_id] = data
-        return data
-
-    @classmethod
-    def get(cls, project_id: str) -> dict | None:
-        return cls._projects.get(project_id)
-
-    @classmethod
-    def update(cls, project_id: str, updates: dict) -> dict | None:
-        if project_id in cls._projects:
-            cls._projects[project_id].update(updates)
-            return cls._projects[project_id]
-        return None
-
-    @classmethod
-    def exists(cls, project_id: str) -> bool:
-        return project_id in cls._projects
-
-
 class ToolInfo(BaseModel):
     id: str
     key: str
@@ -80,6 +59,10 @@ class StartRequest(BaseModel):
     entity_type: str = "company"
     country: str = ""
     tools: list[str] = DEFAULT_TOOLS
+    mode: Literal["agent", "direct"] | None = None
+    early_exit: Literal["off", "deprioritize", "cancel"] | None = None
+    priority: Literal["interactive", "batch"] = "interactive"
+    run: bool = False
 
 
 class StartResponse(BaseModel):
@@ -109,20 +92,30 @@ def build_tool_infos(tool_keys: list[str]) -> list[dict]:
 
 
 @router.post("/start", response_model=StartResponse)
-async def start_project(req: StartRequest) -> StartResponse:
-    """Start a new compliance investigation project."""
+async def start_project(req: StartRequest, x_tenant_id: str | None = Header(None)) -> StartResponse:
+    """Create a compliance investigation project.
+
+    With ``run`` set the investigation starts in the background right away;
+    otherwise it starts on the first ``/stream`` request.
+    """
     project_id = generate_project_id()
     tool_infos = build_tool_infos(req.tools)
 
-    ProjectStore.create(project_id, {
+    project_store.create(project_id, {
         "id": project_id,
         "entity_name": req.entity_name,
         "entity_type": req.entity_type,
         "country": req.country,
         "tools": tool_infos,
+        "mode": req.mode,
+        "early_exit": req.early_exit,
+        "priority": req.priority,
+        "tenant_id": x_tenant_id or DEFAULT_TENANT,
         "status": "pending",
         "started_at": time.time(),
     })
+    if req.run:
+        start_run(project_id, project_store.get(project_id))
 
     return StartResponse(
         project_id=project_id,
@@ -132,37 +125,71 @@ async def start_project(req: StartRequest) -> StartResponse:
     )
 
 
+def start_run(project_id: str, project: dict) -> EventLog | None:
+    try:
+        return run_manager.start(project_id, project)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+def completed_summary_event(project_id: str, project: dict) -> str:
+    """Stand-in replay for a finished project whose event log was not kept."""
+    return format_sse_event("project_complete", project_id, payload={
+        "risk_level": project.get("risk_level"),
+        "total_findings": project.get("total_findings", 0),
+        "tools_completed": project.get("tools_completed", 0),
+        "results": [],
+        "replayed": True,
+    })
+
+
 @router.get("/{project_id}/stream")
-async def stream_project(project_id: str) -> StreamingResponse:
-    """Stream SSE events for a running project."""
-    project = ProjectStore.get(project_id)
+async def stream_project(project_id: str, request: Request, last_event_id: str | None = None) -> StreamingResponse:
+    """Subscribe to a project's events, resuming after ``Last-Event-ID``.
+
+    The run itself belongs to the run manager, so disconnecting does not stop
+    it. Every viewer shares that run, even across workers: a worker that does
+    not hold the run tails the events its owner saves. Finished projects are
+    replayed from the stored event log instead of being run again. With
+    ``SCOLO_SSE_COMPRESSION`` set the stream is gzipped for clients that accept it.
+    """
+    project = project_store.get(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    ProjectStore.update(project_id, {"status": "running"})
-
-    async def event_generator():
-        async for chunk in claude_service.run_project(
-            project_id=project_id,
-            entity_name=project["entity_name"],
-            entity_type=project["entity_type"],
-            tools=project["tools"],
-            country=project.get("country", ""),
-        ):
-            yield chunk
-        ProjectStore.update(project_id, {"status": "completed"})
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-    )
+    after = parse_last_event_id(request.headers.get("last-event-id") or last_event_id)
+    if project.get("status") in ACTIVE_STATUSES:
+        # No local run for an active project: start it here unless another worker holds it.
+        log = event_hub.live(project_id) or start_run(project_id, project)
+        events = log.follow(after) if log is not None else run_manager.tail(project_id, after)
+    elif (log := event_hub.get(project_id)) is not None:
+        events = log.follow(after)
+    else:
+        events = _single_event(with_event_id(completed_summary_event(project_id, project), 1), after)
+
+    headers = {"Cache-Control": "no-cache", "Connection": "keep-alive"}
+    if SSE_COMPRESSION and "gzip" in request.headers.get("accept-encoding", ""):
+        events = gzip_events(events)
+        headers.update({"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+
+    return StreamingResponse(track_stream(events), media_type="text/event-stream", headers=headers)
+
+
+async def _single_event(chunk: str, after: int) -> AsyncIterator[str]:
+    if after < 1:
+        yield chunk
+
+
+@router.get("")
+async def list_projects(status: str | None = None, limit: int = 100) -> list[dict]:
+    """List projects, newest first, optionally filtered by status."""
+    return project_store.list(status=status, limit=min(limit, 1000))
 
 
 @router.get("/{project_id}")
 async def get_project(project_id: str) -> dict:
     """Get project details."""
-    project = ProjectStore.get(project_id)
+    project = project_store.get(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
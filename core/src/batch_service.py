@@ -0,0 +1,162 @@
+"""In-process bulk screening of many entities."""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+from src.claude_service import WARNING_STATUSES, assess_risk, build_tool_args
+
+logger = logging.getLogger(__name__)
+
+BATCH_CONCURRENCY = int(os.getenv("SCOLO_BATCH_CONCURRENCY", "32"))
+MAX_BATCH_ENTITIES = int(os.getenv("SCOLO_MAX_BATCH_ENTITIES", "100000"))
+
+DEFAULT_BATCH_TOOLS = ["sanctions", "pep_check", "adverse_media", "geo_risk"]
+
+
+def parse_entity(row: dict[str, Any]) -> dict[str, str] | None:
+    """Normalize a CSV/JSON row into an entity dict, or None if it has no name."""
+    name = (row.get("entity_name") or row.get("name") or "").strip()
+    if not name:
+        return None
+    return {
+        "entity_name": name,
+        "entity_type": (row.get("entity_type") or row.get("type") or "company").strip(),
+        "country": (row.get("country") or "").strip(),
+        **({"reference": str(row["reference"])} if row.get("reference") else {}),
+    }
+
+
+def iter_csv_entities(lines: Iterable[str]) -> Iterator[dict[str, str]]:
+    for row in csv.DictReader(lines):
+        entity = parse_entity(row)
+        if entity:
+            yield entity
+
+
+def iter_ndjson_entities(lines: Iterable[str]) -> Iterator[dict[str, str]]:
+    for line in lines:
+        if line.strip():
+            entity = parse_entity(json.loads(line))
+            if entity:
+                yield entity
+
+
+def iter_uploaded_entities(content: bytes, filename: str = "") -> Iterator[dict[str, str]]:
+    """Lazily parse entities out of an uploaded CSV or NDJSON file."""
+    text = io.StringIO(content.decode("utf-8-sig"), newline="")
+    if filename.endswith((".ndjson", ".jsonl")):
+        return iter_ndjson_entities(text)
+    return iter_csv_entities(text)
+
+
+async def screen_entity(entity: dict[str, str], tools: list[str]) -> dict[str, Any]:
+    """Run the selected tools for one entity and summarize the outcome.
+
+    If a tool failed, the entity's risk is ``incomplete`` rather than what the
+    other tools alone suggest, unless they already make it ``high``.
+    """
+    from src.tools.scheduler import scheduler
+
+    tool_args = build_tool_args(entity["entity_name"], entity.get("country", ""))
+    outcomes = await scheduler.gather({key: (tool_args[key],) for key in tools if key in tool_args})
+
+    summaries: list[dict] = []
+    tool_results: dict[str, dict] = {}
+    errors: dict[str, str] = {}
+    for key, outcome in outcomes.items():
+        if isinstance(outcome, BaseException):
+            errors[key] = str(outcome)
+            continue
+        findings = outcome.get("findings", [])
+        summaries.append({"tool": key, "status": outcome.get("status", "unknown"), "findings": len(findings)})
+        tool_results[key] = {
+            "status": outcome.get("status", "unknown"),
+            "confidence": outcome.get("confidence"),
+            "findings": findings if outcome.get("status") in WARNING_STATUSES else len(findings),
+            "cached": outcome.get("cache", {}).get("hit", False),
+        }
+
+    risk_level, total_findings = assess_risk(summaries)
+    failed = errors or any(r["status"] == "error" for r in tool_results.values())
+    if failed and risk_level != "high":
+        risk_level = "incomplete"
+    return {
+        **entity,
+        "risk_level": risk_level,
+        "total_findings": total_findings,
+        "results": tool_results,
+        "errors": errors,
+    }
+
+
+async def run_batch(
+    entities: Iterable[dict[str, str]],
+    tools: list[str],
+    concurrency: int = BATCH_CONCURRENCY,
+) -> AsyncIterator[dict[str, Any]]:
+    """Screen ``entities`` with bounded parallelism, yielding each result as it finishes.
+
+    Entities are pulled lazily by ``concurrency`` workers, so a large upload is
+    never materialized as one task per row. Only the first
+    ``MAX_BATCH_ENTITIES`` are screened. The last item is a ``batch_complete``
+    aggregate, which counts any entities left over as ``truncated``.
+    """
+    started = time.perf_counter()
+    source = enumerate(entities)
+    queue: asyncio.Queue[dict | None] = asyncio.Queue(maxsize=concurrency * 2)
+    counts = {"high": 0, "medium": 0, "low": 0, "incomplete": 0}
+    totals = {"entities": 0, "errors": 0, "cache_hits": 0, "truncated": 0}
+
+    async def worker() -> None:
+        try:
+            for index, entity in source:
+                if index >= MAX_BATCH_ENTITIES:
+                    totals["truncated"] += 1
+                    continue
+                try:
+                    result = await screen_entity(entity, tools)
+                    await queue.put({"type": "entity_result", "index": index, **result})
+                except Exception as e:
+                    logger.exception("Batch entity %d failed", index)
+                    await queue.put({"type": "entity_error", "index": index, **entity, "error": str(e)})
+        except Exception as e:
+            logger.exception("Batch input could not be parsed")
+            await queue.put({"type": "input_error", "error": str(e)})
+        finally:
+            await queue.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    try:
+        remaining = len(workers)
+        while remaining:
+            item = await queue.get()
+            if item is None:
+                remaining -= 1
+                continue
+            if item["type"] == "input_error":
+                totals["errors"] += 1
+            elif item["type"] == "entity_error":
+                totals["entities"] += 1
+                totals["errors"] += 1
+            else:
+                totals["entities"] += 1
+                counts[item["risk_level"]] += 1
+                totals["cache_hits"] += sum(1 for r in item["results"].values() if r["cached"])
+                totals["errors"] += bool(item["errors"])
+            yield item
+    finally:
+        for task in workers:
+            task.cancel()
+
+    yield {
+        "type": "batch_complete",
+        **totals,
+        "risk_levels": counts,
+        "duration_ms": round((time.perf_counter() - started) * 1000),
+    }
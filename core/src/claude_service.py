@@ -4,102 +4,204 @@ import json
 import logging
 import os
 import re
-from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Iterator
 
 from claude_agent_sdk import query, ClaudeAgentOptions
+from pydantic import ValidationError
+
+from src.agent_backend import AgentBackend, load_backend
+from src.execution_policy import DEFAULT_EARLY_EXIT, ExecutionPolicy
+from src.metrics import SSE_EVENTS, TurnTimer
+from src.serialization import dumps, to_builtin
+from src.tools.models import ToolResult
+from src.trace_log import TraceWriter
 
 logger = logging.getLogger(__name__)
 
 LOG_DIR = Path(__file__).parent.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
-TOOL_PATTERNS = {
-    "sanctions": re.compile(r"(?:sanctions\.py|src\.tools\.sanctions|tools/sanctions)"),
-    "pep_check": re.compile(r"(?:pep_check\.py|src\.tools\.pep_check|tools/pep_check)"),
-    "adverse_media": re.compile(r"(?:adverse_media\.py|src\.tools\.adverse_media|tools/adverse_media)"),
-    "geo_risk": re.compile(r"(?:geo_risk\.py|src\.tools\.geo_risk|tools/geo_risk)"),
-    "business_registry": re.compile(r"(?:business_registry\.py|src\.tools\.business_registry|tools/business_registry)"),
-    "ubo_lookup": re.compile(r"(?:ubo_lookup\.py|src\.tools\.ubo_lookup|tools/ubo_lookup)"),
-    "employment_verify": re.compile(r"(?:employment_verify\.py|src\.tools\.employment_verify|tools/employment_verify)"),
-    "education_verify": re.compile(r"(?:education_verify\.py|src\.tools\.education_verify|tools/education_verify)"),
-    "court_records": re.compile(r"(?:court_records\.py|src\.tools\.court_records|tools/court_records)"),
-    "property_records": re.compile(r"(?:property_records\.py|src\.tools\.property_records|tools/property_records)"),
-    "corporate_filings": re.compile(r"(?:corporate_filings\.py|src\.tools\.corporate_filings|tools/corporate_filings)"),
-    "phone_lookup": re.compile(r"(?:phone_lookup\.py|src\.tools\.phone_lookup|tools/phone_lookup)"),
-    "email_lookup": re.compile(r"(?:email_lookup\.py|src\.tools\.email_lookup|tools/email_lookup)"),
-    "social_media": re.compile(r"(?:social_media\.py|src\.tools\.social_media|tools/social_media)"),
-    "domain_whois": re.compile(r"(?:domain_whois\.py|src\.tools\.domain_whois|tools/domain_whois)"),
-    "ip_geolocation": re.compile(r"(?:ip_geolocation\.py|src\.tools\.ip_geolocation|tools/ip_geolocation)"),
-    "crypto_trace": re.compile(r"(?:crypto_trace\.py|src\.tools\.crypto_trace|tools/crypto_trace)"),
-}
+trace_writer = TraceWriter(LOG_DIR)
 
 WARNING_STATUSES = frozenset({"match", "alert", "high", "critical"})
 
+EXECUTION_MODES = ("agent", "direct")
+DEFAULT_EXECUTION_MODE = os.getenv("SCOLO_EXECUTION_MODE", "agent")
 
-def to_dict(obj: Any) -> Any:
-    """Recursively convert objects to dictionaries."""
-    if is_dataclass(obj):
-        return asdict(obj)
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump()
-    if hasattr(obj, "dict"):
-        return obj.dict()
-    if isinstance(obj, dict):
-        return {k: to_dict(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple, set)):
-        return [to_dict(item) for item in obj]
-    if isinstance(obj, (str, int, float, bool)) or obj is None:
-        return obj
-    if hasattr(obj, "__dict__"):
-        return {
-            key: to_dict(value)
-            for key, value in vars(obj).items()
-            if not callable(value) and not key.startswith("_")
-        }
-    return repr(obj)
+# How much of each agent message goes into the ``trace`` SSE event (and the
+# matching trace-log entry): nothing, just what the UI renders, or everything.
+TRACE_LEVELS = ("off", "summary", "full")
+DEFAULT_TRACE_LEVEL = os.getenv("SCOLO_TRACE_LEVEL", "summary")
+# Longer strings in a trace are cut to this many characters; 0 keeps them whole.
+TRACE_MAX_TEXT = int(os.getenv("SCOLO_TRACE_MAX_TEXT", "2000"))
 
+_SUMMARY_MESSAGE_KEYS = ("model", "subtype", "result")
+_SUMMARY_BLOCK_KEYS = ("text", "id", "name", "tool_use_id", "is_error")
 
-def detect_tool_from_command(command: str) -> str | None:
-    """Detect which compliance tool a command invokes."""
-    logger.debug("Detecting tool from command: %s", command[:100])
-    if not command.strip().startswith("python"):
-        logger.debug("Command doesn't start with python")
+
+def truncate_strings(value: Any, max_len: int) -> Any:
+    """Cut every string in a JSON-like value to ``max_len`` characters."""
+    if isinstance(value, str):
+        if max_len and len(value) > max_len:
+            return f"{value[:max_len]}... [{len(value) - max_len} chars truncated]"
+        return value
+    if isinstance(value, dict):
+        return {k: truncate_strings(v, max_len) for k, v in value.items()}
+    if isinstance(value, list):
+        return [truncate_strings(item, max_len) for item in value]
+    return value
+
+
+def _summary_block(block: Any) -> dict | None:
+    if not isinstance(block, dict):
         return None
-    for tool_key, pattern in TOOL_PATTERNS.items():
-        if pattern.search(command):
-            logger.info("Detected tool: %s from command: %s", tool_key, command[:50])
-            return tool_key
-    logger.warning("No tool detected from command: %s", command[:100])
-    return None
+    summary = {k: block[k] for k in _SUMMARY_BLOCK_KEYS if k in block}
+    command = (block.get("input") or {}).get("command")
+    if command is not None:
+        summary["input"] = {"command": command}
+    return summary or None
+
+
+def build_trace_message(msg_dict: dict, level: str, max_text: int = TRACE_MAX_TEXT) -> dict | None:
+    """Shape an agent message for the ``trace`` event, or None when tracing is off.
+
+    ``summary`` keeps only the fields the canvas reads (text, tool calls and
+    their Bash commands, the final result); ``full`` keeps the whole message.
+    Both cut long strings to ``max_text``.
+    """
+    if level == "off":
+        return None
+    if level == "summary":
+        trace = {k: msg_dict[k] for k in _SUMMARY_MESSAGE_KEYS if k in msg_dict}
+        trace["content"] = [b for b in map(_summary_block, msg_dict.get("content") or []) if b]
+    else:
+        trace = msg_dict
+    return truncate_strings(trace, max_text)
+
+
+# One scan finds every ``python ... <tool> <arg>`` invocation in a command. It
+# starts with the literal ``python`` so the engine can skip straight between
+# interpreter invocations, and captures the module name generically; the
+# registry lookup afterwards is a dict hit, so cost does not grow with the
+# number of tools.
+TOOL_COMMAND_PATTERN = re.compile(
+    r"python(?<![\w.-]python)[\d.]*\s+(?:-\w+\s+)*"
+    r"(?:\S*?(?:src[./])?tools[./])?(?P<tool>\w+)(?:\.py)?(?![\w.])"
+    r"(?:\s+(?:-\S+\s+)*"
+    r"(?:\"(?P<dq>(?:[^\"\\]|\\.)*)\"|'(?P<sq>[^']*)'|(?P<bare>[^\s&|;'\"]+)))?"
+)
+
+
+def _entity_arg(match: re.Match) -> str:
+    dq, sq, bare = match.group("dq", "sq", "bare")
+    if dq is not None:
+        return dq.replace('\\"', '"')
+    return sq if sq is not None else bare or ""
+
+
+def detect_tools_from_command(command: str) -> list[tuple[str, str]]:
+    """Return ``(tool_key, entity_arg)`` for every compliance tool a command invokes, in order."""
+    if "python" not in command:
+        return []
+    from src.tools import TOOL_REGISTRY
+
+    return [
+        (m.group("tool"), _entity_arg(m))
+        for m in TOOL_COMMAND_PATTERN.finditer(command)
+        if m.group("tool") in TOOL_REGISTRY
+    ]
+
+
+def detect_tool_from_command(command: str) -> str | None:
+    """Detect which compliance tool a command invokes (the first, if it chains several)."""
+    detected = detect_tools_from_command(command)
+    return detected[0][0] if detected else None
+
+
+_json_decoder = json.JSONDecoder()
+
+
+def iter_json_objects(content: str) -> Iterator[dict]:
+    """Yield each complete top-level JSON object in ``content``, in order.
+
+    Works for pretty-printed objects, NDJSON and objects surrounded by log
+    noise: every ``{`` is tried with ``raw_decode`` and on success the scan
+    resumes after the decoded object, so each character is visited once
+    outside of a failed decode.
+    """
+    pos = content.find("{")
+    while pos != -1:
+        try:
+            obj, end = _json_decoder.raw_decode(content, pos)
+        except json.JSONDecodeError:
+            pos = content.find("{", pos + 1)
+            continue
+        if isinstance(obj, dict):
+            yield obj
+        pos = content.find("{", end)
+
+
+def parse_tool_results(content: str) -> list[dict]:
+    """Extract every schema-valid tool result from tool output."""
+    results = []
+    for obj in iter_json_objects(content):
+        try:
+            results.append(ToolResult.model_validate(obj).model_dump())
+        except ValidationError:
+            logger.debug("Skipping JSON object that is not a tool result: %s", list(obj)[:10])
+    return results
 
 
 def parse_tool_result(content: str) -> dict | None:
-    """Extract JSON result from tool output."""
-    try:
-        json_match = re.search(r'\{[\s\S]*\}', content)
-        if json_match:
-            return json.loads(json_match.group())
-    except (json.JSONDecodeError, AttributeError):
-        pass
-    return None
+    """Extract the first tool result from tool output."""
+    return next(iter(parse_tool_results(content)), None)
+
+
+def _result_text(content: Any) -> str:
+    """Tool result content is either a string or a list of ``{"type": "text"}`` blocks."""
+    if isinstance(content, list):
+        return "\n".join(block.get("text", "") for block in content if isinstance(block, dict))
+    return content or ""
 
 
 def format_sse_event(
     event_type: str,
     project_id: str,
     agent_id: str | None = None,
-    payload: dict | None = None
+    payload: dict | None = None,
+    payload_json: str | None = None,
 ) -> str:
-    """Format a Server-Sent Event message."""
+    """Format a Server-Sent Event message.
+
+    ``payload_json`` is a payload the caller already serialized; it is spliced
+    in as-is so the same encoding can be reused elsewhere (e.g. the trace log).
+    """
+    SSE_EVENTS.inc(event_type)
     event = {"type": event_type, "project_id": project_id}
     if agent_id:
         event["agent_id"] = agent_id
     if payload:
         event["payload"] = payload
-    return f"data: {json.dumps(event)}\n\n"
+    if payload_json is None:
+        return f"data: {json.dumps(event)}\n\n"
+    return f'data: {json.dumps(event)[:-1]}, "payload": {payload_json}}}\n\n'
+
+
+_SSE_TYPE_PREFIX = 'data: {"type": '
+
+
+def sse_event_type(chunk: str) -> str | None:
+    """The ``type`` of a :func:`format_sse_event` chunk, read without decoding its payload."""
+    if not chunk.startswith(_SSE_TYPE_PREFIX):
+        return None
+    return _json_decoder.raw_decode(chunk, len(_SSE_TYPE_PREFIX))[0]
+
+
+def parse_sse_event(chunk: str) -> dict:
+    """Decode a :func:`format_sse_event` chunk back into its event dict."""
+    return json.loads(chunk.removeprefix("data: "))
 
 
 def build_tool_commands(entity_name: str, country: str) -> dict[str, str]:
@@ -125,28 +227,49 @@ def build_tool_commands(entity_name: str, country: str) -> dict[str, str]:
     }
 
 
+def assess_risk(results: list[dict]) -> tuple[str, int]:
+    """Return ``(risk_level, total_findings)`` for a list of per-tool result summaries."""
+    total_findings = sum(r["findings"] for r in results)
+    has_match = any(r["status"] in WARNING_STATUSES for r in results)
+    return "high" if has_match else "medium" if total_findings > 0 else "low", total_findings
+
+
+def build_tool_args(entity_name: str, country: str) -> dict[str, str]:
+    """Build the argument each tool's check() is called with in direct mode."""
+    args = {key: entity_name for key in build_tool_commands(entity_name, country)}
+    args["geo_risk"] = country or "US"
+    return args
+
+
 class ClaudeService:
     """Service for running compliance investigations via Claude Agent SDK."""
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        trace_level: str = DEFAULT_TRACE_LEVEL,
+        backend: AgentBackend | None = None,
+    ):
+        if trace_level not in TRACE_LEVELS:
+            raise ValueError(f"trace_level must be one of {TRACE_LEVELS}, got {trace_level!r}")
+        self.trace_level = trace_level
+        # None runs the real agent through the Claude Agent SDK.
+        self.backend = backend if backend is not None else load_backend()
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        self._log_files: dict[str, Path] = {}
         if self.api_key:
             os.environ["ANTHROPIC_API_KEY"] = self.api_key
             logger.info("ClaudeService initialized")
         else:
             logger.warning("ANTHROPIC_API_KEY not set")
 
-    def _get_log_file(self, project_id: str) -> Path:
-        if project_id not in self._log_files:
-            self._log_files[project_id] = LOG_DIR / f"{project_id}.jsonl"
-        return self._log_files[project_id]
-
     def _log(self, project_id: str, data: dict) -> None:
-        log_file = self._get_log_file(project_id)
         entry = {"timestamp": datetime.now().isoformat(), "project_id": project_id, **data}
-        with open(log_file, "a") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
+        trace_writer.write(project_id, entry)
+
+    def _log_json(self, project_id: str, entry_type: str, key: str, value_json: str) -> None:
+        """Log ``{type: entry_type, key: <value_json>}`` reusing an already-encoded value."""
+        head = json.dumps({"timestamp": datetime.now().isoformat(), "project_id": project_id, "type": entry_type})
+        trace_writer.write_line(project_id, entry_type, f'{head[:-1]}, "{key}": {value_json}}}')
 
     async def run_project(
         self,
@@ -155,8 +278,24 @@ class ClaudeService:
         entity_type: str,
         tools: list[dict],
         country: str = "",
+        mode: str | None = None,
+        early_exit: str | None = None,
     ) -> AsyncGenerator[str, None]:
-        """Run a compliance investigation project with SSE streaming."""
+        """Run a compliance investigation project with SSE streaming.
+
+        ``mode`` selects how tools are executed: ``"agent"`` lets the agent run
+        each tool as a Bash subprocess, ``"direct"`` calls the tool registry
+        in-process and only uses the model for the final summary.
+        ``early_exit`` picks the :class:`ExecutionPolicy` for low-priority
+        tools in direct mode.
+        """
+        mode = mode or DEFAULT_EXECUTION_MODE
+        if mode == "direct":
+            policy = ExecutionPolicy(early_exit or DEFAULT_EARLY_EXIT)
+            async for event in self._run_direct(project_id, entity_name, entity_type, tools, country, policy):
+                yield event
+            return
+
         if not self._ensure_api_key():
             yield format_sse_event("error", project_id, payload={"message": "ANTHROPIC_API_KEY not configured"})
             return
@@ -170,7 +309,7 @@ class ClaudeService:
         self._log(project_id, {"type": "prompt", "content": prompt})
 
         tool_map = {t["key"]: t for t in tools}
-        pending_calls: dict[str, str] = {}
+        pending_calls: dict[str, list[str]] = {}
         started_tools: set[str] = set()
         results: list[dict] = []
 
@@ -185,7 +324,105 @@ class ClaudeService:
             self._log(project_id, {"type": "error", "error": str(e)})
             yield format_sse_event("error", project_id, payload={"message": str(e)})
 
+    async def _run_direct(
+        self,
+        project_id: str,
+        entity_name: str,
+        entity_type: str,
+        tools: list[dict],
+        country: str,
+        policy: ExecutionPolicy | None = None,
+    ) -> AsyncGenerator[str, None]:
+        from src.tools import ATOOLS
+        from src.tools.scheduler import scheduler
+
+        yield format_sse_event("project_start", project_id, payload={
+            "entity_name": entity_name,
+            "entity_type": entity_type,
+            "mode": "direct",
+        })
+        self._log(project_id, {"type": "direct_start", "tools": [t["key"] for t in tools]})
+        policy = policy or ExecutionPolicy()
+
+        tool_args = build_tool_args(entity_name, country)
+        tool_map = {t["key"]: t for t in tools if t["key"] in ATOOLS and t["key"] in tool_args}
+        results: list[dict] = []
+
+        for key, tool_info in tool_map.items():
+            yield format_sse_event(
+                "agent_start", project_id, tool_info["id"],
+                {"task": f"Running {tool_info['name']}...", "tool_key": key, "tool_name": tool_info["name"]}
+            )
+
+        try:
+            first, deferred = policy.partition(list(tool_map))
+            decided = False
+            for phase in (first, deferred):
+                if phase is deferred and policy.skip_deferred(decided):
+                    for key in deferred:
+                        self._log(project_id, {"type": "tool_skipped", "tool_key": key})
+                        yield self._build_skipped_event(project_id, key, tool_map[key])
+                    break
+                calls = {key: (tool_args[key],) for key in phase}
+                async for key, parsed, error in scheduler.as_completed(calls, progress=True):
+                    tool_info = tool_map[key]
+                    if parsed is not None and parsed.get("partial"):
+                        yield self._build_progress_event(project_id, key, tool_info, parsed)
+                        continue
+                    if error is not None:
+                        logger.error("Tool %s failed: %s", key, error)
+                        self._log(project_id, {"type": "tool_error", "tool_key": key, "error": str(error)})
+                        yield format_sse_event("agent_error", project_id, tool_info["id"], {"error": str(error)[:500]})
+                        continue
+                    self._log(project_id, {"type": "tool_result", "tool_key": key, "result": parsed})
+                    yield self._build_agent_complete_event(project_id, key, tool_info, parsed, results)
+                    update = self._build_risk_update_event(project_id, key, tool_info, parsed, results, policy)
+                    if update:
+                        decided = True
+                        yield update
+
+            summary = await self._summarize(project_id, entity_name, entity_type, results)
+            yield self._build_completion_event(project_id, results, summary=summary)
+
+        except Exception as e:
+            logger.exception("Direct run error")
+            self._log(project_id, {"type": "error", "error": str(e)})
+            yield format_sse_event("error", project_id, payload={"message": str(e)})
+
+    async def _summarize(self, project_id: str, entity_name: str, entity_type: str, results: list[dict]) -> str | None:
+        """Ask the model for a short risk summary of already-collected results."""
+        if not self._ensure_api_key():
+            return None
+
+        prompt = f"""Summarize the compliance risk for "{entity_name}" ({entity_type}) in 3-5 sentences.
+The screening tools have already run; do NOT run any tools. Results:
+{json.dumps(results, indent=2)}"""
+        options = ClaudeAgentOptions(
+            max_turns=1,
+            cwd=Path(__file__).parent.parent,
+            allowed_tools=[],
+            model="claude-sonnet-4-5",
+        )
+
+        parts: list[str] = []
+        try:
+            async for message in self._query(prompt, options):
+                msg_dict = to_builtin(message)
+                self._log(project_id, {"type": "message", "content": msg_dict})
+                content = msg_dict.get("content", [])
+                if isinstance(content, list):
+                    parts.extend(item["text"] for item in content if isinstance(item, dict) and "text" in item)
+        except Exception:
+            logger.exception("Summary generation failed")
+            return None
+        return "\n".join(parts) or None
+
+    def _query(self, prompt: str, options: ClaudeAgentOptions) -> AsyncIterator[Any]:
+        return (query if self.backend is None else self.backend)(prompt=prompt, options=options)
+
     def _ensure_api_key(self) -> bool:
+        if self.backend is not None:
+            return True
         if not self.api_key:
             self.api_key = os.getenv("ANTHROPIC_API_KEY")
             if self.api_key:
@@ -232,25 +469,31 @@ Begin by running all {len(instructions)} tools now."""
             model="claude-sonnet-4-5",
         )
 
-        async for message in query(prompt=prompt, options=options):
-            msg_dict = to_dict(message)
-            self._log(project_id, {"type": "message", "content": msg_dict})
+        turns = TurnTimer()
+        async for message in self._query(prompt, options):
+            msg_dict = to_builtin(message)
+            turns.message(msg_dict)
             logger.debug("Message: %s", msg_dict)
 
             content = msg_dict.get("content", [])
+            trace = build_trace_message(msg_dict, self.trace_level) if isinstance(content, list) else None
+            if trace is None:
+                self._log(project_id, {"type": "message", "content": msg_dict})
+            else:
+                # Encode once; the log entry and the SSE event share the bytes.
+                trace_json = dumps(trace)
+                self._log_json(project_id, "message", "content", trace_json)
+                yield format_sse_event("trace", project_id, payload_json=f'{{"message": {trace_json}}}')
             if not isinstance(content, list):
                 continue
 
-            yield format_sse_event("trace", project_id, payload={"message": msg_dict})
-
             for item in content:
                 if not isinstance(item, dict):
                     continue
 
-                event = self._process_content_item(
+                for event in self._process_content_item(
                     item, project_id, tool_map, pending_calls, started_tools, results
-                )
-                if event:
+                ):
                     yield event
 
     def _process_content_item(
@@ -261,14 +504,14 @@ Begin by running all {len(instructions)} tools now."""
         pending_calls: dict,
         started_tools: set,
         results: list
-    ) -> str | None:
+    ) -> list[str]:
         if item.get("name") == "Bash" and "input" in item:
             return self._handle_bash_call(item, project_id, tool_map, pending_calls, started_tools)
 
         if "tool_use_id" in item and item.get("tool_use_id") in pending_calls:
             return self._handle_tool_result(item, project_id, tool_map, pending_calls, results)
 
-        return None
+        return []
 
     def _handle_bash_call(
         self,
@@ -277,31 +520,25 @@ Begin by running all {len(instructions)} tools now."""
         tool_map: dict,
         pending_calls: dict,
         started_tools: set
-    ) -> str | None:
+    ) -> list[str]:
         command = item["input"].get("command", "")
-        tool_use_id = item.get("id", "")
-        logger.debug("Processing bash call with command: %s", command[:100])
-        detected_tool = detect_tool_from_command(command)
-
-        if not detected_tool:
-            logger.debug("No tool detected from bash call")
-            return None
-        if detected_tool not in tool_map:
-            logger.warning("Detected tool %s not in tool_map: %s", detected_tool, list(tool_map.keys()))
-            return None
-
-        tool_info = tool_map[detected_tool]
-        pending_calls[tool_use_id] = detected_tool
-        logger.info("Tool %s detected, adding to pending calls with id %s", detected_tool, tool_use_id)
-
-        if detected_tool not in started_tools:
-            started_tools.add(detected_tool)
-            logger.info("Sending agent_start event for tool: %s", tool_info['name'])
-            return format_sse_event(
+        tool_keys = [key for key, _ in detect_tools_from_command(command) if key in tool_map]
+        if not tool_keys:
+            logger.debug("No selected tool in bash call: %s", command[:100])
+            return []
+
+        pending_calls[item.get("id", "")] = tool_keys
+        events = []
+        for tool_key in tool_keys:
+            if tool_key in started_tools:
+                continue
+            started_tools.add(tool_key)
+            tool_info = tool_map[tool_key]
+            events.append(format_sse_event(
                 "agent_start", project_id, tool_info["id"],
-                {"task": f"Running {tool_info['name']}...", "tool_key": detected_tool, "tool_name": tool_info['name']}
-            )
-        return None
+                {"task": f"Running {tool_info['name']}...", "tool_key": tool_key, "tool_name": tool_info['name']}
+            ))
+        return events
 
     def _handle_tool_result(
         self,
@@ -310,29 +547,47 @@ Begin by running all {len(instructions)} tools now."""
         tool_map: dict,
         pending_calls: dict,
         results: list
-    ) -> str | None:
-        tool_use_id = item["tool_use_id"]
-        tool_key = pending_calls.pop(tool_use_id)
-        tool_info = tool_map.get(tool_key)
-
-        if not tool_info:
-            return None
-
-        result_content = item.get("content", "")
-        is_error = item.get("is_error", False)
-
-        if is_error:
-            return format_sse_event(
-                "agent_error", project_id, tool_info["id"],
-                {"error": result_content[:500]}
-            )
-
-        parsed = parse_tool_result(result_content)
-        if not parsed:
+    ) -> list[str]:
+        tool_keys = pending_calls.pop(item["tool_use_id"])
+        result_content = _result_text(item.get("content"))
+
+        if item.get("is_error", False):
+            return [
+                format_sse_event("agent_error", project_id, tool_map[key]["id"], {"error": result_content[:500]})
+                for key in tool_keys
+            ]
+
+        parsed_results = parse_tool_results(result_content)
+        if not parsed_results:
             logger.warning("Could not parse tool result from: %s", result_content[:200])
-            return None
-        logger.info("Parsed tool result: status=%s, findings=%d", parsed.get('status'), len(parsed.get('findings', [])))
+            return []
+
+        # A chained command prints one result per tool; match them up by the
+        # result's own "tool" field, falling back to invocation order.
+        unclaimed = list(tool_keys)
+        events = []
+        for parsed in parsed_results:
+            if not unclaimed:
+                break
+            tool_key = parsed["tool"] if parsed["tool"] in unclaimed else unclaimed[0]
+            unclaimed.remove(tool_key)
+            logger.debug(
+                "Parsed %s result: status=%s, findings=%d", tool_key, parsed["status"], len(parsed["findings"])
+            )
+            events.append(self._build_agent_complete_event(project_id, tool_key, tool_map[tool_key], parsed, results))
+            update = self._build_risk_update_event(project_id, tool_key, tool_map[tool_key], parsed, results)
+            if update:
+                events.append(update)
+        return events
 
+    def _build_agent_complete_event(
+        self,
+        project_id: str,
+        tool_key: str,
+        tool_info: dict,
+        parsed: dict,
+        results: list
+    ) -> str:
         status = parsed.get("status", "unknown")
         findings = parsed.get("findings", [])
         is_warning = status in WARNING_STATUSES
@@ -341,33 +596,81 @@ Begin by running all {len(instructions)} tools now."""
             "tool": tool_info["name"],
             "status": status,
             "findings": len(findings),
+            "cached": parsed.get("cache", {}).get("hit", False),
         })
 
-        return format_sse_event(
-            "agent_complete", project_id, tool_info["id"],
-            {
-                "status": status,
-                "resultType": "warning" if is_warning else "success",
-                "findings": findings,
-                "confidence": parsed.get("confidence", 80),
-                "tool_key": tool_key,
-                "tool_name": tool_info["name"],
-            }
-        )
+        payload = {
+            "status": status,
+            "resultType": "warning" if is_warning else "error" if status == "error" else "success",
+            "findings": findings,
+            "confidence": parsed.get("confidence", 80),
+            "tool_key": tool_key,
+            "tool_name": tool_info["name"],
+        }
+        if "cache" in parsed:
+            payload["cache"] = parsed["cache"]
+        return format_sse_event("agent_complete", project_id, tool_info["id"], payload)
+
+    def _build_progress_event(self, project_id: str, tool_key: str, tool_info: dict, partial: dict) -> str:
+        return format_sse_event("agent_progress", project_id, tool_info["id"], {
+            "status": partial.get("status", "running"),
+            "progress": partial.get("progress"),
+            "findings": partial.get("findings", []),
+            "tool_key": tool_key,
+            "tool_name": tool_info["name"],
+        })
+
+    def _build_risk_update_event(
+        self,
+        project_id: str,
+        tool_key: str,
+        tool_info: dict,
+        parsed: dict,
+        results: list,
+        policy: ExecutionPolicy | None = None,
+    ) -> str | None:
+        """Emit a provisional risk level the first time a decisive result arrives."""
+        policy = policy or ExecutionPolicy()
+        if not policy.is_decisive(tool_key, parsed) or any(r.get("decisive") for r in results):
+            return None
+        results[-1]["decisive"] = True
+        risk_level, total_findings = assess_risk(results)
+        self._log(project_id, {"type": "risk_update", "tool_key": tool_key, "risk_level": risk_level})
+        return format_sse_event("risk_update", project_id, payload={
+            "risk_level": risk_level,
+            "provisional": True,
+            "decided_by": tool_key,
+            "tool_name": tool_info["name"],
+            "total_findings": total_findings,
+            "tools_completed": len(results),
+        })
 
-    def _build_completion_event(self, project_id: str, results: list) -> str:
-        total_findings = sum(r["findings"] for r in results)
-        has_match = any(r["status"] in WARNING_STATUSES for r in results)
-        risk_level = "high" if has_match else "medium" if total_findings > 0 else "low"
+    def _build_skipped_event(self, project_id: str, tool_key: str, tool_info: dict) -> str:
+        return format_sse_event("agent_complete", project_id, tool_info["id"], {
+            "status": "skipped",
+            "resultType": "info",
+            "findings": [],
+            "tool_key": tool_key,
+            "tool_name": tool_info["name"],
+            "skipped": True,
+            "reason": "Risk already decided; low-priority check skipped",
+        })
+
+    def _build_completion_event(self, project_id: str, results: list, summary: str | None = None) -> str:
+        risk_level, total_findings = assess_risk(results)
 
         self._log(project_id, {"type": "complete", "results": results})
 
-        return format_sse_event("project_complete", project_id, payload={
+        payload = {
             "total_findings": total_findings,
             "tools_completed": len(results),
+            "cache_hits": sum(1 for r in results if r.get("cached")),
             "risk_level": risk_level,
             "results": results,
-        })
+        }
+        if summary:
+            payload["summary"] = summary
+        return format_sse_event("project_complete", project_id, payload=payload)
 
 
 claude_service = ClaudeService()
@@ -0,0 +1,142 @@
+"""Replayable per-project SSE event logs.
+
+Every event a run publishes is appended to the project's :class:`EventLog`
+and numbered from 1. Viewers follow the log from any position, so a browser
+that reconnects with ``Last-Event-ID`` only receives what it missed and
+several viewers of one project share a single run. Finished logs are saved
+to the project store and replayed from there without re-running anything.
+Runs themselves are owned by :mod:`src.runs`.
+"""
+
+import asyncio
+import logging
+import os
+import zlib
+from typing import AsyncIterator
+
+from src.store import ProjectStoreBackend, project_store
+
+logger = logging.getLogger(__name__)
+
+# How long a finished log stays in memory before viewers are served from the store.
+LOG_RETENTION_SECONDS = float(os.getenv("SCOLO_EVENT_LOG_RETENTION", "300"))
+
+# Gzip /stream responses for clients that accept it. Off by default: proxies
+# in front of the API often compress (or buffer) on their own.
+SSE_COMPRESSION = os.getenv("SCOLO_SSE_COMPRESSION", "0") != "0"
+SSE_COMPRESSION_LEVEL = int(os.getenv("SCOLO_SSE_COMPRESSION_LEVEL", "6"))
+
+
+def with_event_id(chunk: str, event_id: int) -> str:
+    """Prefix a ``data: ...`` SSE chunk with its ``id:`` line."""
+    return f"id: {event_id}\n{chunk}"
+
+
+def parse_last_event_id(value: str | None) -> int:
+    try:
+        return max(0, int(value or 0))
+    except ValueError:
+        return 0
+
+
+async def gzip_events(chunks: AsyncIterator[str], level: int = SSE_COMPRESSION_LEVEL) -> AsyncIterator[bytes]:
+    """Gzip an SSE stream, sync-flushing after every event so none is held back.
+
+    One compressor spans the whole response, so repeated keys and tool names
+    in later events compress against earlier ones.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        yield compressor.compress(chunk.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+class EventLog:
+    """Append-only list of SSE chunks for one project run."""
+
+    def __init__(self, project_id: str, events: list[str] | None = None, done: bool = False):
+        self.project_id = project_id
+        self.events: list[str] = list(events or [])
+        # How many of ``events`` are already in the project store.
+        self.saved = len(self.events)
+        self.done = done
+        self._appended = asyncio.Event()
+
+    def append(self, chunk: str) -> int:
+        self.events.append(chunk)
+        self._wake()
+        return len(self.events)
+
+    def finish(self) -> None:
+        self.done = True
+        self._wake()
+
+    async def follow(self, after: int = 0) -> AsyncIterator[str]:
+        """Yield ``id:``-tagged chunks after event ``after``, then new ones until the run ends."""
+        position = after
+        while True:
+            while position < len(self.events):
+                position += 1
+                yield with_event_id(self.events[position - 1], position)
+            if self.done:
+                return
+            waiter = self._appended
+            await waiter.wait()
+
+    def _wake(self) -> None:
+        # Swap in a fresh Event so every follower waiting on the old one wakes exactly once.
+        self._appended, waiter = asyncio.Event(), self._appended
+        waiter.set()
+
+
+class EventHub:
+    """Owns the live :class:`EventLog` of every project being run or recently finished."""
+
+    def __init__(self, store: ProjectStoreBackend):
+        self.store = store
+        self._logs: dict[str, EventLog] = {}
+
+    def live(self, project_id: str) -> EventLog | None:
+        """The log of a run on this worker (or one that finished here recently)."""
+        return self._logs.get(project_id)
+
+    def get(self, project_id: str) -> EventLog | None:
+        log = self._logs.get(project_id)
+        if log is not None:
+            return log
+        events = self.store.load_events(project_id)
+        if events is None:
+            return None
+        return EventLog(project_id, events, done=True)
+
+    def open(self, project_id: str) -> EventLog:
+        """Create the live log a new run publishes into."""
+        log = self._logs[project_id] = EventLog(project_id)
+        return log
+
+    def persist(self, log: EventLog) -> None:
+        """Append the events the store does not have yet."""
+        start, end = log.saved, len(log.events)
+        if end > start:
+            self.store.append_events(log.project_id, start, log.events[start:end])
+            log.saved = max(log.saved, end)
+
+    def close(self, log: EventLog, persist: bool = True) -> None:
+        """Mark the run finished, save its remaining events and drop it from memory after a while."""
+        log.finish()
+        if persist:
+            try:
+                self.persist(log)
+            except Exception:
+                logger.exception("Failed to save event log for %s", log.project_id)
+        try:
+            asyncio.get_running_loop().call_later(LOG_RETENTION_SECONDS, self._forget, log)
+        except RuntimeError:
+            self._forget(log)
+
+    def _forget(self, log: EventLog) -> None:
+        if self._logs.get(log.project_id) is log:
+            del self._logs[log.project_id]
+
+
+event_hub = EventHub(project_store)
@@ -0,0 +1,59 @@
+"""Early-exit execution policy for investigations.
+
+A result is *decisive* when it settles the project's risk level on its own,
+such as an exact sanctions match. Once one arrives the orchestrator emits a
+provisional ``risk_update`` event, and in direct mode the policy decides what
+happens to the low-priority tools that have not started yet.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any
+
+EARLY_EXIT_MODES = ("off", "deprioritize", "cancel")
+DEFAULT_EARLY_EXIT = os.getenv("SCOLO_EARLY_EXIT", "off")
+
+LOW_PRIORITY_TOOLS = frozenset(
+    t.strip() for t in os.getenv("SCOLO_LOW_PRIORITY_TOOLS", "social_media,education_verify").split(",") if t.strip()
+)
+
+# tool_key -> (statuses, minimum confidence) that make a result decisive.
+DECISIVE_OUTCOMES: dict[str, tuple[frozenset[str], float]] = {
+    "sanctions": (frozenset({"match"}), float(os.getenv("SCOLO_DECISIVE_MIN_CONFIDENCE", "100"))),
+}
+
+
+@dataclass(frozen=True)
+class ExecutionPolicy:
+    """How a direct-mode run treats low-priority tools.
+
+    ``off`` starts every tool at once. ``deprioritize`` starts low-priority
+    tools only after the others have finished. ``cancel`` does the same but
+    skips them entirely if a decisive result has arrived by then.
+    """
+
+    early_exit: str = DEFAULT_EARLY_EXIT
+    low_priority: frozenset[str] = LOW_PRIORITY_TOOLS
+    decisive: dict[str, tuple[frozenset[str], float]] = field(default_factory=lambda: dict(DECISIVE_OUTCOMES))
+
+    def __post_init__(self):
+        if self.early_exit not in EARLY_EXIT_MODES:
+            raise ValueError(f"early_exit must be one of {EARLY_EXIT_MODES}, got {self.early_exit!r}")
+
+    def is_decisive(self, tool_key: str, result: dict[str, Any]) -> bool:
+        rule = self.decisive.get(tool_key)
+        if rule is None:
+            return False
+        statuses, min_confidence = rule
+        return result.get("status") in statuses and (result.get("confidence") or 0) >= min_confidence
+
+    def partition(self, tool_keys: list[str]) -> tuple[list[str], list[str]]:
+        """Split tools into ``(run_first, deferred)``."""
+        if self.early_exit == "off":
+            return list(tool_keys), []
+        first = [k for k in tool_keys if k not in self.low_priority]
+        deferred = [k for k in tool_keys if k in self.low_priority]
+        return first, deferred
+
+    def skip_deferred(self, decided: bool) -> bool:
+        return decided and self.early_exit == "cancel"
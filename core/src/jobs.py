@@ -0,0 +1,146 @@
+"""Admission control and weighted fair queueing for investigation sessions.
+
+Every investigation (and every bulk batch) takes a session slot before it
+runs. Slots are capped per instance and per tenant. Waiting jobs are ordered
+by weighted fair queueing: each tenant/priority flow gets a virtual finish
+tag that advances by ``1 / weight`` per job, so one tenant's burst
+interleaves with everyone else's work and interactive jobs move ahead of
+batch ones without starving them.
+
+Tool executions inside a session are bounded separately by the shared
+:class:`~src.tools.scheduler.ToolScheduler` (``SCOLO_TOOL_CONCURRENCY``).
+"""
+
+import asyncio
+import bisect
+import itertools
+import os
+from collections import defaultdict
+from typing import AsyncIterator
+
+PRIORITY_WEIGHTS: dict[str, float] = {"interactive": 8.0, "batch": 1.0}
+DEFAULT_PRIORITY = "interactive"
+DEFAULT_TENANT = "default"
+
+MAX_SESSIONS = int(os.getenv("SCOLO_MAX_SESSIONS", "16"))
+TENANT_MAX_SESSIONS = int(os.getenv("SCOLO_TENANT_MAX_SESSIONS", "4"))
+MAX_QUEUED = int(os.getenv("SCOLO_MAX_QUEUED_JOBS", "1000"))
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the wait queue is at ``max_queued``."""
+
+
+class Ticket:
+    """A job's place in the queue; admitted once it holds a session slot."""
+
+    __slots__ = ("tenant", "priority", "start", "finish", "seq", "admitted", "_wake")
+
+    def __init__(self, tenant: str, priority: str, start: float, finish: float, seq: int):
+        self.tenant = tenant
+        self.priority = priority
+        self.start = start
+        self.finish = finish
+        self.seq = seq
+        self.admitted = False
+        self._wake = asyncio.Event()
+
+    def __lt__(self, other: "Ticket") -> bool:
+        return (self.finish, self.seq) < (other.finish, other.seq)
+
+
+class JobScheduler:
+    """Admits jobs under instance and per-tenant session caps in weighted fair order."""
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        tenant_max_sessions: int = TENANT_MAX_SESSIONS,
+        max_queued: int = MAX_QUEUED,
+        weights: dict[str, float] | None = None,
+    ):
+        self.max_sessions = max_sessions
+        self.tenant_max_sessions = tenant_max_sessions
+        self.max_queued = max_queued
+        self.weights = {**PRIORITY_WEIGHTS, **(weights or {})}
+        self._waiting: list[Ticket] = []
+        self._running: dict[str, int] = defaultdict(int)
+        self._active = 0
+        self._virtual_time = 0.0
+        self._last_finish: dict[tuple[str, str], float] = {}
+        self._seq = itertools.count()
+
+    def check_capacity(self) -> None:
+        """Raise :class:`QueueFullError` if a new job could not be queued."""
+        if len(self._waiting) >= self.max_queued:
+            raise QueueFullError(f"{len(self._waiting)} jobs already queued")
+
+    def submit(self, tenant: str = DEFAULT_TENANT, priority: str = DEFAULT_PRIORITY) -> Ticket:
+        """Queue a job and admit it immediately if a slot is free."""
+        if priority not in self.weights:
+            raise ValueError(f"Unknown priority {priority!r}; expected one of {sorted(self.weights)}")
+        self.check_capacity()
+        flow = (tenant, priority)
+        start = max(self._virtual_time, self._last_finish.get(flow, 0.0))
+        finish = self._last_finish[flow] = start + 1.0 / self.weights[priority]
+        ticket = Ticket(tenant, priority, start, finish, next(self._seq))
+        bisect.insort(self._waiting, ticket)
+        self._dispatch()
+        return ticket
+
+    async def wait(self, ticket: Ticket) -> AsyncIterator[int]:
+        """Yield the ticket's 1-based queue position whenever it changes, until admitted."""
+        last = None
+        while not ticket.admitted:
+            position = self.position(ticket)
+            if position != last:
+                last = position
+                yield position
+            ticket._wake.clear()
+            await ticket._wake.wait()
+
+    def position(self, ticket: Ticket) -> int:
+        if ticket.admitted:
+            return 0
+        return bisect.bisect_left(self._waiting, ticket) + 1
+
+    def release(self, ticket: Ticket) -> None:
+        """Free the ticket's slot, or drop it from the queue if it never ran."""
+        if ticket.admitted:
+            ticket.admitted = False
+            self._active -= 1
+            self._running[ticket.tenant] -= 1
+        else:
+            index = bisect.bisect_left(self._waiting, ticket)
+            if index < len(self._waiting) and self._waiting[index] is ticket:
+                del self._waiting[index]
+        self._dispatch()
+
+    def stats(self) -> dict:
+        return {
+            "active": self._active,
+            "queued": len(self._waiting),
+            "max_sessions": self.max_sessions,
+            "tenants": {tenant: count for tenant, count in self._running.items() if count},
+        }
+
+    def _dispatch(self) -> None:
+        admitted = []
+        for ticket in self._waiting:
+            if self._active >= self.max_sessions:
+                break
+            if self._running[ticket.tenant] >= self.tenant_max_sessions:
+                continue
+            ticket.admitted = True
+            self._active += 1
+            self._running[ticket.tenant] += 1
+            self._virtual_time = max(self._virtual_time, ticket.start)
+            admitted.append(ticket)
+        if admitted:
+            self._waiting = [t for t in self._waiting if not t.admitted]
+        # Positions shift whenever anything is admitted or released.
+        for ticket in itertools.chain(admitted, self._waiting):
+            ticket._wake.set()
+
+
+job_scheduler = JobScheduler()
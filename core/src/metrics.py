@@ -0,0 +1,236 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Counters and histograms are updated inline on hot paths (one lock and a
+bisect per observation, no allocation beyond the first use of a label set);
+gauges that mirror state kept elsewhere — session queue, cache, upstream
+breakers — are read only when ``/metrics`` is scraped. There is no
+dependency on ``prometheus_client``; :func:`render` writes format 0.0.4.
+"""
+
+import bisect
+import threading
+import time
+from typing import AsyncIterator, Callable, Iterable
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+RUN_BUCKETS = (1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Labels, values: Labels, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names: Labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self.header() + [f"{self.name}{_label_text(self.label_names, k)} {_number(v)}" for k, v in values]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labels: Iterable[str] = (), buckets: Iterable[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: one count per bucket (non-cumulative; +Inf last), then the sum.
+        self._series: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            series = sorted((k, (list(c), s[0])) for k, (c, s) in self._series.items())
+        lines = self.header()
+        for labels, (counts, total) in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = _label_text(self.label_names, labels, f'le="{_number(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            label_text = _label_text(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_number(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+TOOL_DURATION = Histogram("scolo_tool_duration_seconds", "Duration of tool check() calls.", ["tool"])
+TOOL_RESULTS = Counter("scolo_tool_results_total", "Tool check() results by status.", ["tool", "status"])
+AGENT_TURNS = Counter("scolo_agent_turns_total", "Assistant turns streamed from the agent.", ["model"])
+AGENT_TURN_DURATION = Histogram(
+    "scolo_agent_turn_duration_seconds", "Time from the previous agent message to each assistant turn.", ["model"]
+)
+PROJECT_DURATION = Histogram(
+    "scolo_project_duration_seconds", "Wall time of investigation runs, queueing included.", ["mode", "status"],
+    buckets=RUN_BUCKETS,
+)
+SSE_EVENTS = Counter("scolo_sse_events_total", "Server-sent events emitted, by type.", ["type"])
+ACTIVE_STREAMS = Gauge("scolo_active_streams", "Open SSE connections.")
+ACTIVE_STREAMS.set(value=0)
+
+METRICS: list[_Metric] = [
+    TOOL_DURATION, TOOL_RESULTS, AGENT_TURNS, AGENT_TURN_DURATION, PROJECT_DURATION, SSE_EVENTS, ACTIVE_STREAMS,
+]
+
+# Called at scrape time; each returns metrics mirroring state owned elsewhere.
+_collectors: list[Callable[[], Iterable[_Metric]]] = []
+
+
+def collector(func: Callable[[], Iterable[_Metric]]) -> Callable[[], Iterable[_Metric]]:
+    _collectors.append(func)
+    return func
+
+
+def record_tool(tool: str, seconds: float, status: str) -> None:
+    TOOL_DURATION.observe(seconds, tool)
+    TOOL_RESULTS.inc(tool, status)
+
+
+async def track_stream(events: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Count ``events`` as an open stream until it is exhausted or the client goes away."""
+    ACTIVE_STREAMS.inc()
+    try:
+        async for chunk in events:
+            yield chunk
+    finally:
+        ACTIVE_STREAMS.dec()
+
+
+class TurnTimer:
+    """Observes each assistant turn of one agent stream, timed from the previous message."""
+
+    def __init__(self):
+        self._last = time.monotonic()
+
+    def message(self, msg_dict: dict) -> None:
+        now = time.monotonic()
+        if "model" in msg_dict:
+            model = str(msg_dict["model"])
+            AGENT_TURNS.inc(model)
+            AGENT_TURN_DURATION.observe(now - self._last, model)
+        self._last = now
+
+
+@collector
+def _sessions() -> Iterable[_Metric]:
+    from src.runs import run_manager
+
+    stats = run_manager.jobs.stats()
+    active = Gauge("scolo_sessions_active", "Investigations holding a session slot.")
+    active.set(value=stats["active"])
+    queued = Gauge("scolo_sessions_queued", "Investigations waiting for a session slot.")
+    queued.set(value=stats["queued"])
+    return active, queued
+
+
+@collector
+def _cache() -> Iterable[_Metric]:
+    from src.tools.cache import tool_cache
+
+    if tool_cache is None:
+        return ()
+    lookups = Counter("scolo_tool_cache_lookups_total", "Tool cache lookups by outcome.", ["result"])
+    for result, value in (("hit", tool_cache.hits), ("stale", tool_cache.stale_hits), ("miss", tool_cache.misses)):
+        lookups.inc(result, amount=value)
+    ratio = Gauge("scolo_tool_cache_hit_ratio", "Fresh tool cache hits over all lookups.")
+    ratio.set(value=round(tool_cache.hit_ratio, 4))
+    return lookups, ratio
+
+
+@collector
+def _upstreams() -> Iterable[_Metric]:
+    from src.tools import resilience
+
+    state = Gauge("scolo_upstream_circuit_open", "1 while an upstream's circuit breaker is open or half-open.",
+                  ["upstream"])
+    p95 = Gauge("scolo_upstream_latency_p95_seconds", "Observed p95 latency of successful upstream calls.",
+                ["upstream"])
+    hedges = Counter("scolo_upstream_hedged_requests_total", "Hedged duplicate requests sent.", ["upstream"])
+    retries = Counter("scolo_upstream_retries_total", "Failed upstream requests retried.", ["upstream"])
+    for name, stats in resilience.stats().items():
+        state.set(name, value=int(stats["state"] != "closed"))
+        if stats["p95_seconds"] is not None:
+            p95.set(name, value=stats["p95_seconds"])
+        hedges.inc(name, amount=stats["hedges"])
+        retries.inc(name, amount=stats["retries"])
+    return state, p95, hedges, retries
+
+
+def render() -> str:
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    for collect in _collectors:
+        for metric in collect():
+            lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,176 @@
+"""Background execution of investigations, independent of any HTTP stream.
+
+The :class:`RunManager` owns one task per running project. A run queues for
+a session slot, drives ``claude_service.run_project`` and publishes every
+event to the project's :class:`~src.events.EventLog`; ``/stream`` requests
+only subscribe to that log. Closing the browser tab no longer stops the run,
+and every state transition is written to the project store.
+
+With several workers sharing a store, a run is claimed in the store before
+it starts, so only one worker runs it. The owner renews its claim and appends
+its new events every ``SCOLO_RUN_HEARTBEAT_SECONDS``; viewers on other
+workers tail those saved events, and take the run over if the owner stops
+renewing its claim for ``SCOLO_RUN_LEASE_SECONDS``.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import AsyncIterator
+
+from src.claude_service import (
+    DEFAULT_EXECUTION_MODE,
+    ClaudeService,
+    claude_service,
+    format_sse_event,
+    parse_sse_event,
+    sse_event_type,
+)
+from src.events import EventHub, EventLog, event_hub, with_event_id
+from src.jobs import DEFAULT_PRIORITY, DEFAULT_TENANT, JobScheduler, QueueFullError, job_scheduler
+from src.metrics import PROJECT_DURATION
+from src.store import ACTIVE_STATUSES, ProjectStoreBackend, project_store
+
+logger = logging.getLogger(__name__)
+
+RUN_LEASE = float(os.getenv("SCOLO_RUN_LEASE_SECONDS", "30"))
+RUN_HEARTBEAT = float(os.getenv("SCOLO_RUN_HEARTBEAT_SECONDS", "2"))
+
+
+class RunManager:
+    """Starts, tracks and shuts down background investigation runs."""
+
+    def __init__(
+        self,
+        hub: EventHub = event_hub,
+        store: ProjectStoreBackend = project_store,
+        jobs: JobScheduler = job_scheduler,
+        service: ClaudeService = claude_service,
+    ):
+        self.hub = hub
+        self.store = store
+        self.jobs = jobs
+        self.service = service
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def is_running(self, project_id: str) -> bool:
+        return project_id in self._tasks
+
+    def start(self, project_id: str, project: dict | None = None) -> EventLog | None:
+        """Start the project's run unless one is already going; returns its live log.
+
+        Returns ``None`` when another worker holds the run; follow it with
+        :meth:`tail`. Raises :class:`~src.jobs.QueueFullError` if the job
+        queue is full.
+        """
+        if project_id in self._tasks:
+            return self.hub.get(project_id)
+        project = project or self.store.get(project_id)
+        if project is None:
+            raise KeyError(project_id)
+        self.jobs.check_capacity()
+        if not self.store.claim_run(project_id, self.worker_id, RUN_LEASE):
+            return None
+        log = self.hub.open(project_id)
+        task = self._tasks[project_id] = asyncio.create_task(self._execute(project_id, project, log))
+        task.add_done_callback(lambda _: self._tasks.pop(project_id, None))
+        return log
+
+    async def tail(self, project_id: str, after: int = 0) -> AsyncIterator[str]:
+        """Follow a run held by another worker through the events it saves to the store."""
+        position = after
+        while True:
+            project = await asyncio.to_thread(self.store.get, project_id)
+            for event in await asyncio.to_thread(self.store.load_events, project_id, position) or []:
+                position += 1
+                yield with_event_id(event, position)
+            if project is None or project.get("status") not in ACTIVE_STATUSES:
+                return
+            try:
+                log = self.start(project_id, project)
+            except QueueFullError:
+                log = None
+            if log is not None:
+                # The owner stopped renewing its claim; the run starts over on this worker.
+                async for chunk in log.follow():
+                    yield chunk
+                return
+            await asyncio.sleep(RUN_HEARTBEAT)
+
+    async def shutdown(self) -> None:
+        """Cancel every run still going; their projects are marked failed."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _execute(self, project_id: str, project: dict, log: EventLog) -> None:
+        tenant = project.get("tenant_id") or DEFAULT_TENANT
+        ticket = self.jobs.submit(tenant, project.get("priority") or DEFAULT_PRIORITY)
+        started = time.monotonic()
+        status, error = "failed", None
+        heartbeat = asyncio.create_task(self._heartbeat(project_id, log)) if self.store.shared else None
+        try:
+            if not ticket.admitted:
+                self.store.update(project_id, {"status": "queued"})
+            async for position in self.jobs.wait(ticket):
+                queued = {"position": position, "priority": ticket.priority}
+                log.append(format_sse_event("queued", project_id, payload=queued))
+
+            self.store.update(project_id, {"status": "running", "run_started_at": time.time()})
+            async for chunk in self.service.run_project(
+                project_id=project_id,
+                entity_name=project["entity_name"],
+                entity_type=project["entity_type"],
+                tools=project["tools"],
+                country=project.get("country", ""),
+                mode=project.get("mode"),
+                early_exit=project.get("early_exit"),
+            ):
+                log.append(chunk)
+                event_type = sse_event_type(chunk)
+                if event_type == "project_complete":
+                    payload = parse_sse_event(chunk)["payload"]
+                    status = "completed"
+                    self.store.update(project_id, {
+                        "risk_level": payload["risk_level"],
+                        "total_findings": payload["total_findings"],
+                        "tools_completed": payload["tools_completed"],
+                    })
+                elif event_type == "error":
+                    error = parse_sse_event(chunk)["payload"]["message"]
+        except asyncio.CancelledError:
+            error = "Run cancelled"
+            raise
+        except Exception as e:
+            logger.exception("Run for %s failed", project_id)
+            error = str(e)
+            log.append(format_sse_event("error", project_id, payload={"message": error}))
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+            self.jobs.release(ticket)
+            PROJECT_DURATION.observe(time.monotonic() - started, project.get("mode") or DEFAULT_EXECUTION_MODE, status)
+            # Save the rest of the log before the status flips, so tailing workers never stop short of the end.
+            self.hub.close(log)
+            updates = {"status": status, "finished_at": time.time()}
+            if status == "failed":
+                updates["error"] = error or "Run ended without a result"
+            self.store.update(project_id, updates)
+
+    async def _heartbeat(self, project_id: str, log: EventLog) -> None:
+        """Renew this worker's claim on the run and save the events added since the last beat."""
+        while True:
+            await asyncio.sleep(RUN_HEARTBEAT)
+            try:
+                await asyncio.to_thread(self.store.update, project_id, {"run_heartbeat": time.time()})
+                await asyncio.to_thread(self.hub.persist, log)
+            except Exception:
+                logger.exception("Heartbeat for %s failed", project_id)
+
+
+run_manager = RunManager()
@@ -0,0 +1,95 @@
+"""Fast conversion of agent SDK messages (and anything else) to JSON.
+
+Every agent message used to go through a recursive ``to_dict`` that probed
+``is_dataclass``/``model_dump``/``dict``/``__dict__`` on each object, deep
+copied dataclasses with ``asdict`` and was then JSON-encoded on top. Here the
+probing happens once per class: the first instance of a type builds a
+converter that is cached by type, so later messages go straight to a field
+loop. ``dumps`` encodes with orjson when it is installed (``pip install
+.[fast]``) and falls back to the stdlib encoder with the same converters as
+its ``default`` hook, so neither path builds an intermediate copy of the
+message first.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# (type, deep) -> converter. Deep converters return plain builtins all the
+# way down; shallow ones convert one level and leave nested values to the
+# JSON encoder's ``default`` hook.
+_converters: dict[tuple[type, bool], Callable[[Any], Any]] = {}
+
+
+def to_builtin(obj: Any) -> Any:
+    """Recursively convert ``obj`` to dicts, lists and scalars."""
+    cls = type(obj)
+    if cls in _SCALAR_TYPES:
+        return obj
+    if cls is dict:
+        return {k: to_builtin(v) for k, v in obj.items()}
+    if cls is list:
+        return [to_builtin(item) for item in obj]
+    converter = _converters.get((cls, True)) or _build_converter(obj, deep=True)
+    return converter(obj)
+
+
+def _default(obj: Any) -> Any:
+    converter = _converters.get((type(obj), False)) or _build_converter(obj, deep=False)
+    return converter(obj)
+
+
+_encoder = json.JSONEncoder(default=_default)
+
+
+def dumps(obj: Any) -> str:
+    """Encode ``obj`` as JSON, converting non-builtin objects on the fly."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib encoder handles them
+    return _encoder.encode(obj)
+
+
+def _build_converter(obj: Any, deep: bool) -> Callable[[Any], Any]:
+    """Probe ``obj`` once and cache a converter for every instance of its type."""
+    cls = type(obj)
+    convert = to_builtin if deep else _identity
+    converter: Callable[[Any], Any]
+    if is_dataclass(cls):
+        names = tuple(f.name for f in fields(cls))
+        converter = lambda obj: {name: convert(getattr(obj, name)) for name in names}  # noqa: E731
+    elif hasattr(obj, "model_dump"):
+        converter = lambda obj: obj.model_dump(mode="json")  # noqa: E731
+    elif callable(getattr(obj, "dict", None)):
+        converter = lambda obj: convert(obj.dict())  # noqa: E731
+    elif issubclass(cls, dict):
+        converter = lambda obj: {k: convert(v) for k, v in obj.items()}  # noqa: E731
+    elif issubclass(cls, (list, tuple, set, frozenset)):
+        converter = lambda obj: [convert(item) for item in obj]  # noqa: E731
+    elif issubclass(cls, (str, int, float)):
+        converter = _identity
+    elif hasattr(obj, "isoformat"):
+        converter = lambda obj: obj.isoformat()  # noqa: E731
+    elif hasattr(obj, "__dict__"):
+        converter = lambda obj: {  # noqa: E731
+            key: convert(value)
+            for key, value in vars(obj).items()
+            if not callable(value) and not key.startswith("_")
+        }
+    else:
+        converter = repr
+    _converters[(cls, deep)] = converter
+    return converter
+
+
+def _identity(obj: Any) -> Any:
+    return obj
@@ -0,0 +1,548 @@
+"""Pluggable project storage backends.
+
+``create_project_store()`` picks a backend from ``PROJECT_STORE_URL``:
+
+- ``memory://`` (default): per-process dict with TTL eviction
+- ``sqlite:///path/to/projects.db``: WAL-mode SQLite shared by every worker on a host
+- ``postgresql://...``: the web app's drizzle ``projects``/``investigations`` tables
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+try:
+    import psycopg
+    from psycopg.types.json import Jsonb
+except ImportError:
+    psycopg = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_STORE_URL = os.getenv("PROJECT_STORE_URL", "memory://")
+PROJECT_TTL = float(os.getenv("PROJECT_TTL_SECONDS", str(24 * 3600)))
+MAX_PROJECTS = int(os.getenv("PROJECT_STORE_MAX_ENTRIES", "10000"))
+FLUSH_INTERVAL = float(os.getenv("PROJECT_STORE_FLUSH_INTERVAL", "0.05"))
+FLUSH_BATCH_SIZE = 256
+
+ACTIVE_STATUSES = frozenset({"pending", "queued", "running"})
+
+
+def _claimable(project: dict, owner: str, now: float, lease: float) -> bool:
+    return project.get("status") in ACTIVE_STATUSES and (
+        project.get("run_owner") in (None, owner) or now - project.get("run_heartbeat", 0) > lease
+    )
+
+
+class ProjectStoreBackend(ABC):
+    """Interface every project store implements."""
+
+    # Whether other workers read this store, so runs must heartbeat and save events as they go.
+    shared = False
+
+    @abstractmethod
+    def create(self, project_id: str, data: dict) -> dict: ...
+
+    @abstractmethod
+    def get(self, project_id: str) -> dict | None: ...
+
+    @abstractmethod
+    def update(self, project_id: str, updates: dict) -> dict | None: ...
+
+    @abstractmethod
+    def claim_run(self, project_id: str, owner: str, lease: float) -> bool:
+        """Atomically make ``owner`` the one worker running an active project.
+
+        Succeeds if the run has no owner yet, ``owner`` already holds it, or
+        the holder has not renewed ``run_heartbeat`` for ``lease`` seconds.
+        """
+
+    def append_events(self, project_id: str, start: int, events: list[str]) -> None:
+        """Save a run's SSE events ``start + 1`` onwards so they can be replayed (or tailed by other workers).
+
+        Events are keyed by their position, so saving one again is harmless.
+        """
+
+    def load_events(self, project_id: str, after: int = 0) -> list[str] | None:
+        """Return the saved events after position ``after``, or None if there are none."""
+        return None
+
+    @abstractmethod
+    def list(self, status: str | None = None, limit: int = 100) -> list[dict]:
+        """Return projects, newest first, optionally filtered by status."""
+
+    def exists(self, project_id: str) -> bool:
+        return self.get(project_id) is not None
+
+    def flush(self) -> None:
+        """Persist any buffered writes."""
+
+    def close(self) -> None:
+        self.flush()
+
+
+class MemoryProjectStore(ProjectStoreBackend):
+    """Single-process store; finished projects expire after ``ttl`` seconds."""
+
+    def __init__(self, ttl: float = PROJECT_TTL, max_entries: int = MAX_PROJECTS):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._projects: OrderedDict[str, dict] = OrderedDict()
+        self._events: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, project_id: str, data: dict) -> dict:
+        with self._lock:
+            self._evict()
+            self._projects[project_id] = {**data, "updated_at": time.time()}
+            return self._projects[project_id]
+
+    def get(self, project_id: str) -> dict | None:
+        with self._lock:
+            project = self._projects.get(project_id)
+            if project is not None and self._expired(project, time.time()):
+                self._delete(project_id)
+                return None
+            return project
+
+    def update(self, project_id: str, updates: dict) -> dict | None:
+        with self._lock:
+            project = self._projects.get(project_id)
+            if project is None:
+                return None
+            project.update(updates, updated_at=time.time())
+            self._projects.move_to_end(project_id)
+            return project
+
+    def claim_run(self, project_id: str, owner: str, lease: float) -> bool:
+        now = time.time()
+        with self._lock:
+            project = self._projects.get(project_id)
+            if project is None or not _claimable(project, owner, now, lease):
+                return False
+            project.update(run_owner=owner, run_heartbeat=now, updated_at=now)
+            return True
+
+    def append_events(self, project_id: str, start: int, events: list[str]) -> None:
+        with self._lock:
+            if project_id in self._projects:
+                self._events.setdefault(project_id, [])[start:start + len(events)] = events
+
+    def load_events(self, project_id: str, after: int = 0) -> list[str] | None:
+        if self.get(project_id) is None:
+            return None
+        events = self._events.get(project_id, [])[after:]
+        return events or None
+
+    def list(self, status: str | None = None, limit: int = 100) -> list[dict]:
+        with self._lock:
+            projects = [p for p in self._projects.values() if status is None or p.get("status") == status]
+        projects.sort(key=lambda p: p.get("started_at", 0), reverse=True)
+        return projects[:limit]
+
+    def _expired(self, project: dict, now: float) -> bool:
+        return project.get("status") not in ACTIVE_STATUSES and now - project.get("updated_at", now) > self.ttl
+
+    def _delete(self, project_id: str) -> None:
+        del self._projects[project_id]
+        self._events.pop(project_id, None)
+
+    def _evict(self) -> None:
+        if len(self._projects) < self.max_entries:
+            return
+        now = time.time()
+        for project_id in [pid for pid, p in self._projects.items() if self._expired(p, now)]:
+            self._delete(project_id)
+        while len(self._projects) >= self.max_entries:
+            self._delete(next(iter(self._projects)))
+
+
+class BufferedProjectStore(ProjectStoreBackend):
+    """Base for database stores: creates write through, updates are batched.
+
+    ``create`` must be visible to every worker before ``/start`` returns, so it
+    is written immediately. Status and result updates are merged per project
+    and flushed together by a background thread; reads overlay pending updates
+    so a worker always sees its own writes. The last copy of each project a
+    worker has seen is kept, so updates to it need no read.
+    """
+
+    shared = True
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._pending: dict[str, dict] = {}
+        self._seen: OrderedDict[str, dict] = OrderedDict()
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="project-store-flush", daemon=True)
+        self._flusher.start()
+
+    @abstractmethod
+    def _insert(self, project_id: str, data: dict) -> None: ...
+
+    @abstractmethod
+    def _select(self, project_id: str) -> dict | None: ...
+
+    @abstractmethod
+    def _write_updates(self, updates: dict[str, dict]) -> None: ...
+
+    def create(self, project_id: str, data: dict) -> dict:
+        self._insert(project_id, data)
+        with self._pending_lock:
+            self._remember(project_id, data)
+        return data
+
+    def get(self, project_id: str) -> dict | None:
+        project = self._select(project_id)
+        with self._pending_lock:
+            pending = self._pending.get(project_id)
+            if project is not None:
+                if pending:
+                    project.update(pending)
+                self._remember(project_id, project)
+        return project
+
+    def update(self, project_id: str, updates: dict) -> dict | None:
+        with self._pending_lock:
+            project = self._seen.get(project_id)
+        if project is None and self.get(project_id) is None:
+            return None
+        with self._pending_lock:
+            self._pending.setdefault(project_id, {}).update(updates)
+            project = {**self._seen.get(project_id, {}), **self._pending[project_id]}
+            self._remember(project_id, project)
+            if len(self._pending) >= FLUSH_BATCH_SIZE:
+                self._wakeup.set()
+        return project
+
+    def flush(self) -> None:
+        with self._pending_lock:
+            batch, self._pending = self._pending, {}
+        if batch:
+            try:
+                self._write_updates(batch)
+            except Exception:
+                logger.exception("Failed to flush %d project updates", len(batch))
+                with self._pending_lock:
+                    for project_id, updates in batch.items():
+                        self._pending[project_id] = {**updates, **self._pending.get(project_id, {})}
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+        self._flusher.join(timeout=5)
+        self.flush()
+
+    def _remember(self, project_id: str, project: dict) -> None:
+        """Keep ``project`` as this worker's latest copy; callers hold ``_pending_lock``."""
+        self._seen[project_id] = dict(project)
+        self._seen.move_to_end(project_id)
+        while len(self._seen) > MAX_PROJECTS:
+            self._seen.popitem(last=False)
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+class SQLiteProjectStore(BufferedProjectStore):
+    """SQLite (WAL) store; one file can be shared by all uvicorn workers on a host."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS projects (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS projects_status_idx ON projects (status);
+        CREATE INDEX IF NOT EXISTS projects_created_at_idx ON projects (created_at);
+        CREATE TABLE IF NOT EXISTS project_events (
+            project_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            event TEXT NOT NULL,
+            PRIMARY KEY (project_id, seq)
+        );
+    """
+
+    def __init__(self, path: str, flush_interval: float = FLUSH_INTERVAL):
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._lock = threading.Lock()
+        super().__init__(flush_interval)
+
+    def _insert(self, project_id: str, data: dict) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO projects (id, status, created_at, updated_at, data) VALUES (?, ?, ?, ?, ?)",
+                (project_id, data.get("status", "pending"), data.get("started_at", now), now, json.dumps(data)),
+            )
+
+    def _select(self, project_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM projects WHERE id = ?", (project_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _write_updates(self, updates: dict[str, dict]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for project_id, changes in updates.items():
+                    row = self._conn.execute("SELECT data FROM projects WHERE id = ?", (project_id,)).fetchone()
+                    if row is None:
+                        continue
+                    data = {**json.loads(row[0]), **changes}
+                    self._conn.execute(
+                        "UPDATE projects SET status = ?, updated_at = ?, data = ? WHERE id = ?",
+                        (data.get("status", "pending"), now, json.dumps(data), project_id),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def claim_run(self, project_id: str, owner: str, lease: float) -> bool:
+        self.flush()
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT data FROM projects WHERE id = ?", (project_id,)).fetchone()
+                data = json.loads(row[0]) if row else None
+                claimed = data is not None and _claimable(data, owner, now, lease)
+                if claimed:
+                    data.update(run_owner=owner, run_heartbeat=now)
+                    self._conn.execute(
+                        "UPDATE projects SET updated_at = ?, data = ? WHERE id = ?", (now, json.dumps(data), project_id)
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return claimed
+
+    def append_events(self, project_id: str, start: int, events: list[str]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO project_events (project_id, seq, event) VALUES (?, ?, ?)",
+                    [(project_id, seq, event) for seq, event in enumerate(events, start + 1)],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def load_events(self, project_id: str, after: int = 0) -> list[str] | None:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT event FROM project_events WHERE project_id = ? AND seq > ? ORDER BY seq", (project_id, after)
+            ).fetchall()
+        return [row[0] for row in rows] or None
+
+    def list(self, status: str | None = None, limit: int = 100) -> list[dict]:
+        self.flush()
+        query = "SELECT data FROM projects"
+        params: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(query, (*params, limit)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        super().close()
+        with self._lock:
+            self._conn.close()
+
+
+class PostgresProjectStore(BufferedProjectStore):
+    """Store backed by the web app's drizzle ``projects``, ``investigations`` and ``project_events`` tables.
+
+    Tool selections are kept as ``pending`` investigation rows. The web app
+    owns ``user_id``/``name``; the backend only fills them in when it inserts
+    the row first. Run settings the web app has no column for (mode, tenant,
+    timings, error) are kept in the ``run_state`` jsonb column.
+    """
+
+    PROJECT_COLUMNS = {
+        "status": "status",
+        "risk_level": "risk_level",
+        "total_findings": "total_findings",
+        "tools_completed": "tools_completed",
+    }
+    # Backend-only fields, kept in the ``run_state`` jsonb column.
+    RUN_STATE_KEYS = (
+        "mode", "early_exit", "priority", "tenant_id", "run_owner", "run_heartbeat", "run_started_at", "finished_at",
+        "error",
+    )
+
+    def __init__(self, dsn: str, flush_interval: float = FLUSH_INTERVAL):
+        if psycopg is None:
+            raise RuntimeError("PostgresProjectStore requires the 'psycopg' package")
+        self._conn = psycopg.connect(dsn, autocommit=True)
+        self._lock = threading.Lock()
+        super().__init__(flush_interval)
+
+    def _insert(self, project_id: str, data: dict) -> None:
+        created_at = datetime.fromtimestamp(data.get("started_at", time.time()), tz=timezone.utc)
+        with self._lock, self._conn.transaction():
+            self._conn.execute(
+                """
+                INSERT INTO projects (id, user_id, name, entity_name, entity_type, country, status,
+                                      run_state, created_at, updated_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (id) DO UPDATE SET
+                    entity_name = EXCLUDED.entity_name,
+                    entity_type = EXCLUDED.entity_type,
+                    country = EXCLUDED.country,
+                    run_state = projects.run_state || EXCLUDED.run_state,
+                    updated_at = EXCLUDED.updated_at
+                """,
+                (
+                    project_id, data.get("user_id", ""), f"Investigation: {data['entity_name']}",
+                    data["entity_name"], data.get("entity_type", "company"), data.get("country") or None,
+                    data.get("status", "pending"), Jsonb(self._run_state(data)), created_at, created_at,
+                ),
+            )
+            with self._conn.cursor() as cur:
+                cur.executemany(
+                    """
+                    INSERT INTO investigations (id, project_id, tool_key, tool_name, status)
+                    VALUES (%s, %s, %s, %s, 'pending')
+                    ON CONFLICT (id) DO NOTHING
+                    """,
+                    [(t["id"], project_id, t["key"], t["name"]) for t in data.get("tools", [])],
+                )
+
+    def _select(self, project_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT id, entity_name, entity_type, country, status, risk_level, total_findings,
+                       tools_completed, created_at, run_state
+                FROM projects WHERE id = %s
+                """,
+                (project_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            tools = self._conn.execute(
+                "SELECT id, tool_key, tool_name FROM investigations WHERE project_id = %s ORDER BY started_at, id",
+                (project_id,),
+            ).fetchall()
+        return {
+            "id": row[0],
+            "entity_name": row[1],
+            "entity_type": row[2],
+            "country": row[3] or "",
+            "status": row[4],
+            "risk_level": row[5],
+            "total_findings": row[6],
+            "tools_completed": row[7],
+            "started_at": row[8].timestamp(),
+            **self._run_state(row[9] or {}),
+            "tools": [{"id": t[0], "key": t[1], "name": t[2]} for t in tools],
+        }
+
+    def _run_state(self, data: dict) -> dict:
+        return {k: data[k] for k in self.RUN_STATE_KEYS if k in data}
+
+    def _write_updates(self, updates: dict[str, dict]) -> None:
+        rows = []
+        for project_id, changes in updates.items():
+            columns = {self.PROJECT_COLUMNS[k]: v for k, v in changes.items() if k in self.PROJECT_COLUMNS}
+            state = self._run_state(changes)
+            if columns or state:
+                rows.append((project_id, columns, state))
+        if not rows:
+            return
+        with self._lock, self._conn.transaction():
+            for project_id, columns, state in rows:
+                assignments = "".join(f"{column} = %s, " for column in columns)
+                self._conn.execute(
+                    f"UPDATE projects SET {assignments}run_state = run_state || %s, updated_at = now() WHERE id = %s",
+                    (*columns.values(), Jsonb(state), project_id),
+                )
+
+    def claim_run(self, project_id: str, owner: str, lease: float) -> bool:
+        self.flush()
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                """
+                UPDATE projects
+                SET run_state = run_state || jsonb_build_object('run_owner', %s::text, 'run_heartbeat', %s::float8),
+                    updated_at = now()
+                WHERE id = %s AND status = ANY(%s) AND (
+                    coalesce(run_state->>'run_owner', %s) = %s
+                    OR coalesce((run_state->>'run_heartbeat')::float8, 0) < %s
+                )
+                RETURNING id
+                """,
+                (owner, now, project_id, sorted(ACTIVE_STATUSES), owner, owner, now - lease),
+            ).fetchone()
+        return row is not None
+
+    def append_events(self, project_id: str, start: int, events: list[str]) -> None:
+        with self._lock, self._conn.transaction(), self._conn.cursor() as cur:
+            cur.executemany(
+                "INSERT INTO project_events (project_id, seq, event) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
+                [(project_id, seq, event) for seq, event in enumerate(events, start + 1)],
+            )
+
+    def load_events(self, project_id: str, after: int = 0) -> list[str] | None:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT event FROM project_events WHERE project_id = %s AND seq > %s ORDER BY seq", (project_id, after)
+            ).fetchall()
+        return [row[0] for row in rows] or None
+
+    def list(self, status: str | None = None, limit: int = 100) -> list[dict]:
+        self.flush()
+        query = "SELECT id FROM projects"
+        params: tuple = ()
+        if status:
+            query += " WHERE status = %s"
+            params = (status,)
+        query += " ORDER BY created_at DESC LIMIT %s"
+        with self._lock:
+            ids = [row[0] for row in self._conn.execute(query, (*params, limit)).fetchall()]
+        return [p for p in map(self._select, ids) if p is not None]
+
+    def close(self) -> None:
+        super().close()
+        with self._lock:
+            self._conn.close()
+
+
+def create_project_store(url: str = PROJECT_STORE_URL) -> ProjectStoreBackend:
+    """Build the project store configured by ``url``."""
+    if url.startswith("sqlite:///"):
+        return SQLiteProjectStore(url.removeprefix("sqlite:///"))
+    if url.startswith(("postgres://", "postgresql://")):
+        return PostgresProjectStore(url)
+    if url.startswith("memory://"):
+        return MemoryProjectStore()
+    raise ValueError(f"Unsupported PROJECT_STORE_URL: {url}")
+
+
+project_store = create_project_store()
@@ -1,27 +1,113 @@
+import functools
+import importlib
+import inspect
 import os
-from typing import TypedDict
+import threading
+import time
+from collections.abc import Mapping
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, TypedDict
 
 from cuid2 import cuid_wrapper
 
-try:
-    import weave
-    if os.getenv("WEAVE_PROJECT"):
-        weave.init(os.getenv("WEAVE_PROJECT"))
-        WEAVE_ENABLED = True
-    else:
-        WEAVE_ENABLED = False
-except ImportError:
-    WEAVE_ENABLED = False
-    weave = None
+WEAVE_PROJECT = os.getenv("WEAVE_PROJECT")
 
 cuid = cuid_wrapper()
 
+_weave = None
+_weave_lock = threading.Lock()
+
+
+def _get_weave():
+    """Import and initialize weave on first use; returns None if it is unavailable."""
+    global _weave
+    with _weave_lock:
+        if _weave is None:
+            try:
+                import weave
+
+                weave.init(WEAVE_PROJECT)
+                _weave = weave
+            except ImportError:
+                _weave = False
+    return _weave or None
+
 
 def weave_op(func):
-    """Decorator that applies weave.op() if Weave is enabled."""
-    if WEAVE_ENABLED and weave:
-        return weave.op()(func)
-    return func
+    """Decorator that traces ``func`` with weave.op() if Weave is enabled.
+
+    weave (and wandb behind it) is slow to import, so it is only imported on
+    the first call of a decorated function, and not at all when
+    ``WEAVE_PROJECT`` is unset.
+    """
+    if not WEAVE_PROJECT:
+        return func
+    traced: Callable | None = None
+
+    def resolve() -> Callable:
+        nonlocal traced
+        if traced is None:
+            weave = _get_weave()
+            traced = weave.op()(func) if weave else func
+        return traced
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            return await resolve()(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return resolve()(*args, **kwargs)
+    return wrapper
+
+
+def instrumented(func):
+    """Decorator recording a tool check's duration and result status in :mod:`src.metrics`.
+
+    The tool is named after the module ``func`` is defined in. A check that
+    raises is counted with status ``error``.
+    """
+    from src.metrics import record_tool
+
+    tool = func.__module__.rsplit(".", 1)[-1]
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            status = "error"
+            try:
+                result = await func(*args, **kwargs)
+                status = str(result.get("status", "unknown"))
+                return result
+            finally:
+                record_tool(tool, time.perf_counter() - started, status)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        status = "error"
+        try:
+            result = func(*args, **kwargs)
+            status = str(result.get("status", "unknown"))
+            return result
+        finally:
+            record_tool(tool, time.perf_counter() - started, status)
+    return wrapper
+
+
+# Set by whoever runs a check and wants its partial results (see ToolScheduler.as_completed).
+progress_sink: ContextVar[Callable[[dict], None] | None] = ContextVar("progress_sink", default=None)
+
+
+def report_progress(partial: dict) -> None:
+    """Publish a partial result from inside a running check; a no-op unless someone is listening."""
+    sink = progress_sink.get()
+    if sink is not None:
+        sink(partial)
 
 
 class ToolInfo(TypedDict):
@@ -136,47 +222,56 @@ TOOL_REGISTRY: dict[str, ToolInfo] = {
     },
 }
 
-from . import (
-    adverse_media,
-    business_registry,
-    court_records,
-    corporate_filings,
-    crypto_trace,
-    domain_whois,
-    education_verify,
-    email_lookup,
-    employment_verify,
-    geo_risk,
-    ip_geolocation,
-    pep_check,
-    phone_lookup,
-    property_records,
-    sanctions,
-    social_media,
-    ubo_lookup,
-)
-
-TOOLS = {
-    "sanctions": sanctions.check,
-    "adverse_media": adverse_media.check,
-    "business_registry": business_registry.check,
-    "pep_check": pep_check.check,
-    "geo_risk": geo_risk.check,
-    "ubo_lookup": ubo_lookup.check,
-    "employment_verify": employment_verify.check,
-    "education_verify": education_verify.check,
-    "court_records": court_records.check,
-    "property_records": property_records.check,
-    "corporate_filings": corporate_filings.check,
-    "phone_lookup": phone_lookup.check,
-    "email_lookup": email_lookup.check,
-    "social_media": social_media.check,
-    "domain_whois": domain_whois.check,
-    "ip_geolocation": ip_geolocation.check,
-    "crypto_trace": crypto_trace.check,
-}
+
+class _LazyToolMap(Mapping):
+    """``{tool_key: callable}`` that imports each tool module on first access."""
+
+    def __init__(self, attr: str, wrap: Callable[[str, Callable[..., Any]], Callable[..., Any]] | None = None):
+        self._attr = attr
+        self._wrap = wrap
+        self._resolved: dict[str, Callable[..., Any]] = {}
+
+    def __getitem__(self, key: str) -> Callable[..., Any]:
+        try:
+            return self._resolved[key]
+        except KeyError:
+            if key not in TOOL_REGISTRY:
+                raise
+        func = getattr(importlib.import_module(f".{key}", __name__), self._attr)
+        if self._wrap is not None:
+            func = self._wrap(key, func)
+        self._resolved[key] = func
+        return func
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(TOOL_REGISTRY)
+
+    def __len__(self) -> int:
+        return len(TOOL_REGISTRY)
+
+    def __contains__(self, key: object) -> bool:
+        return key in TOOL_REGISTRY
+
+
+def _cached(key: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    from .cache import cached
+
+    return cached(key, func)
+
+
+# Async checks are cached by the scheduler that runs them.
+TOOLS = _LazyToolMap("check", wrap=_cached)
+ATOOLS = _LazyToolMap("acheck")
+
+
+def __getattr__(name: str):
+    if name in TOOL_REGISTRY:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
+    "ATOOLS",
     "TOOLS",
     "TOOL_REGISTRY",
     "sanctions",
@@ -1,80 +1,116 @@
 #!/usr/bin/env python3
 """Adverse media screening via news search."""
 
+import asyncio
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-import httpx
-
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid, report_progress, http_client
+from .media import screen
+from .media.sources import GDELT_DOC_API  # noqa: F401  (kept importable from the tool module)
 
 TOOL_ID = "adverse_media"
 
+# Highest-scoring articles kept in a result; the counts cover everything screened.
+MAX_FINDINGS = int(os.getenv("MEDIA_MAX_FINDINGS", "25"))
+
+SOURCES = ["GDELT Project", "Google News"]
+
 
 @weave_op
+@instrumented
 def check(entity: str, **opts) -> dict[str, Any]:
-    """Search news sources for adverse media about entity."""
+    """Search news sources for adverse media about entity.
+
+    Runs the screen on its own event loop, in a worker thread when called
+    from code that already has one running.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_screen_and_close(entity))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, _screen_and_close(entity)).result()
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, **opts) -> dict[str, Any]:
+    """Search news sources for adverse media about entity without blocking the event loop.
+
+    Findings are published with :func:`~src.tools.report_progress` as each
+    source answers, so callers that listen see them before the check ends.
+    """
+    return await _screen(entity)
+
+
+async def _screen_and_close(entity: str) -> dict[str, Any]:
+    """:func:`_screen` on a throwaway loop, closing the HTTP client opened for that loop."""
+    try:
+        return await _screen(entity)
+    finally:
+        await http_client.aclose_async_client()
+
+
+async def _screen(entity: str) -> dict[str, Any]:
     result_id = cuid()
+    findings: list[dict] = []
+    errors: dict[str, str] = {}
+    fetched = 0
+    print(f"[{TOOL_ID}] Checking: {entity}", file=sys.stderr)
+
+    async for update in screen(entity):
+        if update["error"]:
+            errors[update["fetch"]] = update["error"]
+        else:
+            fetched += 1
+        findings.extend(update["findings"])
+        if update["findings"] and update["done"] < update["total"]:
+            report_progress({
+                **_build_result(result_id, entity, findings, errors, fetched),
+                "status": "running",
+                "progress": round(100 * update["done"] / update["total"]),
+            })
 
-    findings = []
-    findings.extend(_search_gdelt(entity))
+    print(f"[{TOOL_ID}] Screened {len(findings)} articles, {len(errors)} fetches failed", file=sys.stderr)
+    return _build_result(result_id, entity, findings, errors, fetched)
 
-    if not findings:
-        return {
-            "id": result_id,
-            "tool": TOOL_ID,
-            "entity": entity,
-            "status": "clear",
-            "confidence": 85,
-            "findings": [],
-            "sources": ["GDELT Project", "News APIs"],
-        }
 
-    has_adverse = any(f.get("sentiment") == "negative" for f in findings)
+def _ranked(findings: list[dict]) -> list[dict]:
+    return sorted(findings, key=lambda f: (-f["score"], -f["syndicated"]))[:MAX_FINDINGS]
 
-    return {
+
+def _build_result(result_id: str, entity: str, findings: list[dict], errors: dict[str, str], fetched: int) -> dict:
+    negative = [f for f in findings if f["sentiment"] == "negative"]
+    result = {
         "id": result_id,
         "tool": TOOL_ID,
         "entity": entity,
-        "status": "alert" if has_adverse else "clear",
-        "confidence": 80,
-        "findings": findings,
-        "sources": ["GDELT Project"],
+        "findings": _ranked(findings),
+        "sources": SOURCES,
+        "articles_screened": len(findings),
+        "negative_articles": len(negative),
     }
+    if errors:
+        result["failed_fetches"] = errors
 
-
-def _search_gdelt(entity: str) -> list[dict]:
-    """Search GDELT for news mentions."""
-    try:
-        query = entity.replace(" ", "%20")
-        r = httpx.get(
-            f"https://api.gdeltproject.org/api/v2/doc/doc?query={query}&mode=artlist&format=json&maxrecords=5",
-            timeout=30,
-        )
-        r.raise_for_status()
-        data = r.json()
-
-        articles = data.get("articles", [])
-        results = []
-        for a in articles[:5]:
-            tone = a.get("tone", 0)
-            results.append({
-                "title": a.get("title", ""),
-                "source": a.get("domain", ""),
-                "date": a.get("seendate", "")[:10],
-                "url": a.get("url", ""),
-                "sentiment": "negative" if tone < -3 else "neutral" if tone < 3 else "positive",
-                "tone": round(tone, 1),
-            })
-        return results
-    except Exception:
-        return []
+    if not fetched:
+        # Nothing answered: unknown, not clear (and never cached).
+        return {**result, "status": "error", "confidence": 0}
+    if negative:
+        # More distinct negative stories and wider syndication mean a better-founded alert.
+        reach = len(negative) + sum(f["syndicated"] for f in negative)
+        return {**result, "status": "alert", "confidence": min(95, 60 + 5 * reach)}
+    return {**result, "status": "clear", "confidence": 85 if not errors else 70}
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.adverse_media 'Entity'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
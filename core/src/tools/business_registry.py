@@ -6,19 +6,51 @@ import os
 import sys
 from typing import Any
 
-import httpx
-
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid, resilience
 
 TOOL_ID = "business_registry"
 
+OPENCORPORATES_SEARCH_API = "https://api.opencorporates.com/v0.4/companies/search"
+UPSTREAM = "opencorporates"
+
 
 @weave_op
+@instrumented
 def check(entity: str, jurisdiction: str = "") -> dict[str, Any]:
     """Search business registries for company information."""
-    result_id = cuid()
+    try:
+        return _build_result(entity, _search_opencorporates(entity, jurisdiction))
+    except Exception as e:
+        return _error_result(entity, e)
 
-    findings = _search_opencorporates(entity, jurisdiction)
+
+@weave_op
+@instrumented
+async def acheck(entity: str, jurisdiction: str = "") -> dict[str, Any]:
+    """Search business registries for company information without blocking the event loop."""
+    try:
+        return _build_result(entity, await _asearch_opencorporates(entity, jurisdiction))
+    except Exception as e:
+        return _error_result(entity, e)
+
+
+def _error_result(entity: str, error: Exception) -> dict[str, Any]:
+    """The registry could not be searched; that is not the same as the company not existing."""
+    print(f"[{TOOL_ID}] Search failed: {error}", file=sys.stderr)
+    return {
+        "id": cuid(),
+        "tool": TOOL_ID,
+        "entity": entity,
+        "status": "error",
+        "confidence": 0,
+        "findings": [],
+        "sources": ["OpenCorporates"],
+        "error": f"{type(error).__name__}: {error}"[:200],
+    }
+
+
+def _build_result(entity: str, findings: list[dict]) -> dict[str, Any]:
+    result_id = cuid()
 
     if not findings:
         return {
@@ -42,41 +74,48 @@ def check(entity: str, jurisdiction: str = "") -> dict[str, Any]:
     }
 
 
+def _opencorporates_params(entity: str, jurisdiction: str = "") -> dict[str, str]:
+    params = {"q": entity, "format": "json"}
+    if jurisdiction:
+        params["jurisdiction_code"] = jurisdiction
+    return params
+
+
+def _parse_opencorporates(data: dict) -> list[dict]:
+    companies = data.get("results", {}).get("companies", [])
+    results = []
+    for c in companies[:5]:
+        co = c.get("company", {})
+        results.append({
+            "name": co.get("name", ""),
+            "jurisdiction": co.get("jurisdiction_code", ""),
+            "company_number": co.get("company_number", ""),
+            "status": co.get("current_status", ""),
+            "incorporation_date": co.get("incorporation_date", ""),
+            "address": co.get("registered_address_in_full", ""),
+            "opencorporates_url": co.get("opencorporates_url", ""),
+        })
+    return results
+
+
 def _search_opencorporates(entity: str, jurisdiction: str = "") -> list[dict]:
     """Search OpenCorporates API."""
-    try:
-        params = {"q": entity, "format": "json"}
-        if jurisdiction:
-            params["jurisdiction_code"] = jurisdiction
-
-        r = httpx.get(
-            "https://api.opencorporates.com/v0.4/companies/search",
-            params=params,
-            timeout=30,
-        )
-        r.raise_for_status()
-        data = r.json()
-
-        companies = data.get("results", {}).get("companies", [])
-        results = []
-        for c in companies[:5]:
-            co = c.get("company", {})
-            results.append({
-                "name": co.get("name", ""),
-                "jurisdiction": co.get("jurisdiction_code", ""),
-                "company_number": co.get("company_number", ""),
-                "status": co.get("current_status", ""),
-                "incorporation_date": co.get("incorporation_date", ""),
-                "address": co.get("registered_address_in_full", ""),
-                "opencorporates_url": co.get("opencorporates_url", ""),
-            })
-        return results
-    except Exception:
-        return []
+    params = _opencorporates_params(entity, jurisdiction)
+    r = resilience.get(UPSTREAM, OPENCORPORATES_SEARCH_API, params=params)
+    return _parse_opencorporates(r.json())
+
+
+async def _asearch_opencorporates(entity: str, jurisdiction: str = "") -> list[dict]:
+    """Search OpenCorporates API (async)."""
+    params = _opencorporates_params(entity, jurisdiction)
+    r = await resilience.aget(UPSTREAM, OPENCORPORATES_SEARCH_API, params=params)
+    return _parse_opencorporates(r.json())
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.business_registry 'Company Name'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else ""), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else ""), indent=2))
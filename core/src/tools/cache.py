@@ -0,0 +1,263 @@
+"""Tiered result cache for tool lookups.
+
+Results are keyed by tool id plus the normalized entity and options, and live
+in a bounded in-memory LRU backed by an optional on-disk ``diskcache`` tier
+that is shared by every worker on the host. Every execution mode goes
+through it: the scheduler (direct and batch runs) via :meth:`ToolCache.acall`,
+and ``TOOLS`` plus the per-tool command-line entry points the agent runs via
+:func:`cached`.
+
+Tools listed in ``STALE_TTLS`` keep entries past their TTL for a stale
+window (``SCOLO_CACHE_STALE_TTL``). In that window an async lookup returns
+the old result flagged ``stale: true`` at once and refreshes it in the
+background; a sync lookup refreshes first and falls back to the stale result
+only if the refresh fails. Other tools, such as sanctions and PEP screening,
+never serve a result past its TTL.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENABLED = os.getenv("SCOLO_CACHE", "1") != "0"
+CACHE_DIR = os.getenv("SCOLO_CACHE_DIR", os.path.join(tempfile.gettempdir(), "scolo-tool-cache"))
+MEMORY_MAX_ENTRIES = int(os.getenv("SCOLO_CACHE_MAX_ENTRIES", "10000"))
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+DEFAULT_TTL = DAY
+
+TOOL_TTLS: dict[str, float] = {
+    "sanctions": DAY,
+    "pep_check": DAY,
+    "adverse_media": 6 * HOUR,
+    "business_registry": DAY,
+    "geo_risk": 30 * DAY,
+    "domain_whois": 7 * DAY,
+    "ip_geolocation": 7 * DAY,
+    "crypto_trace": HOUR,
+}
+
+STALE_TTL = float(os.getenv("SCOLO_CACHE_STALE_TTL", str(DAY)))
+
+# Tools whose results may be served stale while they refresh. Screening
+# verdicts (sanctions, PEP, wallet risk) are left out: they must be current.
+STALE_TTLS: dict[str, float] = {
+    "adverse_media": STALE_TTL,
+    "business_registry": STALE_TTL,
+    "geo_risk": STALE_TTL,
+    "domain_whois": STALE_TTL,
+    "ip_geolocation": STALE_TTL,
+}
+
+# Identifiers whose case carries meaning (base58 wallet addresses).
+CASE_SENSITIVE_TOOLS = frozenset({"crypto_trace"})
+
+UNCACHEABLE_STATUSES = frozenset({"error"})
+
+
+def normalize_entity(tool_key: str, entity: str) -> str:
+    """Normalize an entity so trivially different spellings share a cache entry."""
+    text = " ".join(unicodedata.normalize("NFKC", entity).split())
+    return text if tool_key in CASE_SENSITIVE_TOOLS else text.casefold()
+
+
+def cache_key(tool_key: str, args: tuple, kwargs: dict) -> str:
+    entity, *rest = args or ("",)
+    payload = json.dumps([normalize_entity(tool_key, str(entity)), rest, sorted(kwargs.items())], default=str)
+    return f"{tool_key}:{hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()}"
+
+
+class MemoryLRU:
+    """Thread-safe LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = MEMORY_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[float, dict] | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, stored_at, value = entry
+            if expires_at < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return stored_at, value
+
+    def set(self, key: str, value: dict, ttl: float, stored_at: float | None = None) -> None:
+        stored_at = stored_at or time.time()
+        with self._lock:
+            self._data[key] = (stored_at + ttl, stored_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ToolCache:
+    """Two-tier (memory, disk) cache around tool ``check()`` calls."""
+
+    def __init__(
+        self,
+        directory: str | None = CACHE_DIR,
+        max_entries: int = MEMORY_MAX_ENTRIES,
+        stale_ttls: dict[str, float] | None = None,
+    ):
+        self.memory = MemoryLRU(max_entries)
+        self.disk = diskcache.Cache(directory) if (diskcache and directory) else None
+        self.stale_ttls = STALE_TTLS if stale_ttls is None else stale_ttls
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    def ttl_for(self, tool_key: str) -> float:
+        return TOOL_TTLS.get(tool_key, DEFAULT_TTL)
+
+    def stale_ttl_for(self, tool_key: str) -> float:
+        return self.stale_ttls.get(tool_key, 0.0)
+
+    def lookup(self, tool_key: str, args: tuple, kwargs: dict) -> tuple[dict | None, dict]:
+        """Return ``(result, cache_info)``; ``result`` is None on a miss.
+
+        A result past its TTL but within the stale window comes back with
+        ``cache_info["stale"]`` set.
+        """
+        key = cache_key(tool_key, args, kwargs)
+        entry = self.memory.get(key)
+        tier = "memory"
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(key)
+            tier = "disk"
+            if entry is not None:
+                stored_at, value = entry
+                remaining = stored_at + self.ttl_for(tool_key) + self.stale_ttl_for(tool_key) - time.time()
+                if remaining > 0:
+                    self.memory.set(key, value, remaining, stored_at=stored_at)
+
+        if entry is None:
+            self.misses += 1
+            return None, {"hit": False}
+
+        stored_at, value = entry
+        age = time.time() - stored_at
+        info = {"hit": True, "tier": tier, "age": round(age, 3)}
+        if age >= self.ttl_for(tool_key):
+            self.stale_hits += 1
+            info["stale"] = True
+        else:
+            self.hits += 1
+        return dict(value), info
+
+    def store(self, tool_key: str, args: tuple, kwargs: dict, result: dict) -> None:
+        if result.get("status") in UNCACHEABLE_STATUSES or result.get("stale"):
+            return
+        key = cache_key(tool_key, args, kwargs)
+        ttl = self.ttl_for(tool_key) + self.stale_ttl_for(tool_key)
+        stored_at = time.time()
+        value = {k: v for k, v in result.items() if k != "cache"}
+        self.memory.set(key, value, ttl, stored_at=stored_at)
+        if self.disk is not None:
+            self.disk.set(key, (stored_at, value), expire=ttl)
+
+    def call(self, tool_key: str, func: Callable[..., dict], *args: Any, **kwargs: Any) -> dict:
+        """Call a sync tool through the cache, tagging the result with ``cache`` info."""
+        cached, info = self.lookup(tool_key, args, kwargs)
+        if cached is not None and not info.get("stale"):
+            return {**cached, "cache": info}
+        result = func(*args, **kwargs)
+        if cached is not None and result.get("status") in UNCACHEABLE_STATUSES:
+            return {**cached, "stale": True, "cache": info}
+        self.store(tool_key, args, kwargs, result)
+        return {**result, "cache": {"hit": False, "revalidated": True} if cached is not None else info}
+
+    async def acall(self, tool_key: str, func: Callable[..., Awaitable[dict]], *args: Any, **kwargs: Any) -> dict:
+        """Async variant of :meth:`call`; disk-tier I/O runs off the event loop."""
+        if self.disk is None:
+            result, info = self.lookup(tool_key, args, kwargs)
+        else:
+            result, info = await asyncio.to_thread(self.lookup, tool_key, args, kwargs)
+        if result is None:
+            result = await func(*args, **kwargs)
+            await self._astore(tool_key, args, kwargs, result)
+        elif info.get("stale"):
+            self._revalidate(tool_key, func, args, kwargs)
+            result = {**result, "stale": True}
+        return {**result, "cache": info}
+
+    async def _astore(self, tool_key: str, args: tuple, kwargs: dict, result: dict) -> None:
+        if self.disk is None:
+            self.store(tool_key, args, kwargs, result)
+        else:
+            await asyncio.to_thread(self.store, tool_key, args, kwargs, result)
+
+    def _revalidate(self, tool_key: str, func: Callable[..., Awaitable[dict]], args: tuple, kwargs: dict) -> None:
+        """Refresh a stale entry in the background, at most once at a time per key."""
+        key = cache_key(tool_key, args, kwargs)
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._astore(tool_key, args, kwargs, await func(*args, **kwargs))
+            except Exception:
+                logger.warning("Background refresh of %s failed; keeping the stale entry", tool_key, exc_info=True)
+
+        task = self._refreshing[key] = asyncio.create_task(refresh())
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fresh hits over all lookups; stale hits count as neither."""
+        total = self.hits + self.misses + self.stale_hits
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+tool_cache = ToolCache() if CACHE_ENABLED else None
+
+
+def cached(tool_key: str, func: Callable[..., dict]) -> Callable[..., dict]:
+    """Wrap a sync tool ``check`` so it goes through :data:`tool_cache`.
+
+    Used for ``TOOLS`` and the ``python -m src.tools.<tool>`` entry points the
+    agent runs; each of those is a new process, so only the disk tier helps there.
+    """
+    if tool_cache is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> dict:
+        return tool_cache.call(tool_key, func, *args, **kwargs)
+    return wrapper
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Corporate filings search (SEC, state filings)."""
 
+import asyncio
 import json
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
 
 TOOL_ID = "corporate_filings"
+SIMULATED_LATENCY = 0.5
 
 SIMULATED_FILINGS = {
     "global ventures": [
@@ -68,11 +70,24 @@ def normalize(name: str) -> str:
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "Company") -> dict[str, Any]:
     """Search corporate filings for a company."""
+    time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "Company") -> dict[str, Any]:
+    """Search corporate filings for a company without blocking the event loop."""
+    await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "Company") -> dict[str, Any]:
     result_id = cuid()
     print(f"[{TOOL_ID}] Searching corporate filings for: {entity}", file=sys.stderr)
-    time.sleep(0.5)
 
     normalized = normalize(entity)
     findings = []
@@ -117,7 +132,9 @@ def check(entity: str, entity_type: str = "Company") -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.corporate_filings 'Company Name'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
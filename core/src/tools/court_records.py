@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Court records search."""
 
+import asyncio
 import json
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
 
 TOOL_ID = "court_records"
+SIMULATED_LATENCY = 0.6
 
 SIMULATED_CASES = {
     "john smith": [
@@ -61,11 +63,24 @@ def normalize(name: str) -> str:
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "Person") -> dict[str, Any]:
     """Search court records for an entity."""
+    time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "Person") -> dict[str, Any]:
+    """Search court records for an entity without blocking the event loop."""
+    await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "Person") -> dict[str, Any]:
     result_id = cuid()
     print(f"[{TOOL_ID}] Searching court records for: {entity}", file=sys.stderr)
-    time.sleep(0.6)
 
     normalized = normalize(entity)
     findings = []
@@ -110,7 +125,9 @@ def check(entity: str, entity_type: str = "Person") -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.court_records 'Entity Name'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Cryptocurrency wallet tracing."""
 
+import asyncio
 import json
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
 
 TOOL_ID = "crypto_trace"
+SIMULATED_LATENCY = 0.5
 
 SIMULATED_WALLETS = {
     "1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2": {
@@ -65,12 +67,25 @@ def normalize(address: str) -> str:
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "Crypto") -> dict[str, Any]:
     """Trace cryptocurrency wallet activity."""
+    time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "Crypto") -> dict[str, Any]:
+    """Trace cryptocurrency wallet activity without blocking the event loop."""
+    await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "Crypto") -> dict[str, Any]:
     result_id = cuid()
     normalized = normalize(entity)
     print(f"[{TOOL_ID}] Tracing wallet: {normalized[:20]}...", file=sys.stderr)
-    time.sleep(0.5)
 
     wallet_data = SIMULATED_WALLETS.get(normalized)
     findings = [wallet_data] if wallet_data else []
@@ -113,7 +128,9 @@ def check(entity: str, entity_type: str = "Crypto") -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.crypto_trace 'wallet_address'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Domain WHOIS lookup."""
 
+import asyncio
 import json
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
 
 TOOL_ID = "domain_whois"
+SIMULATED_LATENCY = 0.4
 
 SIMULATED_DOMAINS = {
     "example.com": {
@@ -57,12 +59,25 @@ def normalize(domain: str) -> str:
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "Domain") -> dict[str, Any]:
     """Lookup domain WHOIS information."""
+    time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "Domain") -> dict[str, Any]:
+    """Lookup domain WHOIS information without blocking the event loop."""
+    await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "Domain") -> dict[str, Any]:
     result_id = cuid()
     normalized = normalize(entity)
     print(f"[{TOOL_ID}] Looking up WHOIS for: {normalized}", file=sys.stderr)
-    time.sleep(0.4)
 
     domain_data = SIMULATED_DOMAINS.get(normalized)
     findings = [domain_data] if domain_data else []
@@ -102,7 +117,9 @@ def check(entity: str, entity_type: str = "Domain") -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.domain_whois 'example.com'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
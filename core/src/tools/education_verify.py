@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Education credentials verification."""
 
+import asyncio
 import json
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
 
 TOOL_ID = "education_verify"
+SIMULATED_LATENCY = 0.4
 
 SIMULATED_EDUCATION = {
     "john smith": [
@@ -30,11 +32,24 @@ def normalize(name: str) -> str:
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "Person") -> dict[str, Any]:
     """Verify education credentials for an individual."""
+    time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "Person") -> dict[str, Any]:
+    """Verify education credentials for an individual without blocking the event loop."""
+    await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "Person") -> dict[str, Any]:
     result_id = cuid()
     print(f"[{TOOL_ID}] Verifying education for: {entity}", file=sys.stderr)
-    time.sleep(0.4)
 
     normalized = normalize(entity)
     findings = []
@@ -73,7 +88,9 @@ def check(entity: str, entity_type: str = "Person") -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.education_verify 'Person Name'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
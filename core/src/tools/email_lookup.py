@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Email address lookup and validation."""
 
+import asyncio
 import json
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
 
 TOOL_ID = "email_lookup"
+SIMULATED_LATENCY = 0.3
 
 SIMULATED_EMAILS = {
     "john.smith@gmail.com": {
@@ -59,11 +61,24 @@ def normalize(email: str) -> str:
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "Email") -> dict[str, Any]:
     """Lookup email address details."""
+    time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "Email") -> dict[str, Any]:
+    """Lookup email address details without blocking the event loop."""
+    await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "Email") -> dict[str, Any]:
     result_id = cuid()
     print(f"[{TOOL_ID}] Looking up email: {entity}", file=sys.stderr)
-    time.sleep(0.3)
 
     normalized = normalize(entity)
     email_data = SIMULATED_EMAILS.get(normalized)
@@ -106,7 +121,9 @@ def check(entity: str, entity_type: str = "Email") -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.email_lookup 'email@example.com'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
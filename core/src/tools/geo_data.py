@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""ISO-3166 country dataset and the compiled lookup index behind geo_risk.
+
+The source of truth is ``data/countries.csv``: every ISO-3166-1 country with
+its alpha-2, alpha-3 and numeric codes, English and local names, FATF status,
+CPI score and resulting risk level. ``python -m src.tools.geo_data`` compiles
+it into ``data/countries.index.json``, which maps every code and normalized
+name straight to a row. The Docker build runs that step; without a compiled
+index (or with one built from a different CSV) the index is compiled in
+memory on first use.
+
+Names are normalized so spelling variants collapse to one key: case, accents,
+punctuation, "St."/"Saint", word order ("Korea, Republic of") and filler
+words ("the", "of", "and"). When that exact key is unknown, a looser key
+without form-of-government words ("Islamic Republic of Iran" -> "iran") is
+tried, but only if it identifies a single country.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+from .matching import normalize_name
+
+DATA_DIR = Path(__file__).parent / "data"
+DEFAULT_SOURCE = DATA_DIR / "countries.csv"
+DEFAULT_COMPILED = DATA_DIR / "countries.index.json"
+
+FIELDS = ("alpha2", "alpha3", "numeric", "name", "fatf", "cpi", "risk")
+
+STOPWORDS = frozenset({"the", "of", "and"})
+SYNONYMS = {"st": "saint", "ste": "sainte"}
+# Dropped for the loose key only; "Plurinational State of Bolivia" -> "bolivia".
+FORM_WORDS = frozenset({
+    "republic", "islamic", "democratic", "peoples", "federal", "federation", "federated", "plurinational",
+    "bolivarian", "socialist", "kingdom", "state", "principality", "grand", "duchy", "sultanate", "commonwealth",
+})
+
+ABBREVIATION_DOTS = re.compile(r"\b(\w)\.(?=\w\b|\s|$)")
+APOSTROPHES = re.compile(r"['’`]")
+
+
+def normalize_country(text: str) -> str:
+    """Order-insensitive key for a country name: ``"Korea, Republic of"`` -> ``"korea republic"``."""
+    text = APOSTROPHES.sub("", ABBREVIATION_DOTS.sub(r"\1", text.replace("&", " and ")))
+    tokens = (SYNONYMS.get(t, t) for t in normalize_name(text).split())
+    return " ".join(sorted(t for t in tokens if t not in STOPWORDS))
+
+
+def loose_key(key: str) -> str:
+    return " ".join(t for t in key.split() if t not in FORM_WORDS)
+
+
+def read_dataset(path: Path | str = DEFAULT_SOURCE) -> tuple[str, list[dict[str, Any]]]:
+    """Return ``(version, rows)`` from a countries CSV; ``#`` lines are comments."""
+    version = "unversioned"
+    lines = []
+    with open(path, encoding="utf-8", newline="") as f:
+        for line in f:
+            if line.startswith("#"):
+                if line[1:].strip().startswith("version:"):
+                    version = line.split(":", 1)[1].strip()
+                continue
+            lines.append(line)
+
+    rows = []
+    for row in csv.DictReader(lines):
+        rows.append({
+            "alpha2": row["alpha2"].strip().upper(),
+            "alpha3": row["alpha3"].strip().upper(),
+            "numeric": row["numeric"].strip(),
+            "name": row["name"].strip(),
+            "aliases": [a.strip() for a in (row.get("aliases") or "").split(";") if a.strip()],
+            "fatf": row["fatf"].strip() or "compliant",
+            "cpi": int(row["cpi"]) if row["cpi"].strip() else None,
+            "risk": row["risk"].strip(),
+        })
+    return version, rows
+
+
+def compile_dataset(path: Path | str = DEFAULT_SOURCE) -> dict[str, Any]:
+    """Build the compact lookup structure for a countries CSV."""
+    version, rows = read_dataset(path)
+    codes: dict[str, int] = {}
+    names: dict[str, int] = {}
+    loose: dict[str, int] = {}
+    for i, row in enumerate(rows):
+        codes[row["alpha2"].lower()] = codes[row["alpha3"].lower()] = i
+        if row["numeric"]:
+            codes[str(int(row["numeric"]))] = i
+        for name in (row["name"], *row["aliases"]):
+            key = normalize_country(name)
+            if not key:
+                continue
+            if names.setdefault(key, i) != i:
+                raise ValueError(f"{name!r} is listed for both {rows[names[key]]['alpha2']} and {row['alpha2']}")
+            short = loose_key(key)
+            if short and short != key:
+                # -1 marks a loose key shared by several countries ("korea").
+                loose[short] = i if loose.get(short, i) == i else -1
+
+    loose = {k: i for k, i in loose.items() if i >= 0 and k not in names}
+    return {
+        "version": version,
+        "source_sha256": _sha256(path),
+        "fields": list(FIELDS),
+        "countries": [[row[field] for field in FIELDS] for row in rows],
+        "codes": codes,
+        "names": names,
+        "loose": loose,
+    }
+
+
+class CountryIndex:
+    """Resolves codes and free-text country names to dataset rows."""
+
+    def __init__(self, compiled: dict[str, Any]):
+        self.version: str = compiled["version"]
+        fields = compiled["fields"]
+        self._countries = [dict(zip(fields, row)) for row in compiled["countries"]]
+        self._codes: dict[str, int] = compiled["codes"]
+        self._names: dict[str, int] = compiled["names"]
+        self._loose: dict[str, int] = compiled["loose"]
+
+    @classmethod
+    def load(
+        cls, source: Path | str = DEFAULT_SOURCE, compiled: Path | str | None = DEFAULT_COMPILED
+    ) -> "CountryIndex":
+        """Use the compiled index if it was built from ``source``, else compile in memory."""
+        if compiled is not None and Path(compiled).exists():
+            data = json.loads(Path(compiled).read_text(encoding="utf-8"))
+            if data.get("source_sha256") == _sha256(source):
+                return cls(data)
+        return cls(compile_dataset(source))
+
+    def __len__(self) -> int:
+        return len(self._countries)
+
+    def lookup(self, country: str) -> dict[str, Any] | None:
+        """Return the dataset row for a code or name, or None if unknown or ambiguous."""
+        text = country.strip()
+        if not text:
+            return None
+        if text.isdigit():
+            index = self._codes.get(str(int(text)))
+        else:
+            code = text.replace(".", "").casefold()
+            index = self._codes.get(code) if len(code) in (2, 3) and code.isalpha() else None
+        if index is None:
+            key = normalize_country(text)
+            index = self._names.get(key)
+            if index is None:
+                index = self._loose.get(loose_key(key))
+        return None if index is None else self._countries[index]
+
+
+def _sha256(path: Path | str) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile the geo_risk country index")
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE)
+    parser.add_argument("--output", type=Path, default=DEFAULT_COMPILED)
+    args = parser.parse_args()
+
+    compiled = compile_dataset(args.source)
+    args.output.write_text(json.dumps(compiled, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    print(f"Compiled {len(compiled['countries'])} countries, {len(compiled['names'])} names "
+          f"(version {compiled['version']}) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
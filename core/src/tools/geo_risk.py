@@ -4,87 +4,106 @@
 import json
 import os
 import sys
-from typing import Any
+from typing import Any, Iterable
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
+from .geo_data import CountryIndex
 
 TOOL_ID = "geo_risk"
 
-COUNTRY_RISK = {
-    "af": {"name": "Afghanistan", "fatf": "black", "cpi": 16, "risk": "critical"},
-    "ir": {"name": "Iran", "fatf": "black", "cpi": 24, "risk": "critical"},
-    "kp": {"name": "North Korea", "fatf": "black", "cpi": 17, "risk": "critical"},
-    "mm": {"name": "Myanmar", "fatf": "grey", "cpi": 23, "risk": "high"},
-    "sy": {"name": "Syria", "fatf": "black", "cpi": 13, "risk": "critical"},
-    "ru": {"name": "Russia", "fatf": "grey", "cpi": 26, "risk": "high"},
-    "by": {"name": "Belarus", "fatf": "grey", "cpi": 39, "risk": "high"},
-    "pa": {"name": "Panama", "fatf": "grey", "cpi": 36, "risk": "medium"},
-    "ky": {"name": "Cayman Islands", "fatf": "monitored", "cpi": None, "risk": "medium"},
-    "vg": {"name": "British Virgin Islands", "fatf": "monitored", "cpi": None, "risk": "medium"},
-    "us": {"name": "United States", "fatf": "compliant", "cpi": 69, "risk": "low"},
-    "gb": {"name": "United Kingdom", "fatf": "compliant", "cpi": 71, "risk": "low"},
-    "de": {"name": "Germany", "fatf": "compliant", "cpi": 78, "risk": "low"},
-    "ch": {"name": "Switzerland", "fatf": "compliant", "cpi": 82, "risk": "low"},
-    "sg": {"name": "Singapore", "fatf": "compliant", "cpi": 83, "risk": "low"},
-}
-
-COUNTRY_ALIASES = {
-    "russia": "ru", "russian federation": "ru",
-    "united states": "us", "usa": "us", "america": "us",
-    "united kingdom": "gb", "uk": "gb", "britain": "gb", "england": "gb",
-    "germany": "de", "deutschland": "de",
-    "north korea": "kp", "dprk": "kp",
-    "iran": "ir",
-    "syria": "sy",
-    "panama": "pa",
-    "cayman islands": "ky", "caymans": "ky",
-    "switzerland": "ch",
-    "singapore": "sg",
-    "afghanistan": "af",
-    "myanmar": "mm", "burma": "mm",
-    "belarus": "by",
-}
+GEO_RISK_DATASET_PATH = os.getenv("GEO_RISK_DATASET_PATH")
+
+_index: CountryIndex | None = None
+
+
+def get_index() -> CountryIndex:
+    """Return the country index, loading it on first use."""
+    global _index
+    if _index is None:
+        if GEO_RISK_DATASET_PATH:
+            _index = CountryIndex.load(GEO_RISK_DATASET_PATH, compiled=None)
+        else:
+            _index = CountryIndex.load()
+    return _index
+
+
+def country_code(country: str) -> str:
+    """ISO alpha-2 code for a country name or code; the input itself if it is not recognized."""
+    data = get_index().lookup(country) if country else None
+    return data["alpha2"] if data else country
 
 
 @weave_op
+@instrumented
 def check(country: str, **opts) -> dict[str, Any]:
     """Assess geographic risk for a country."""
-    result_id = cuid()
+    return _evaluate(country)
+
+
+@weave_op
+@instrumented
+async def acheck(country: str, **opts) -> dict[str, Any]:
+    """Assess geographic risk for a country from async callers."""
+    return _evaluate(country)
 
-    code = country.lower().strip()
-    if code in COUNTRY_ALIASES:
-        code = COUNTRY_ALIASES[code]
 
-    if code not in COUNTRY_RISK:
+@weave_op
+def check_many(countries: Iterable[str]) -> list[dict[str, Any]]:
+    """Assess many counterparties' countries in one call, in input order.
+
+    Each distinct spelling is resolved once, so a batch where most rows share
+    a handful of countries costs a handful of lookups.
+    """
+    index = get_index()
+    resolved: dict[str, dict | None] = {}
+    results = []
+    for country in countries:
+        if country not in resolved:
+            resolved[country] = index.lookup(country)
+        results.append(_result(country, resolved[country], index.version))
+    return results
+
+
+def _evaluate(country: str) -> dict[str, Any]:
+    index = get_index()
+    return _result(country, index.lookup(country), index.version)
+
+
+def _result(country: str, data: dict | None, version: str) -> dict[str, Any]:
+    if data is None:
         return {
-            "id": result_id,
+            "id": cuid(),
             "tool": TOOL_ID,
             "entity": country,
             "status": "unknown",
             "confidence": 50,
             "findings": [],
             "sources": ["FATF", "Transparency International"],
+            "dataset_version": version,
         }
 
-    data = COUNTRY_RISK[code]
     return {
-        "id": result_id,
+        "id": cuid(),
         "tool": TOOL_ID,
         "entity": country,
         "status": data["risk"],
         "confidence": 95,
         "findings": [{
             "country": data["name"],
+            "iso_code": data["alpha2"],
             "fatf_status": data["fatf"],
             "corruption_index": data["cpi"],
             "risk_level": data["risk"],
         }],
         "sources": ["FATF", "Transparency International CPI"],
+        "dataset_version": version,
     }
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.geo_risk 'Country'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
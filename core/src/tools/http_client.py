@@ -0,0 +1,88 @@
+"""Process-wide pooled HTTP clients shared by the network-backed tools."""
+
+import asyncio
+import importlib.util
+import os
+import threading
+import weakref
+from urllib.parse import urlsplit
+
+import httpx
+
+HTTP2_ENABLED = os.getenv("SCOLO_HTTP2", "1") != "0" and importlib.util.find_spec("h2") is not None
+
+DEFAULT_TIMEOUT = httpx.Timeout(float(os.getenv("SCOLO_HTTP_TIMEOUT", "10")), connect=3.0)
+
+HOST_TIMEOUTS: dict[str, httpx.Timeout] = {
+    "api.gdeltproject.org": httpx.Timeout(8.0, connect=3.0),
+    "api.opencorporates.com": httpx.Timeout(6.0, connect=3.0),
+}
+
+LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("SCOLO_HTTP_MAX_CONNECTIONS", "100")),
+    max_keepalive_connections=int(os.getenv("SCOLO_HTTP_MAX_KEEPALIVE", "20")),
+    keepalive_expiry=float(os.getenv("SCOLO_HTTP_KEEPALIVE_EXPIRY", "30")),
+)
+
+HEADERS = {"User-Agent": "scolo-backend/0.1 (+https://scolo.app)"}
+
+_lock = threading.Lock()
+_client: httpx.Client | None = None
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def timeout_for(url: str) -> httpx.Timeout:
+    """Return the timeout configured for the host of ``url``."""
+    return HOST_TIMEOUTS.get(urlsplit(url).hostname or "", DEFAULT_TIMEOUT)
+
+
+def get_client() -> httpx.Client:
+    """Return the shared synchronous client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        with _lock:
+            if _client is None or _client.is_closed:
+                _client = httpx.Client(http2=HTTP2_ENABLED, limits=LIMITS, timeout=DEFAULT_TIMEOUT, headers=HEADERS)
+    return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared async client for the running event loop.
+
+    Connections in an AsyncClient pool are bound to the loop that opened them,
+    so one client is kept per loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(http2=HTTP2_ENABLED, limits=LIMITS, timeout=DEFAULT_TIMEOUT, headers=HEADERS)
+        _async_clients[loop] = client
+    return client
+
+
+def get(url: str, **kwargs) -> httpx.Response:
+    """GET ``url`` on the shared client using its per-host timeout."""
+    kwargs.setdefault("timeout", timeout_for(url))
+    return get_client().get(url, **kwargs)
+
+
+async def aget(url: str, **kwargs) -> httpx.Response:
+    """GET ``url`` on the shared async client using its per-host timeout."""
+    kwargs.setdefault("timeout", timeout_for(url))
+    return await get_async_client().get(url, **kwargs)
+
+
+async def aclose_async_client() -> None:
+    """Close the running loop's async client; call it before a short-lived loop ends."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def aclose() -> None:
+    """Close the shared clients (called on application shutdown)."""
+    global _client
+    await aclose_async_client()
+    if _client is not None:
+        _client.close()
+        _client = None
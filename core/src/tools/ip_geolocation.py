@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """IP address geolocation and risk assessment."""
 
+import asyncio
 import json
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
 
 TOOL_ID = "ip_geolocation"
+SIMULATED_LATENCY = 0.3
 
 SIMULATED_IPS = {
     "8.8.8.8": {
@@ -74,12 +76,25 @@ def normalize(ip: str) -> str:
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "IP") -> dict[str, Any]:
     """Geolocate an IP address and assess risk."""
+    time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "IP") -> dict[str, Any]:
+    """Geolocate an IP address and assess risk without blocking the event loop."""
+    await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "IP") -> dict[str, Any]:
     result_id = cuid()
     normalized = normalize(entity)
     print(f"[{TOOL_ID}] Geolocating IP: {normalized}", file=sys.stderr)
-    time.sleep(0.3)
 
     ip_data = SIMULATED_IPS.get(normalized)
     findings = [ip_data] if ip_data else []
@@ -119,7 +134,9 @@ def check(entity: str, entity_type: str = "IP") -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.ip_geolocation '8.8.8.8'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
@@ -0,0 +1,292 @@
+"""Indexed fuzzy name matching for watchlist screening.
+
+Names are normalized (accents stripped, Cyrillic transliterated, punctuation
+removed) and split into tokens. Each token is indexed three ways: exactly, by
+a coarse phonetic key and by character trigrams. A query only scores the
+aliases that share at least one posting with it, so lookups stay well under a
+millisecond on lists with tens of thousands of names and aliases.
+"""
+
+import csv
+import heapq
+import json
+import re
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterable
+
+CYRILLIC = str.maketrans({
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e", "ж": "zh", "з": "z",
+    "и": "i", "й": "y", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p", "р": "r",
+    "с": "s", "т": "t", "у": "u", "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch",
+    "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya", "і": "i", "ї": "yi", "є": "ye",
+    "ґ": "g", "ў": "u",
+})
+
+HONORIFICS = frozenset({"mr", "mrs", "ms", "miss", "dr", "prof", "sir", "dame", "lord", "sheikh", "he", "hrh"})
+# Trailing tokens that are never the family name ("Joseph R. Biden Jr.").
+NAME_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv"})
+
+PHONETIC_RULES = (
+    ("shch", "s"), ("sch", "s"), ("tch", "c"), ("ph", "f"), ("ck", "k"), ("kh", "h"),
+    ("sh", "s"), ("ch", "c"), ("zh", "s"), ("ts", "s"), ("tz", "s"), ("gh", "g"), ("dzh", "j"),
+)
+# Only spelling variants of one sound; b/p, d/t and m/n stay distinct so
+# "putin", "biden" and "button" do not share a key.
+PHONETIC_CLASSES = str.maketrans({"c": "k", "q": "k", "x": "s", "z": "s", "v": "f", "w": "f", "j": "y"})
+# Bumped whenever phonetic_key changes, so stored key postings can be recognised as stale.
+PHONETIC_VERSION = 2
+
+NON_WORD = re.compile(r"[^\w\s]|_")
+
+# Query tokens shorter than this only match exactly; "put" must not hit "putin".
+MIN_FUZZY_TOKEN = 4
+# Sounding alike only counts when the spellings are also this close (1 - edits / length).
+MIN_PHONETIC_EDIT_SIMILARITY = 0.7
+# Fuzzy token pairs less similar than this contribute nothing to a score.
+MIN_TOKEN_SIMILARITY = 0.5
+# Trigrams shared by more than this fraction of aliases are too common to help.
+MAX_GRAM_DF_RATIO = 0.01
+MAX_CANDIDATES = 512
+MAX_SCORED = 32
+
+
+def normalize_name(name: str) -> str:
+    """Fold case, accents, Cyrillic script and punctuation into plain ASCII words."""
+    text = unicodedata.normalize("NFKD", name.casefold().translate(CYRILLIC))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(NON_WORD.sub(" ", text).split())
+
+
+def tokenize(name: str) -> tuple[str, ...]:
+    return tuple(t for t in normalize_name(name).split() if t not in HONORIFICS)
+
+
+def phonetic_key(token: str) -> str:
+    """Sound-alike key: ``sergey``/``sergei`` and ``mohammed``/``muhammad`` collide.
+
+    The first letter is kept as written and vowels after it are dropped.
+    """
+    head, tail = token[:1], token[1:]
+    for src, dst in PHONETIC_RULES:
+        tail = tail.replace(src, dst)
+    key = [head]
+    for ch in tail.translate(PHONETIC_CLASSES):
+        if ch in "aeiouyh" or ch == key[-1]:
+            continue
+        key.append(ch)
+    return "".join(key)
+
+
+def surname_position(text: str, tokens: tuple[str, ...]) -> int:
+    """Index of the family name in ``tokens``.
+
+    Watchlists write it in capitals (``KIM Jong Un``, ``PUTIN, Vladimir``);
+    otherwise it is the last token that is not a suffix like ``Jr.``.
+    """
+    words = NON_WORD.sub(" ", text).split()
+    if not all(w.isupper() for w in words):
+        for word in words:
+            token = tokenize(word)
+            if len(word) > 1 and word.isupper() and token and token[0] in tokens and token[0] not in NAME_SUFFIXES:
+                return tokens.index(token[0])
+    for i in range(len(tokens) - 1, 0, -1):
+        if tokens[i] not in NAME_SUFFIXES:
+            return i
+    return 0
+
+
+def trigrams(token: str) -> frozenset[str]:
+    padded = f"^{token}$"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class _Alias:
+    __slots__ = ("entry_id", "text", "tokens", "surname", "keys", "grams")
+
+    def __init__(self, entry_id: int, text: str, tokens: tuple[str, ...]):
+        self.entry_id = entry_id
+        self.text = text
+        self.tokens = tokens
+        self.surname = surname_position(text, tokens)
+        self.keys = tuple(phonetic_key(t) for t in tokens)
+        self.grams = tuple(trigrams(t) for t in tokens)
+
+
+class NameIndex:
+    """Inverted index over watchlist names and aliases with scored lookups."""
+
+    def __init__(self):
+        self.entries: list[dict[str, Any]] = []
+        self._aliases: list[_Alias] = []
+        self._by_token: dict[str, list[int]] = defaultdict(list)
+        self._by_key: dict[str, list[int]] = defaultdict(list)
+        self._by_gram: dict[str, list[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, entry: dict[str, Any], names: Iterable[str] = ()) -> int:
+        """Index ``entry`` under its ``name`` plus any extra ``names``/``aliases``."""
+        entry_id = len(self.entries)
+        self.entries.append(entry)
+        seen: set[tuple[str, ...]] = set()
+        for text in (entry.get("name", ""), *entry.get("aliases", ()), *names):
+            tokens = tokenize(text)
+            if not tokens or tokens in seen:
+                continue
+            seen.add(tokens)
+            alias_id = len(self._aliases)
+            alias = _Alias(entry_id, text, tokens)
+            self._aliases.append(alias)
+            for token, key, grams in zip(alias.tokens, alias.keys, alias.grams):
+                self._by_token[token].append(alias_id)
+                self._by_key[key].append(alias_id)
+                for gram in grams:
+                    self._by_gram[gram].append(alias_id)
+        return entry_id
+
+    def search(self, query: str, limit: int = 5, min_score: int = 50) -> list[dict[str, Any]]:
+        """Return up to ``limit`` entries scoring at least ``min_score`` (0-100), best first.
+
+        Each hit is ``{"entry": ..., "score": int, "matched": alias_text}``.
+        """
+        q_tokens = tokenize(query)
+        if not q_tokens:
+            return []
+        q_keys = tuple(phonetic_key(t) for t in q_tokens)
+        q_grams = tuple(trigrams(t) for t in q_tokens)
+
+        best: dict[int, tuple[float, str]] = {}
+        for alias_id in self._candidates(q_tokens, q_keys, q_grams):
+            alias = self._aliases[alias_id]
+            score = _score(q_tokens, q_keys, q_grams, alias)
+            if score >= min_score and score > best.get(alias.entry_id, (0.0, ""))[0]:
+                best[alias.entry_id] = (score, alias.text)
+
+        ranked = sorted(best.items(), key=lambda item: -item[1][0])[:limit]
+        return [
+            {"entry": self.entries[entry_id], "score": round(score), "matched": text}
+            for entry_id, (score, text) in ranked
+        ]
+
+    def _candidates(self, q_tokens, q_keys, q_grams) -> list[int]:
+        """Collect aliases sharing a token, phonetic key or (as a fallback) trigrams with the query.
+
+        Postings are visited rarest first and very common ones are skipped once
+        enough candidates exist, which keeps frequent given names from turning
+        a lookup into a scan.
+        """
+        postings: list[tuple[list[int], int]] = []
+        for token, key, grams in zip(q_tokens, q_keys, q_grams):
+            exact = self._by_token.get(token)
+            if exact:
+                postings.append((exact, 4))
+            if len(token) < MIN_FUZZY_TOKEN:
+                continue
+            sounds_like = self._by_key.get(key)
+            if sounds_like:
+                postings.append((sounds_like, 2))
+            if not exact and not sounds_like:
+                max_df = max(64, int(len(self._aliases) * MAX_GRAM_DF_RATIO))
+                postings.extend((p, 1) for p in map(self._by_gram.get, grams) if p and len(p) <= max_df)
+
+        hits: dict[int, int] = defaultdict(int)
+        for alias_ids, weight in sorted(postings, key=lambda item: len(item[0])):
+            if len(hits) >= MAX_CANDIDATES and len(alias_ids) > MAX_CANDIDATES:
+                break
+            for alias_id in alias_ids:
+                hits[alias_id] += weight
+        if len(hits) <= MAX_SCORED:
+            return list(hits)
+        return heapq.nlargest(MAX_SCORED, hits, key=hits.__getitem__)
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> "NameIndex":
+        index = cls()
+        for record in records:
+            index.add(record)
+        return index
+
+    @classmethod
+    def load(cls, path: str | Path) -> "NameIndex":
+        """Build an index from a ``.json`` array, ``.jsonl`` or ``.csv`` watchlist file.
+
+        CSV files need a ``name`` column; ``aliases`` and ``datasets`` may hold
+        ``;``-separated values.
+        """
+        return cls.from_records(load_records(path))
+
+
+def load_records(path: str | Path) -> list[dict[str, Any]]:
+    path = Path(path)
+    if path.suffix == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            records = []
+            for row in csv.DictReader(f):
+                for field in ("aliases", "datasets"):
+                    row[field] = [v.strip() for v in (row.get(field) or "").split(";") if v.strip()]
+                records.append(row)
+            return records
+    with open(path, encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def _token_similarity(q: str, q_key: str, q_grams: frozenset, c: str, c_key: str, c_grams: frozenset) -> float:
+    if q == c:
+        return 1.0
+    if len(q) < MIN_FUZZY_TOKEN:
+        return 0.5 if len(q) == 1 and c.startswith(q) else 0.0
+    if q_key == c_key and edit_similarity(q, c) >= MIN_PHONETIC_EDIT_SIMILARITY:
+        return 0.9
+    sim = 0.85 * 2 * len(q_grams & c_grams) / (len(q_grams) + len(c_grams))
+    return sim if sim >= MIN_TOKEN_SIMILARITY else 0.0
+
+
+def edit_similarity(a: str, b: str) -> float:
+    """``1 - levenshtein(a, b) / max(len(a), len(b))``."""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return 1 - previous[-1] / max(len(a), len(b), 1)
+
+
+def _score(q_tokens, q_keys, q_grams, alias: _Alias) -> float:
+    """Order-independent token-set similarity: the mean of query and alias coverage.
+
+    When only one token of a multi-token alias matches, it has to be a
+    distinctive family name: a shared "Vladimir", "Ali" or "Kim" on its own
+    scores 0.
+    """
+    unused = list(range(len(alias.tokens)))
+    total = 0.0
+    fuzzy = []
+    for qi, q in enumerate(q_tokens):
+        for i in unused:
+            if alias.tokens[i] == q:
+                unused.remove(i)
+                total += 1.0
+                break
+        else:
+            fuzzy.append(qi)
+
+    for qi in fuzzy:
+        q, q_key, q_gram = q_tokens[qi], q_keys[qi], q_grams[qi]
+        best_sim, best_i = 0.0, -1
+        for i in unused:
+            sim = _token_similarity(q, q_key, q_gram, alias.tokens[i], alias.keys[i], alias.grams[i])
+            if sim > best_sim:
+                best_sim, best_i = sim, i
+        if best_i >= 0:
+            unused.remove(best_i)
+            total += best_sim
+    if len(alias.tokens) - len(unused) == 1 < len(alias.tokens):
+        if alias.surname in unused or len(alias.tokens[alias.surname]) < MIN_FUZZY_TOKEN:
+            return 0.0
+    return 50 * (total / len(q_tokens) + total / len(alias.tokens))
@@ -0,0 +1,13 @@
+"""Adverse media screening: concurrent news fetches, de-duplication and lexicon scoring.
+
+``adverse_media`` drives :func:`screen` and turns its updates into tool
+results; the pieces are usable on their own for tuning the lexicon or
+replaying saved articles.
+"""
+
+from .classifier import classify
+from .dedupe import Deduplicator, canonical_url
+from .pipeline import score_article, screen
+from .sources import plan_fetches
+
+__all__ = ["Deduplicator", "canonical_url", "classify", "plan_fetches", "score_article", "screen"]
@@ -0,0 +1,122 @@
+"""Lexicon-based negative news classifier.
+
+Headlines and snippets are normalized the same way names are (case, accents,
+transliteration), then matched against weighted terms of up to three words
+grouped by risk category. Title hits count double. A term directly preceded
+by a negation ("not charged") is ignored; exculpatory terms ("acquitted",
+"charges dropped") subtract. GDELT's tone, when present, adds a little
+weight for strongly negative coverage. The raw weight maps to a 0-1 score.
+"""
+
+import math
+from typing import Any
+
+from ..matching import normalize_name
+
+LEXICON: dict[str, dict[str, float]] = {
+    "financial_crime": {
+        "money laundering": 3.0, "laundering": 2.5, "laundered": 2.5, "embezzlement": 3.0, "embezzled": 3.0,
+        "fraud": 2.5, "fraudulent": 2.5, "ponzi": 3.0, "insider trading": 3.0, "tax evasion": 3.0,
+        "market manipulation": 2.5, "misappropriation": 2.5, "scam": 2.0,
+    },
+    "corruption": {
+        "corruption": 2.5, "corrupt": 2.0, "bribery": 3.0, "bribe": 2.5, "bribes": 2.5, "kickback": 2.5,
+        "kickbacks": 2.5, "graft": 2.5, "kleptocracy": 3.0,
+    },
+    "sanctions": {
+        "sanctions evasion": 3.0, "evading sanctions": 3.0, "sanctioned": 2.0, "sanctions": 1.0,
+        "blacklisted": 2.0, "export controls": 1.5, "asset freeze": 2.0, "assets frozen": 2.0,
+    },
+    "terrorism": {
+        "terrorism": 3.0, "terrorist": 3.0, "terror financing": 3.0, "terrorist financing": 3.0,
+        "extremist": 2.0,
+    },
+    "organized_crime": {
+        "organized crime": 3.0, "organised crime": 3.0, "cartel": 2.5, "trafficking": 3.0, "smuggling": 2.5,
+        "mafia": 2.5, "racketeering": 3.0,
+    },
+    "legal": {
+        "indicted": 3.0, "indictment": 3.0, "charged": 2.0, "arrested": 2.5, "arrest": 2.0, "convicted": 3.0,
+        "sentenced": 3.0, "pleaded guilty": 3.0, "guilty": 2.0, "accused": 2.0, "alleged": 1.0,
+        "lawsuit": 1.5, "sued": 1.5, "investigation": 1.5, "investigated": 1.5, "probe": 1.5, "raid": 2.0,
+        "raided": 2.0, "fined": 2.0, "penalty": 1.5, "subpoena": 2.0, "extradition": 2.5, "prison": 2.0,
+    },
+    "regulatory": {
+        "enforcement action": 2.5, "cease and desist": 2.5, "license revoked": 2.5, "violation": 1.5,
+        "violations": 1.5, "breach": 1.0, "whistleblower": 1.5, "settlement": 1.0,
+    },
+}
+
+MITIGATING: dict[str, float] = {
+    "acquitted": -3.0, "exonerated": -3.0, "cleared": -2.5, "not guilty": -3.0, "charges dropped": -2.5,
+    "dropped charges": -2.5, "dismissed": -2.0, "no wrongdoing": -2.5, "overturned": -2.0,
+}
+
+NEGATIONS = frozenset({"no", "not", "never", "without"})
+TITLE_WEIGHT = 2.0
+# Weight at which the score reaches ~0.63; one strong headline term clears the threshold.
+SCALE = 4.0
+NEGATIVE_THRESHOLD = 0.5
+POSITIVE_TONE = 3.0
+
+
+def _compile() -> tuple[dict[tuple[str, ...], tuple[str, float]], int]:
+    phrases: dict[tuple[str, ...], tuple[str, float]] = {}
+    for category, terms in LEXICON.items():
+        for term, weight in terms.items():
+            phrases[tuple(normalize_name(term).split())] = (category, weight)
+    for term, weight in MITIGATING.items():
+        phrases[tuple(normalize_name(term).split())] = ("mitigating", weight)
+    return phrases, max(len(p) for p in phrases)
+
+
+PHRASES, MAX_PHRASE = _compile()
+
+
+def _matches(text: str) -> list[tuple[str, str, float]]:
+    """``(term, category, weight)`` for each lexicon phrase in ``text``, longest match first."""
+    tokens = normalize_name(text).split()
+    found = []
+    i = 0
+    while i < len(tokens):
+        for n in range(min(MAX_PHRASE, len(tokens) - i), 0, -1):
+            hit = PHRASES.get(tuple(tokens[i:i + n]))
+            if hit is None:
+                continue
+            category, weight = hit
+            negated = i > 0 and tokens[i - 1] in NEGATIONS
+            if category == "mitigating" or not negated:
+                found.append((" ".join(tokens[i:i + n]), category, weight))
+            i += n - 1
+            break
+        i += 1
+    return found
+
+
+def classify(title: str, snippet: str = "", tone: float | None = None) -> dict[str, Any]:
+    """Score one article: ``{"sentiment", "score", "categories", "terms"}``."""
+    weights: dict[str, float] = {}
+    terms: list[str] = []
+    raw = 0.0
+    for text, factor in ((title, TITLE_WEIGHT), (snippet, 1.0)):
+        for term, category, weight in _matches(text):
+            raw += weight * factor
+            terms.append(term)
+            if category != "mitigating":
+                weights[category] = weights.get(category, 0.0) + weight * factor
+    if tone is not None and tone < -POSITIVE_TONE:
+        raw += min(-tone - POSITIVE_TONE, 5.0) / 2.5
+
+    score = 1 - math.exp(-max(raw, 0.0) / SCALE)
+    if score >= NEGATIVE_THRESHOLD:
+        sentiment = "negative"
+    elif raw <= 0 and tone is not None and tone > POSITIVE_TONE:
+        sentiment = "positive"
+    else:
+        sentiment = "neutral"
+    return {
+        "sentiment": sentiment,
+        "score": round(score, 2),
+        "categories": sorted(weights, key=lambda c: -weights[c]),
+        "terms": list(dict.fromkeys(terms)),
+    }
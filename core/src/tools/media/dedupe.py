@@ -0,0 +1,88 @@
+"""Collapse syndicated copies of the same story.
+
+Two articles are the same story when their canonical URLs match (scheme,
+``www.``/``m.``/AMP variants, tracking parameters and fragments removed) or
+when their titles share most word shingles: wire stories are republished
+with the outlet name appended or a word changed, rarely rewritten.
+"""
+
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from ..matching import normalize_name
+
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "ocid", "cmpid", "ref", "src", "smid", "mc_cid", "mc_eid"})
+HOST_PREFIXES = ("www.", "m.", "amp.", "mobile.")
+SHINGLE_SIZE = 3
+SIMILARITY_THRESHOLD = 0.6
+
+
+def canonical_url(url: str) -> str:
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    path = parts.path.rstrip("/")
+    for suffix in ("/amp", ".amp"):
+        if path.endswith(suffix):
+            path = path[:-len(suffix)]
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith("utm_") and k not in TRACKING_PARAMS
+    ]
+    return f"{host}{path}" + (f"?{urlencode(sorted(query))}" if query else "")
+
+
+def shingles(title: str, size: int = SHINGLE_SIZE) -> frozenset[str]:
+    tokens = normalize_name(title).split()
+    if len(tokens) <= size:
+        return frozenset([" ".join(tokens)]) if tokens else frozenset()
+    return frozenset(" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1))
+
+
+class Deduplicator:
+    """Remembers accepted articles and recognizes later copies of them."""
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._urls: dict[str, int] = {}
+        self._shingles: list[frozenset[str]] = []
+        self._by_shingle: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def add(self, article: dict[str, Any]) -> int | None:
+        """Accept ``article`` and return None, or return the id of the story it duplicates."""
+        url = canonical_url(article.get("url", ""))
+        if url and url in self._urls:
+            return self._urls[url]
+        title = shingles(article.get("title", ""))
+        original = self._similar(title)
+        if original is not None:
+            if url:
+                self._urls[url] = original
+            return original
+
+        article_id = len(self._shingles)
+        self._shingles.append(title)
+        if url:
+            self._urls[url] = article_id
+        for shingle in title:
+            self._by_shingle.setdefault(shingle, []).append(article_id)
+        return None
+
+    def _similar(self, title: frozenset[str]) -> int | None:
+        if not title:
+            return None
+        shared: dict[int, int] = {}
+        for shingle in title:
+            for article_id in self._by_shingle.get(shingle, ()):
+                shared[article_id] = shared.get(article_id, 0) + 1
+        for article_id, count in sorted(shared.items(), key=lambda item: -item[1]):
+            union = len(title) + len(self._shingles[article_id]) - count
+            if count / union >= self.threshold:
+                return article_id
+        return None
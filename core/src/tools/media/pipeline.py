@@ -0,0 +1,80 @@
+"""Concurrent fetch, de-duplication and scoring of news about one entity."""
+
+import asyncio
+import os
+from typing import Any, AsyncIterator
+
+from .classifier import classify
+from .dedupe import Deduplicator
+from .sources import Article, Fetch, plan_fetches
+
+# Fetches still running after this long are abandoned so the articles already
+# scored are reported instead of the whole check timing out.
+FETCH_BUDGET = float(os.getenv("MEDIA_FETCH_BUDGET", "10"))
+
+
+def score_article(article: Article) -> dict[str, Any]:
+    verdict = classify(article["title"], article.get("snippet", ""), article.get("tone"))
+    finding = {k: v for k, v in article.items() if k not in ("snippet", "origin") and v is not None}
+    finding.update(verdict, syndicated=0)
+    if article.get("tone") is not None:
+        finding["tone"] = round(article["tone"], 1)
+    return finding
+
+
+async def screen(
+    entity: str,
+    fetches: list[Fetch] | None = None,
+    budget: float = FETCH_BUDGET,
+) -> AsyncIterator[dict[str, Any]]:
+    """Run every fetch for ``entity`` concurrently and yield one update per completed fetch.
+
+    Each update is ``{"fetch", "findings", "duplicates", "error", "done", "total"}``,
+    where ``findings`` are only the stories not seen in earlier updates. A story
+    that shows up again bumps the ``syndicated`` count of its first finding,
+    which is shared across updates. Fetches still pending when ``budget``
+    runs out are reported with an error and cancelled.
+    """
+    fetches = plan_fetches(entity) if fetches is None else fetches
+    seen = Deduplicator()
+    accepted: list[dict[str, Any]] = []
+
+    async def run(name: str, fetch) -> tuple[str, list[Article] | None, str | None]:
+        try:
+            return name, await fetch(), None
+        except Exception as e:
+            return name, None, f"{type(e).__name__}: {e}"[:200]
+
+    tasks = {asyncio.create_task(run(name, fetch)): name for name, fetch in fetches}
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + budget
+    done = 0
+    try:
+        pending = set(tasks)
+        while pending:
+            finished, pending = await asyncio.wait(
+                pending, timeout=max(deadline - loop.time(), 0), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not finished:
+                for task in pending:
+                    done += 1
+                    yield {"fetch": tasks[task], "findings": [], "duplicates": 0,
+                           "error": f"Timed out after {budget:g}s", "done": done, "total": len(tasks)}
+                break
+            for task in finished:
+                name, articles, error = task.result()
+                new, duplicates = [], 0
+                for article in articles or ():
+                    original = seen.add(article)
+                    if original is None:
+                        accepted.append(score_article(article))
+                        new.append(accepted[-1])
+                    else:
+                        accepted[original]["syndicated"] += 1
+                        duplicates += 1
+                done += 1
+                yield {"fetch": name, "findings": new, "duplicates": duplicates,
+                       "error": error, "done": done, "total": len(tasks)}
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,119 @@
+"""News sources for adverse media screening.
+
+Every fetch is an independent coroutine returning raw articles::
+
+    {"title": ..., "url": ..., "source": "reuters.com", "date": "2024-05-01",
+     "snippet": ..., "tone": -4.2 | None, "origin": "gdelt" | "google_news"}
+
+GDELT's DOC API has no paging, so recall comes from splitting the lookback
+period into windows (each its own request, up to ``MEDIA_PAGE_SIZE``
+articles) and from a second, adverse-keyword query. Google News RSS adds
+outlets GDELT does not crawl.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable
+
+from .. import resilience
+
+GDELT_DOC_API = "https://api.gdeltproject.org/api/v2/doc/doc"
+GOOGLE_NEWS_RSS = "https://news.google.com/rss/search"
+
+LOOKBACK_DAYS = int(os.getenv("MEDIA_LOOKBACK_DAYS", "730"))
+GDELT_WINDOWS = int(os.getenv("MEDIA_GDELT_WINDOWS", "4"))
+PAGE_SIZE = int(os.getenv("MEDIA_PAGE_SIZE", "75"))
+
+# OR-ed into the second query so negative coverage is not crowded out by routine news.
+ADVERSE_QUERY_TERMS = (
+    "fraud", "laundering", "bribery", "corruption", "sanctions", "indicted", "lawsuit", "investigation",
+)
+
+Article = dict[str, Any]
+Fetch = tuple[str, Callable[[], Awaitable[list[Article]]]]
+
+
+def _gdelt_time(moment: datetime) -> str:
+    return moment.strftime("%Y%m%d%H%M%S")
+
+
+def gdelt_params(query: str, start: datetime | None = None, end: datetime | None = None) -> dict[str, str | int]:
+    params: dict[str, str | int] = {"query": query, "mode": "artlist", "format": "json", "maxrecords": PAGE_SIZE}
+    if start and end:
+        params["startdatetime"] = _gdelt_time(start)
+        params["enddatetime"] = _gdelt_time(end)
+    return params
+
+
+def parse_gdelt(data: dict) -> list[Article]:
+    return [
+        {
+            "title": a.get("title", ""),
+            "url": a.get("url", ""),
+            "source": a.get("domain", ""),
+            "date": _gdelt_date(a.get("seendate", "")),
+            "snippet": "",
+            "tone": a.get("tone"),
+            "origin": "gdelt",
+        }
+        for a in data.get("articles", [])
+    ]
+
+
+def _gdelt_date(seendate: str) -> str:
+    """``20240501T120000Z`` -> ``2024-05-01``."""
+    return f"{seendate[:4]}-{seendate[4:6]}-{seendate[6:8]}" if len(seendate) >= 8 else ""
+
+
+def parse_google_news(xml_text: str) -> list[Article]:
+    articles = []
+    for item in ET.fromstring(xml_text).iter("item"):
+        published = item.findtext("pubDate") or ""
+        try:
+            date = parsedate_to_datetime(published).date().isoformat() if published else ""
+        except (TypeError, ValueError):
+            date = ""
+        source = item.find("source")
+        articles.append({
+            "title": item.findtext("title") or "",
+            "url": item.findtext("link") or "",
+            "source": (source.text or "") if source is not None else "",
+            "date": date,
+            "snippet": "",
+            "tone": None,
+            "origin": "google_news",
+        })
+    return articles
+
+
+async def fetch_gdelt(query: str, start: datetime | None = None, end: datetime | None = None) -> list[Article]:
+    # GDELT answers rate-limited or malformed queries with a plain-text message,
+    # which the upstream's breaker then counts as a failure.
+    r = await resilience.aget("gdelt", GDELT_DOC_API, content_type="json", params=gdelt_params(query, start, end))
+    return parse_gdelt(r.json())
+
+
+async def fetch_google_news(query: str) -> list[Article]:
+    params = {"q": f"{query} when:{LOOKBACK_DAYS}d", "hl": "en-US", "gl": "US", "ceid": "US:en"}
+    r = await resilience.aget("google_news", GOOGLE_NEWS_RSS, params=params)
+    return parse_google_news(r.text)
+
+
+def plan_fetches(entity: str, now: datetime | None = None) -> list[Fetch]:
+    """Every request to make for ``entity``, named for error reporting."""
+    now = now or datetime.now(timezone.utc)
+    quoted = f'"{entity}"'
+    adverse = f"{quoted} ({' OR '.join(ADVERSE_QUERY_TERMS)})"
+    span = timedelta(days=LOOKBACK_DAYS) / max(GDELT_WINDOWS, 1)
+
+    fetches: list[Fetch] = []
+    for i in range(max(GDELT_WINDOWS, 1)):
+        end = now - span * i
+        start = end - span
+        fetches.append((f"gdelt:{start:%Y-%m-%d}", lambda s=start, e=end: fetch_gdelt(quoted, s, e)))
+    fetches.append(("gdelt:adverse", lambda: fetch_gdelt(adverse, now - span * GDELT_WINDOWS, now)))
+    fetches.append(("google_news", lambda: fetch_google_news(quoted)))
+    fetches.append(("google_news:adverse", lambda: fetch_google_news(adverse)))
+    return fetches
@@ -0,0 +1,19 @@
+"""Typed schema for the JSON every tool check emits."""
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ToolResult(BaseModel):
+    """One tool's output. Extra keys (``cache``, ``error``, ``stale``, ...) are kept."""
+
+    model_config = ConfigDict(extra="allow")
+
+    id: str
+    tool: str
+    entity: str
+    status: str
+    confidence: int | float = 80
+    findings: list[dict[str, Any]] = Field(default_factory=list)
+    sources: list[str] = Field(default_factory=list)
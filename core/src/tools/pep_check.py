@@ -1,112 +1,150 @@
 #!/usr/bin/env python3
 """Politically Exposed Person (PEP) screening."""
 
+import asyncio
 import json
 import os
 import sys
 import time
-from typing import Any
+from typing import Any, Iterable
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
+from .pep_data import PepIndex
 
 TOOL_ID = "pep_check"
+SIMULATED_LATENCY = 0.3
 
-# TODO: Uncomment for real Wikidata API
-# WIKIDATA_SPARQL = "https://query.wikidata.org/sparql"
+# Optional PEP/RCA file: .json/.jsonl records, see pep_data (e.g. built from a Wikidata extract)
+PEP_LIST_PATH = os.getenv("PEP_LIST_PATH")
 
-SIMULATED_PEPS = {
-    "joe biden": {
-        "name": "Joseph R. Biden Jr.",
-        "position": "President of the United States",
-        "country": "United States",
-        "pep_level": "high",
-    },
-    "biden": {
+MATCH_THRESHOLD = 80
+POTENTIAL_THRESHOLD = 50
+
+SIMULATED_PEPS = [
+    {
+        "id": "sim:joe-biden",
         "name": "Joseph R. Biden Jr.",
-        "position": "President of the United States",
-        "country": "United States",
-        "pep_level": "high",
+        "aliases": ["Joe Biden", "Biden"],
+        "countries": ["US"],
+        "positions": [{"title": "President of the United States", "country": "US", "start": "2021-01-20"}],
+        "relations": [{"id": "sim:jill-biden", "relation": "spouse"}, {"id": "sim:hunter-biden", "relation": "child"}],
     },
-    "donald trump": {
+    {"id": "sim:jill-biden", "name": "Jill Biden", "countries": ["US"]},
+    {"id": "sim:hunter-biden", "name": "Hunter Biden", "countries": ["US"]},
+    {
+        "id": "sim:donald-trump",
         "name": "Donald J. Trump",
-        "position": "Former President of the United States",
-        "country": "United States",
-        "pep_level": "high",
+        "aliases": ["Donald Trump"],
+        "countries": ["US"],
+        "positions": [{"title": "Former President of the United States", "country": "US", "end": "2021-01-20"}],
     },
-    "vladimir putin": {
+    {
+        "id": "sim:vladimir-putin",
         "name": "Vladimir Putin",
-        "position": "President of Russia",
-        "country": "Russia",
-        "pep_level": "high",
+        "aliases": ["Владимир Путин"],
+        "countries": ["RU"],
+        "positions": [{"title": "President of Russia", "country": "RU", "start": "2012-05-07"}],
     },
-    "rishi sunak": {
+    {
+        "id": "sim:rishi-sunak",
         "name": "Rishi Sunak",
-        "position": "Prime Minister of the United Kingdom",
-        "country": "United Kingdom",
-        "pep_level": "high",
+        "countries": ["GB"],
+        "positions": [{"title": "Prime Minister of the United Kingdom", "country": "GB", "end": "2024-07-05"}],
     },
-    "emmanuel macron": {
+    {
+        "id": "sim:emmanuel-macron",
         "name": "Emmanuel Macron",
-        "position": "President of France",
-        "country": "France",
-        "pep_level": "high",
+        "countries": ["FR"],
+        "positions": [{"title": "President of France", "country": "FR", "start": "2017-05-14"}],
     },
-}
+]
+
+_index: PepIndex | None = None
+
+
+def get_index() -> PepIndex:
+    """Return the PEP index, building it on first use."""
+    global _index
+    if _index is None:
+        _index = PepIndex.load(PEP_LIST_PATH) if PEP_LIST_PATH else PepIndex(SIMULATED_PEPS)
+    return _index
 
 
 @weave_op
+@instrumented
 def check(entity: str, **opts) -> dict[str, Any]:
-    """Screen entity for PEP status."""
-    result_id = cuid()
-    print(f"[{TOOL_ID}] Checking: {entity}", file=sys.stderr)
+    """Screen entity for PEP status; ``country`` and ``position`` narrow the match."""
+    if not PEP_LIST_PATH:
+        time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, **opts)
 
-    # TODO: Uncomment for real API
-    # findings = _search_wikidata(entity)
 
-    # Simulated search
-    findings = _search_simulated(entity)
+@weave_op
+@instrumented
+async def acheck(entity: str, **opts) -> dict[str, Any]:
+    """Screen entity for PEP status without blocking the event loop."""
+    if not PEP_LIST_PATH:
+        await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, **opts)
 
-    time.sleep(0.3)  # Simulate API latency
+
+@weave_op
+def check_many(entities: Iterable[str], **opts) -> list[dict[str, Any]]:
+    """Screen many names against the local index in one call, in input order.
+
+    Repeated names are looked up once. Unlike :func:`check` there is no
+    per-name latency, which is what onboarding-sized batches need.
+    """
+    resolved: dict[str, list[dict]] = {}
+    results = []
+    for entity in entities:
+        if entity not in resolved:
+            resolved[entity] = _search_index(entity, **opts)
+        results.append(_result(entity, resolved[entity]))
+    return results
+
+
+def _evaluate(entity: str, **opts) -> dict[str, Any]:
+    print(f"[{TOOL_ID}] Checking: {entity}", file=sys.stderr)
+    findings = _search_index(entity, **opts)
     print(f"[{TOOL_ID}] Found {len(findings)} results", file=sys.stderr)
+    return _result(entity, findings)
+
 
+def _result(entity: str, findings: list[dict]) -> dict[str, Any]:
+    sources = [f"PEP Database ({os.path.basename(PEP_LIST_PATH) if PEP_LIST_PATH else 'simulated'})"]
     if not findings:
         return {
-            "id": result_id,
+            "id": cuid(),
             "tool": TOOL_ID,
             "entity": entity,
             "status": "clear",
             "confidence": 85,
             "findings": [],
-            "sources": ["PEP Database (simulated)"],
+            "sources": sources,
         }
 
+    max_score = max(f["score"] for f in findings)
     return {
-        "id": result_id,
+        "id": cuid(),
         "tool": TOOL_ID,
         "entity": entity,
-        "status": "match",
-        "confidence": 95,
+        "status": "match" if max_score >= MATCH_THRESHOLD else "potential",
+        "confidence": max_score,
         "findings": findings,
-        "sources": ["PEP Database (simulated)"],
+        "sources": sources,
     }
 
 
-def _search_simulated(entity: str) -> list[dict]:
-    """Simulated PEP search."""
-    normalized = entity.lower().strip()
-    for key, data in SIMULATED_PEPS.items():
-        if key in normalized or normalized in key:
-            return [data]
-    return []
-
-
-# TODO: Uncomment for real Wikidata API
-# def _search_wikidata(entity: str) -> list[dict]:
-#     ...
+def _search_index(entity: str, country: str | None = None, position: str | None = None, **_) -> list[dict]:
+    """Fuzzy search of the local PEP index, with relatives and close associates attached."""
+    return get_index().search(entity, country=country, position=position, min_score=POTENTIAL_THRESHOLD)
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.pep_check 'Person Name'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Local index of politically exposed persons and their relatives and close associates.
+
+Records are one person each, as a ``.json`` array or ``.jsonl`` file::
+
+    {"id": "Q6279", "name": "Joe Biden", "aliases": ["Joseph Robinette Biden Jr."],
+     "countries": ["US"],
+     "positions": [{"title": "President of the United States", "country": "US",
+                    "start": "2021-01-20", "end": "2025-01-20"}],
+     "relations": [{"id": "Q7141", "relation": "spouse"}]}
+
+A person with at least one position is a PEP; everyone else in the file is
+there because a PEP links to them (or they link to a PEP) and is screened as
+an RCA (relative or close associate). Links are stored in both directions, so
+one lookup returns a match together with the people connected to it.
+
+``python -m src.tools.pep_data convert DUMP OUT.jsonl`` builds such a file
+from a Wikidata JSON dump. Run it on a filtered extract (humans holding a
+position, their relatives, and the position and country items they
+reference), not the full dump: labels of every non-human item are kept in
+memory to resolve position titles and countries.
+"""
+
+import argparse
+import bz2
+import gzip
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .geo_risk import country_code
+from .matching import NameIndex, load_records, normalize_name
+
+# Checked in order; the first tier with a keyword in any position title wins.
+PEP_TIERS = (
+    ("high", (
+        "president", "prime minister", "head of state", "head of government", "chancellor", "monarch", "king",
+        "queen", "emir", "sultan", "minister", "secretary of state", "supreme leader", "central bank",
+        "supreme court", "constitutional court",
+    )),
+    ("medium", (
+        "member of", "senator", "deputy", "ambassador", "governor", "general", "admiral", "judge",
+        "mayor", "parliament", "congress", "assembly",
+    )),
+)
+DEFAULT_PEP_LEVEL = "low"
+
+WIKIDATA_HUMAN = "Q5"
+WIKIDATA_POSITION_HELD = "P39"
+WIKIDATA_CITIZENSHIP = "P27"
+WIKIDATA_ISO_ALPHA2 = "P297"
+WIKIDATA_JURISDICTION = ("P1001", "P17")
+WIKIDATA_START, WIKIDATA_END = "P580", "P582"
+WIKIDATA_RELATIONS = {
+    "P22": "parent", "P25": "parent", "P40": "child", "P26": "spouse", "P451": "partner",
+    "P3373": "sibling", "P1038": "relative", "P1327": "associate",
+}
+# Labels and aliases kept from a Wikidata dump; other scripts only add noise to the index.
+ALIAS_LANGUAGES = ("en", "fr", "de", "es", "it", "pt", "nl", "ru", "uk", "tr", "ar")
+
+# How a link reads from the other end: A is B's "child" when B is A's "parent".
+INVERSE_RELATIONS = {"parent": "child", "child": "parent"}
+
+
+def pep_level(positions: Iterable[dict[str, Any]]) -> str | None:
+    """``high``/``medium``/``low`` for a person holding ``positions``; None if they hold none."""
+    titles = [f" {normalize_name(p.get('title', ''))} " for p in positions]
+    if not titles:
+        return None
+    for level, keywords in PEP_TIERS:
+        if any(f" {keyword} " in title for title in titles for keyword in keywords):
+            return level
+    return DEFAULT_PEP_LEVEL
+
+
+class PepIndex:
+    """Name index over PEPs and RCAs with position, country and relationship lookups."""
+
+    def __init__(self, records: Iterable[dict[str, Any]] = ()):
+        self._names = NameIndex()
+        self._people: dict[str, dict[str, Any]] = {}
+        self._links: dict[str, dict[str, str]] = defaultdict(dict)
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._people)
+
+    def add(self, record: dict[str, Any]) -> None:
+        positions = record.get("positions") or []
+        person = {
+            "id": record["id"],
+            "name": record["name"],
+            "aliases": record.get("aliases") or [],
+            "countries": [country_code(c) for c in record.get("countries") or []],
+            "positions": [{**p, "country": country_code(p.get("country") or "")} for p in positions],
+            "pep_level": record.get("pep_level") or pep_level(positions),
+        }
+        self._people[person["id"]] = person
+        self._names.add(person)
+        for link in record.get("relations") or []:
+            relation = link["relation"]
+            self._links[person["id"]][link["id"]] = relation
+            self._links[link["id"]].setdefault(person["id"], INVERSE_RELATIONS.get(relation, relation))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "PepIndex":
+        return cls(load_records(path))
+
+    def get(self, person_id: str) -> dict[str, Any] | None:
+        return self._people.get(person_id)
+
+    def related(self, person_id: str) -> list[dict[str, Any]]:
+        """People linked to ``person_id``, each with the ``relation`` they have to that person."""
+        return [
+            {"id": other, "name": self._people[other]["name"], "relation": relation,
+             "pep_level": self._people[other]["pep_level"]}
+            for other, relation in self._links.get(person_id, {}).items()
+            if other in self._people
+        ]
+
+    def search(
+        self,
+        query: str,
+        country: str | None = None,
+        position: str | None = None,
+        limit: int = 5,
+        min_score: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Screen a name; hits are PEPs, or RCAs whose ``rca_of`` names the PEPs they are linked to.
+
+        ``country`` (name or code) keeps people connected to that country by
+        citizenship or position; ``position`` keeps people with a matching
+        title. An RCA passes the filters through the PEPs it is linked to.
+        """
+        country = country_code(country) if country else None
+        position = normalize_name(position) if position else None
+        fetch = limit * 4 if country or position else limit
+
+        hits = []
+        for hit in self._names.search(query, limit=fetch, min_score=min_score):
+            person = hit["entry"]
+            related = self.related(person["id"])
+            rca_of = [r for r in related if r["pep_level"]]
+            if not person["pep_level"] and not rca_of:
+                continue
+            subjects = [person] if person["pep_level"] else [self._people[r["id"]] for r in rca_of]
+            if not any(self._passes(p, country, position) for p in subjects):
+                continue
+            finding = {k: v for k, v in person.items() if k != "aliases"}
+            # Headline title and country for callers that show a single position.
+            finding["position"] = person["positions"][0].get("title") if person["positions"] else None
+            finding["country"] = next(iter(person["countries"]), None)
+            finding.update(score=hit["score"], matched_name=hit["matched"], related=related)
+            if not person["pep_level"]:
+                finding["rca_of"] = rca_of
+            hits.append(finding)
+        return hits[:limit]
+
+    @staticmethod
+    def _passes(person: dict[str, Any], country: str | None, position: str | None) -> bool:
+        if country and country not in person["countries"]:
+            if all(p["country"] != country for p in person["positions"]):
+                return False
+        if position and not any(position in normalize_name(p.get("title", "")) for p in person["positions"]):
+            return False
+        return True
+
+
+def iter_wikidata(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Entities of a Wikidata JSON dump (``.json``, ``.json.gz`` or ``.json.bz2``), one per line."""
+    path = Path(path)
+    opener = {".gz": gzip.open, ".bz2": bz2.open}.get(path.suffix, open)
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip().rstrip(",")
+            if line and line not in ("[", "]"):
+                yield json.loads(line)
+
+
+def _claims(entity: dict[str, Any], prop: str) -> list[dict[str, Any]]:
+    return [c for c in entity.get("claims", {}).get(prop, []) if c.get("rank") != "deprecated"]
+
+
+def _value(snak: dict[str, Any]) -> Any:
+    return snak.get("datavalue", {}).get("value") if snak.get("snaktype") == "value" else None
+
+
+def _item_ids(entity: dict[str, Any], prop: str) -> list[str]:
+    values = (_value(c["mainsnak"]) for c in _claims(entity, prop))
+    return [v["id"] for v in values if isinstance(v, dict) and "id" in v]
+
+
+def _qualifier_date(claim: dict[str, Any], prop: str) -> str | None:
+    for snak in claim.get("qualifiers", {}).get(prop, []):
+        value = _value(snak)
+        if isinstance(value, dict) and "time" in value:
+            # "+2021-01-20T00:00:00Z"; year- or month-precision dates carry "-00".
+            return value["time"].lstrip("+")[:10].replace("-00", "")
+    return None
+
+
+def _names(entity: dict[str, Any]) -> list[str]:
+    names = []
+    for lang in ALIAS_LANGUAGES:
+        if lang in entity.get("labels", {}):
+            names.append(entity["labels"][lang]["value"])
+        names.extend(a["value"] for a in entity.get("aliases", {}).get(lang, []))
+    unique: dict[str, str] = {}
+    for name in names:
+        unique.setdefault(normalize_name(name), name)
+    return list(unique.values())
+
+
+def convert_wikidata(path: str | Path) -> list[dict[str, Any]]:
+    """Turn a Wikidata extract into PEP index records: position holders plus the people they link to."""
+    labels: dict[str, str] = {}
+    iso: dict[str, str] = {}
+    jurisdictions: dict[str, str] = {}
+    people: dict[str, dict[str, Any]] = {}
+
+    for entity in iter_wikidata(path):
+        qid = entity.get("id", "")
+        names = _names(entity)
+        if not names:
+            continue
+        if WIKIDATA_HUMAN not in _item_ids(entity, "P31"):
+            labels[qid] = names[0]
+            codes = [_value(c["mainsnak"]) for c in _claims(entity, WIKIDATA_ISO_ALPHA2)]
+            if codes and isinstance(codes[0], str):
+                iso[qid] = codes[0]
+            for prop in WIKIDATA_JURISDICTION:
+                if ids := _item_ids(entity, prop):
+                    jurisdictions[qid] = ids[0]
+                    break
+            continue
+        people[qid] = {
+            "id": qid,
+            "name": names[0],
+            "aliases": names[1:],
+            "countries": _item_ids(entity, WIKIDATA_CITIZENSHIP),
+            "positions": [
+                {
+                    "title": _value(c["mainsnak"])["id"],
+                    "start": _qualifier_date(c, WIKIDATA_START),
+                    "end": _qualifier_date(c, WIKIDATA_END),
+                }
+                for c in _claims(entity, WIKIDATA_POSITION_HELD)
+                if isinstance(_value(c["mainsnak"]), dict)
+            ],
+            "relations": [
+                {"id": other, "relation": relation}
+                for prop, relation in WIKIDATA_RELATIONS.items()
+                for other in _item_ids(entity, prop)
+            ],
+        }
+
+    def country(qid: str | None) -> str:
+        if not qid:
+            return ""
+        return iso.get(qid) or country_code(labels.get(qid, ""))
+
+    peps = {qid for qid, person in people.items() if person["positions"]}
+    linked = {r["id"] for qid in peps for r in people[qid]["relations"]}
+    linked |= {qid for qid, person in people.items() if any(r["id"] in peps for r in person["relations"])}
+    records = []
+    for qid, person in people.items():
+        if qid not in peps and qid not in linked:
+            continue
+        for p in person["positions"]:
+            p["country"] = country(jurisdictions.get(p["title"]))
+            p["title"] = labels.get(p["title"], p["title"])
+        person["countries"] = [country(c) for c in person["countries"]]
+        person["relations"] = [r for r in person["relations"] if r["id"] in people]
+        records.append(person)
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build a PEP index file from a Wikidata extract")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser("convert")
+    convert.add_argument("dump", type=Path)
+    convert.add_argument("output", type=Path)
+    args = parser.parse_args()
+
+    records = convert_wikidata(args.dump)
+    with open(args.output, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    peps = sum(1 for r in records if r["positions"])
+    print(f"Wrote {peps} PEPs and {len(records) - peps} relatives/associates -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 """Phone number lookup and enrichment."""
 
+import asyncio
 import json
 import re
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
 
 TOOL_ID = "phone_lookup"
+SIMULATED_LATENCY = 0.3
 
 SIMULATED_PHONES = {
     "+1-555-123-4567": {
@@ -53,11 +55,24 @@ def normalize_phone(phone: str) -> str:
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "Phone") -> dict[str, Any]:
     """Lookup phone number details."""
+    time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "Phone") -> dict[str, Any]:
+    """Lookup phone number details without blocking the event loop."""
+    await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "Phone") -> dict[str, Any]:
     result_id = cuid()
     print(f"[{TOOL_ID}] Looking up phone: {entity}", file=sys.stderr)
-    time.sleep(0.3)
 
     normalized = normalize_phone(entity)
     findings = []
@@ -97,7 +112,9 @@ def check(entity: str, entity_type: str = "Phone") -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.phone_lookup '+1-555-123-4567'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
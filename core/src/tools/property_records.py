@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Property records search."""
 
+import asyncio
 import json
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
 
 TOOL_ID = "property_records"
+SIMULATED_LATENCY = 0.5
 
 SIMULATED_PROPERTIES = {
     "john smith": [
@@ -54,11 +56,24 @@ def normalize(name: str) -> str:
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "Person") -> dict[str, Any]:
     """Search property records for an entity."""
+    time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "Person") -> dict[str, Any]:
+    """Search property records for an entity without blocking the event loop."""
+    await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "Person") -> dict[str, Any]:
     result_id = cuid()
     print(f"[{TOOL_ID}] Searching property records for: {entity}", file=sys.stderr)
-    time.sleep(0.5)
 
     normalized = normalize(entity)
     findings = []
@@ -99,7 +114,9 @@ def check(entity: str, entity_type: str = "Person") -> dict[str, Any]:
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.property_records 'Entity Name'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
@@ -0,0 +1,287 @@
+"""Circuit breakers, hedged requests and retry budgets for upstream data sources.
+
+Each named upstream (``"gdelt"``, ``"opencorporates"``, ...) gets one
+:class:`Upstream` per process, shared by every tool that calls it:
+
+- a circuit breaker opens after ``SCOLO_BREAKER_FAILURES`` consecutive
+  failures and fails calls fast for ``SCOLO_BREAKER_RESET`` seconds, then
+  lets one probe through;
+- a request still running after the upstream's observed p95 latency gets a
+  hedged duplicate, and whichever answers first wins;
+- failed requests are retried, but retries and hedges together may only add
+  ``SCOLO_RETRY_BUDGET`` (10%) on top of first attempts, so a struggling
+  upstream is not hit with a retry storm.
+
+Only transport errors, timeouts, 429 and 5xx responses, and replies of an
+unexpected content type (some upstreams throttle with a plain-text 200),
+count as upstream failures; other 4xx responses are raised without retrying.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, TypeVar
+
+import httpx
+
+from . import http_client
+
+BREAKER_FAILURES = int(os.getenv("SCOLO_BREAKER_FAILURES", "5"))
+BREAKER_RESET = float(os.getenv("SCOLO_BREAKER_RESET", "30"))
+RETRY_BUDGET_RATIO = float(os.getenv("SCOLO_RETRY_BUDGET", "0.1"))
+# Lets a quiet upstream still retry now and then before any deposits accrue.
+RETRY_BUDGET_RESERVE = 10.0
+MAX_ATTEMPTS = 2
+HEDGE_MIN_DELAY = float(os.getenv("SCOLO_HEDGE_MIN_DELAY", "0.25"))
+HEDGE_DEFAULT_DELAY = 2.0
+LATENCY_WINDOW = 200
+LATENCY_MIN_SAMPLES = 20
+RETRY_BACKOFF = 0.2
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling an upstream whose breaker is open."""
+
+    def __init__(self, upstream: str, retry_in: float):
+        super().__init__(f"{upstream} circuit open; retrying in {retry_in:.0f}s")
+        self.upstream = upstream
+        self.retry_in = retry_in
+
+
+class UnexpectedContentError(Exception):
+    """Raised when an upstream answers with another content type than the caller expects."""
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, (httpx.TransportError, TimeoutError, asyncio.TimeoutError, UnexpectedContentError))
+
+
+class CircuitBreaker:
+    """Closed -> open after ``threshold`` consecutive failures -> half-open after ``reset_timeout``."""
+
+    def __init__(self, name: str, threshold: int = BREAKER_FAILURES, reset_timeout: float = BREAKER_RESET):
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._probe_started: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def before_call(self) -> None:
+        """Raise :class:`CircuitOpenError` unless a call may go through now."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            now = time.monotonic()
+            # One probe at a time; a probe that never reported back (cancelled) expires.
+            if state == "half_open" and (self._probe_started is None or now - self._probe_started > self.reset_timeout):
+                self._probe_started = now
+                return
+            retry_in = max(self.reset_timeout - (time.monotonic() - (self.opened_at or 0)), 0)
+            raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._probe_started is not None or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self._probe_started = None
+
+
+class RetryBudget:
+    """Token bucket: every first attempt deposits ``ratio`` tokens, every retry or hedge spends one."""
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, reserve: float = RETRY_BUDGET_RESERVE):
+        self.ratio = ratio
+        self.capacity = reserve
+        self.tokens = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.tokens = min(self.tokens + self.ratio, self.capacity)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        if len(self._samples) < LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def hedge_delay(self) -> float:
+        p95 = self.percentile(0.95)
+        return HEDGE_DEFAULT_DELAY if p95 is None else max(p95, HEDGE_MIN_DELAY)
+
+
+class Upstream:
+    """Breaker, latency stats and retry budget for one upstream source."""
+
+    def __init__(self, name: str, breaker: CircuitBreaker | None = None, budget: RetryBudget | None = None):
+        self.name = name
+        self.breaker = breaker or CircuitBreaker(name)
+        self.budget = budget or RetryBudget()
+        self.latency = LatencyTracker()
+        self.hedges = 0
+        self.retries = 0
+
+    async def call(self, func: Callable[[], Awaitable[T]], hedge: bool = True) -> T:
+        """Await ``func()`` with breaker, hedging and budgeted retries applied."""
+        self.breaker.before_call()
+        self.budget.deposit()
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                result = await (self._hedged(func) if hedge else self._timed(func))
+            except Exception as e:
+                if not is_upstream_failure(e):
+                    # The upstream answered (e.g. 404), so it is healthy.
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                if attempt + 1 == MAX_ATTEMPTS or self.breaker.state != "closed" or not self.budget.withdraw():
+                    raise
+                self.retries += 1
+                await asyncio.sleep(RETRY_BACKOFF)
+                continue
+            self.breaker.record_success()
+            return result
+        raise AssertionError("unreachable")
+
+    def call_sync(self, func: Callable[[], T]) -> T:
+        """Blocking variant of :meth:`call`, without hedging."""
+        self.breaker.before_call()
+        self.budget.deposit()
+        for attempt in range(MAX_ATTEMPTS):
+            started = time.monotonic()
+            try:
+                result = func()
+            except Exception as e:
+                if not is_upstream_failure(e):
+                    # The upstream answered (e.g. 404), so it is healthy.
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                if attempt + 1 == MAX_ATTEMPTS or self.breaker.state != "closed" or not self.budget.withdraw():
+                    raise
+                self.retries += 1
+                time.sleep(RETRY_BACKOFF)
+                continue
+            self.latency.record(time.monotonic() - started)
+            self.breaker.record_success()
+            return result
+        raise AssertionError("unreachable")
+
+    async def _timed(self, func: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await func()
+        self.latency.record(time.monotonic() - started)
+        return result
+
+    async def _hedged(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Start ``func``; if it is still running after the hedge delay, race a second copy."""
+        first = asyncio.ensure_future(self._timed(func))
+        done, _ = await asyncio.wait({first}, timeout=self.latency.hedge_delay())
+        if done or not self.budget.withdraw():
+            return await first
+
+        self.hedges += 1
+        racers = {first, asyncio.ensure_future(self._timed(func))}
+        try:
+            while racers:
+                done, racers = await asyncio.wait(racers, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None or not racers:
+                        return task.result()
+            raise AssertionError("unreachable")
+        finally:
+            for task in racers:
+                task.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "state": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "p95_seconds": self.latency.percentile(0.95),
+            "hedges": self.hedges,
+            "retries": self.retries,
+            "retry_tokens": round(self.budget.tokens, 2),
+        }
+
+
+_upstreams: dict[str, Upstream] = {}
+_upstreams_lock = threading.Lock()
+
+
+def upstream(name: str) -> Upstream:
+    """Return the process-wide :class:`Upstream` for ``name``."""
+    with _upstreams_lock:
+        if name not in _upstreams:
+            _upstreams[name] = Upstream(name)
+        return _upstreams[name]
+
+
+def stats() -> dict[str, dict[str, Any]]:
+    return {name: u.stats() for name, u in sorted(_upstreams.items())}
+
+
+def _check(source: str, r: httpx.Response, content_type: str | None) -> httpx.Response:
+    r.raise_for_status()
+    if content_type and content_type not in r.headers.get("content-type", ""):
+        raise UnexpectedContentError(f"{source}: {r.text[:200]}")
+    return r
+
+
+async def aget(source: str, url: str, content_type: str | None = None, **kwargs) -> httpx.Response:
+    """GET ``url`` through ``source``'s upstream; error statuses raise ``httpx.HTTPStatusError``.
+
+    With ``content_type``, a reply of any other type raises :class:`UnexpectedContentError`.
+    """
+
+    async def attempt() -> httpx.Response:
+        return _check(source, await http_client.aget(url, **kwargs), content_type)
+
+    return await upstream(source).call(attempt)
+
+
+def get(source: str, url: str, content_type: str | None = None, **kwargs) -> httpx.Response:
+    """Blocking variant of :func:`aget` (breaker and retry budget, no hedging)."""
+
+    def attempt() -> httpx.Response:
+        return _check(source, http_client.get(url, **kwargs), content_type)
+
+    return upstream(source).call_sync(attempt)
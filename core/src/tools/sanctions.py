@@ -1,19 +1,31 @@
 #!/usr/bin/env python3
-"""Sanctions screening against OFAC SDN and UN lists."""
+"""Sanctions screening against OFAC SDN, UN and EU lists."""
 
+import asyncio
 import json
 import os
 import sys
 import time
 from typing import Any
 
-from . import weave_op, cuid
+from . import weave_op, instrumented, cuid
+from .matching import NameIndex
+from .watchlist import WatchlistStore
 
 TOOL_ID = "sanctions"
+SIMULATED_LATENCY = 0.5
 
-# TODO: Uncomment when ready to use real API (50 req/month limit)
-# OPENSANCTIONS_API = "https://api.opensanctions.org/search/default"
-# OPENSANCTIONS_KEY = os.getenv("OPENSANCTIONS_API_KEY")
+# Watchlist store built by ``python -m src.tools.watchlist ingest`` from the
+# OFAC/UN/EU bulk files; memory-mapped, so every worker shares one copy.
+SANCTIONS_STORE_PATH = os.getenv("SANCTIONS_STORE_PATH")
+# How often a worker checks the store's manifest for a newly ingested delta.
+SANCTIONS_STORE_REFRESH = float(os.getenv("SANCTIONS_STORE_REFRESH", "60"))
+
+# Optional .json/.jsonl/.csv watchlist (e.g. an OFAC SDN/UN/EU export with aliases)
+SANCTIONS_LIST_PATH = os.getenv("SANCTIONS_LIST_PATH")
+
+MATCH_THRESHOLD = 80
+POTENTIAL_THRESHOLD = 50
 
 SIMULATED_SANCTIONS = {
     "vladimir putin": {
@@ -49,23 +61,66 @@ SIMULATED_SANCTIONS = {
 }
 
 
-def normalize(name: str) -> str:
-    return name.lower().strip()
+_index: NameIndex | WatchlistStore | None = None
+_refreshed_at = 0.0
+# "<file> (<datasets>)" for a SANCTIONS_LIST_PATH list, worked out once when it is loaded.
+_list_sources: list[str] = []
+
+
+def get_index() -> NameIndex | WatchlistStore:
+    """Return the watchlist index, building (or, for a store, refreshing) it on first use."""
+    global _index, _refreshed_at, _list_sources
+    if isinstance(_index, WatchlistStore) and time.monotonic() - _refreshed_at > SANCTIONS_STORE_REFRESH:
+        _refreshed_at = time.monotonic()
+        _index.refresh()
+    if _index is None:
+        if SANCTIONS_STORE_PATH:
+            _index = WatchlistStore(SANCTIONS_STORE_PATH)
+            _refreshed_at = time.monotonic()
+        elif SANCTIONS_LIST_PATH:
+            _index = NameIndex.load(SANCTIONS_LIST_PATH)
+            datasets = sorted({d for entry in _index.entries for d in entry.get("datasets") or ()})
+            name = os.path.basename(SANCTIONS_LIST_PATH)
+            _list_sources = [f"{name} ({', '.join(datasets)})" if datasets else name]
+        else:
+            _index = NameIndex()
+            names: dict[str, list[str]] = {}
+            for key, data in SIMULATED_SANCTIONS.items():
+                names.setdefault(data["name"], []).append(key)
+            for keys in names.values():
+                _index.add(SIMULATED_SANCTIONS[keys[0]], names=keys)
+    return _index
+
+
+def _simulated() -> bool:
+    return not (SANCTIONS_STORE_PATH or SANCTIONS_LIST_PATH)
 
 
 @weave_op
+@instrumented
 def check(entity: str, entity_type: str = "Person") -> dict[str, Any]:
     """Check entity against sanctions databases."""
+    if _simulated():
+        time.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+@weave_op
+@instrumented
+async def acheck(entity: str, entity_type: str = "Person") -> dict[str, Any]:
+    """Check entity against sanctions databases without blocking the event loop."""
+    if _simulated():
+        await asyncio.sleep(SIMULATED_LATENCY)
+    return _evaluate(entity, entity_type)
+
+
+def _evaluate(entity: str, entity_type: str = "Person") -> dict[str, Any]:
     result_id = cuid()
     print(f"[{TOOL_ID}] Checking: {entity}", file=sys.stderr)
 
-    # TODO: Uncomment for real API
-    # findings = _search_opensanctions(entity)
+    findings = _search_index(entity)
+    sources = _sources()
 
-    # Simulated search
-    findings = _search_simulated(entity)
-
-    time.sleep(0.5)  # Simulate API latency
     print(f"[{TOOL_ID}] Found {len(findings)} results", file=sys.stderr)
 
     if not findings:
@@ -76,11 +131,11 @@ def check(entity: str, entity_type: str = "Person") -> dict[str, Any]:
             "status": "clear",
             "confidence": 90,
             "findings": [],
-            "sources": ["OpenSanctions (simulated)"],
+            "sources": sources,
         }
 
     max_score = max(f.get("score", 0) for f in findings)
-    status = "match" if max_score >= 80 else "potential" if max_score >= 50 else "clear"
+    status = "match" if max_score >= MATCH_THRESHOLD else "potential" if max_score >= POTENTIAL_THRESHOLD else "clear"
 
     return {
         "id": result_id,
@@ -89,48 +144,44 @@ def check(entity: str, entity_type: str = "Person") -> dict[str, Any]:
         "status": status,
         "confidence": max_score,
         "findings": findings,
-        "sources": ["OpenSanctions (simulated)"],
+        "sources": sources,
     }
 
 
-def _search_simulated(entity: str) -> list[dict]:
-    """Simulated sanctions search."""
-    normalized = normalize(entity)
-    for key, data in SIMULATED_SANCTIONS.items():
-        if key in normalized or normalized in key:
-            return [data]
-    return []
-
-
-# TODO: Uncomment for real OpenSanctions API
-# def _search_opensanctions(entity: str) -> list[dict]:
-#     """Search OpenSanctions API."""
-#     if not OPENSANCTIONS_KEY:
-#         return []
-#     try:
-#         r = httpx.get(
-#             OPENSANCTIONS_API,
-#             params={"q": entity, "limit": 5},
-#             headers={"Authorization": f"ApiKey {OPENSANCTIONS_KEY}"},
-#             timeout=30,
-#         )
-#         r.raise_for_status()
-#         data = r.json()
-#         results = []
-#         for res in data.get("results", []):
-#             results.append({
-#                 "name": res.get("caption", ""),
-#                 "schema": res.get("schema", ""),
-#                 "datasets": res.get("datasets", []),
-#                 "score": int(res.get("score", 0) * 100),
-#             })
-#         return results
-#     except Exception:
-#         return []
+def _sources() -> list[str]:
+    index = get_index()
+    if isinstance(index, WatchlistStore):
+        return [
+            f"{source.upper()} ({info['published']})" if info.get("published") else source.upper()
+            for source, info in sorted(index.sources.items())
+        ]
+    if SANCTIONS_LIST_PATH:
+        return _list_sources
+    return ["OpenSanctions (simulated)"]
+
+
+def _search_index(entity: str) -> list[dict]:
+    """Fuzzy search of the local watchlist index."""
+    findings = []
+    seen: set[str] = set()
+    for hit in get_index().search(entity, min_score=POTENTIAL_THRESHOLD):
+        entry = hit["entry"]
+        # Hits are one per index entry; a store may still hold one record in two segments.
+        if entry.get("uid"):
+            if entry["uid"] in seen:
+                continue
+            seen.add(entry["uid"])
+        finding = {k: v for k, v in entry.items() if k != "aliases"}
+        finding["score"] = hit["score"]
+        finding["matched_name"] = hit["matched"]
+        findings.append(finding)
+    return findings
 
 
 if __name__ == "__main__":
+    from .cache import cached
+
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python -m src.tools.sanctions 'Entity'"}))
         sys.exit(1)
-    print(json.dumps(check(sys.argv[1]), indent=2))
+    print(json.dumps(cached(TOOL_ID, check)(sys.argv[1]), indent=2))
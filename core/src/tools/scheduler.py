@@ -0,0 +1,121 @@
+"""Async fan-out scheduler for tool checks."""
+
+import asyncio
+import os
+from functools import partial
+from typing import Any, AsyncIterator
+
+from . import ATOOLS, progress_sink
+from .cache import ToolCache, tool_cache
+
+DEFAULT_TIMEOUT = float(os.getenv("SCOLO_TOOL_TIMEOUT", "20"))
+MAX_CONCURRENCY = int(os.getenv("SCOLO_TOOL_CONCURRENCY", "256"))
+
+TOOL_TIMEOUTS: dict[str, float] = {
+    "adverse_media": 15.0,
+    "business_registry": 15.0,
+    "geo_risk": 2.0,
+}
+
+
+class ToolTimeoutError(TimeoutError):
+    """Raised when a tool check exceeds its per-tool timeout."""
+
+    def __init__(self, tool_key: str, timeout: float):
+        super().__init__(f"{tool_key} timed out after {timeout:g}s")
+        self.tool_key = tool_key
+        self.timeout = timeout
+
+
+class ToolScheduler:
+    """Runs async tool checks under a shared concurrency cap and per-tool timeouts.
+
+    One scheduler is shared by every investigation in the process, so the cap
+    bounds the total number of in-flight tool checks rather than per project.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        timeouts: dict[str, float] | None = None,
+        cache: ToolCache | None = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self.timeouts = {**TOOL_TIMEOUTS, **(timeouts or {})}
+        self.cache = cache
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    def timeout_for(self, tool_key: str) -> float:
+        return self.timeouts.get(tool_key, self.default_timeout)
+
+    async def run(self, tool_key: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Run a single tool check, waiting for a free slot first.
+
+        With a cache configured, hits are returned without taking a slot and
+        every result carries a ``cache`` entry describing the lookup.
+        """
+        if self.cache is None:
+            return await self._run_uncached(tool_key, *args, **kwargs)
+        return await self.cache.acall(tool_key, partial(self._run_uncached, tool_key), *args, **kwargs)
+
+    async def _run_uncached(self, tool_key: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        timeout = self.timeout_for(tool_key)
+        async with self.semaphore:
+            try:
+                return await asyncio.wait_for(ATOOLS[tool_key](*args, **kwargs), timeout)
+            except asyncio.TimeoutError:
+                raise ToolTimeoutError(tool_key, timeout) from None
+
+    async def gather(self, calls: dict[str, tuple]) -> dict[str, dict | BaseException]:
+        """Run ``{tool_key: args}`` concurrently and return results (or exceptions) by key."""
+        keys = list(calls)
+        outcomes = await asyncio.gather(
+            *(self.run(key, *calls[key]) for key in keys),
+            return_exceptions=True,
+        )
+        return dict(zip(keys, outcomes))
+
+    async def as_completed(
+        self, calls: dict[str, tuple], progress: bool = False
+    ) -> AsyncIterator[tuple[str, dict | None, BaseException | None]]:
+        """Yield ``(tool_key, result, error)`` for each call as soon as it finishes.
+
+        With ``progress``, partial results that tools report while running
+        (see :func:`~src.tools.report_progress`) are yielded as they arrive,
+        marked ``"partial": True``, ahead of the tool's final result.
+        """
+        updates: asyncio.Queue[tuple[str, dict | None, BaseException | None]] = asyncio.Queue()
+
+        async def run_one(key: str) -> None:
+            if progress:
+                progress_sink.set(lambda partial: updates.put_nowait((key, {**partial, "partial": True}, None)))
+            try:
+                updates.put_nowait((key, await self.run(key, *calls[key]), None))
+            except Exception as e:
+                updates.put_nowait((key, None, e))
+
+        tasks = [asyncio.create_task(run_one(key)) for key in calls]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                key, result, error = await updates.get()
+                if result is None or not result.get("partial"):
+                    remaining -= 1
+                yield key, result, error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+scheduler = ToolScheduler(cache=tool_cache)
@@ -0,0 +1,27 @@
+"""Local sanctions watchlist: bulk-file parsers and a memory-mapped, delta-updated store.
+
+Build or update a store from the official publications (see
+:mod:`.parsers` for the download URLs)::
+
+    python -m src.tools.watchlist ingest --store /data/watchlist ofac SDN.XML
+    python -m src.tools.watchlist ingest --store /data/watchlist un consolidated.xml
+    python -m src.tools.watchlist ingest --store /data/watchlist eu eu_fsf.xml
+
+and point ``SANCTIONS_STORE_PATH`` at the directory. Re-running ``ingest``
+with the next day's files writes a small delta segment instead of
+rebuilding the store.
+"""
+
+from .parsers import PARSERS, SOURCE_PREFIXES
+from .segment import MappedNameIndex, Segment, write_segment
+from .store import WatchlistStore, record_digest
+
+__all__ = [
+    "PARSERS",
+    "SOURCE_PREFIXES",
+    "MappedNameIndex",
+    "Segment",
+    "WatchlistStore",
+    "record_digest",
+    "write_segment",
+]
@@ -0,0 +1,57 @@
+"""Command line for building and inspecting a watchlist store.
+
+Run from core/:
+    python -m src.tools.watchlist ingest --store DIR ofac SDN.XML
+    python -m src.tools.watchlist ingest --store DIR ofac-csv SDN.CSV ALT.CSV
+    python -m src.tools.watchlist compact --store DIR
+    python -m src.tools.watchlist stats --store DIR
+    python -m src.tools.watchlist search --store DIR "Vladimir Putin"
+"""
+
+import argparse
+import json
+import os
+import time
+
+from .parsers import PARSERS
+from .store import WatchlistStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.tools.watchlist")
+    store_path = os.getenv("SANCTIONS_STORE_PATH")
+    parser.add_argument("--store", default=store_path, required=not store_path)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="apply a full publication of one source as a delta")
+    ingest.add_argument("source", choices=sorted(PARSERS))
+    ingest.add_argument("paths", nargs="+")
+    ingest.add_argument("--published", help="publication date to record in the manifest")
+
+    commands.add_parser("compact", help="merge all segments into a new base")
+    commands.add_parser("stats", help="print the manifest and live record count")
+
+    search = commands.add_parser("search", help="screen a name against the store")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=5)
+
+    args = parser.parse_args()
+    store = WatchlistStore(args.store)
+
+    if args.command == "ingest":
+        started = time.perf_counter()
+        stats = store.ingest(args.source, PARSERS[args.source](*args.paths), published=args.published)
+        seconds = round(time.perf_counter() - started, 2)
+        print(json.dumps({**stats, "segments": len(store.segments), "seconds": seconds}))
+    elif args.command == "compact":
+        store.compact()
+        print(json.dumps({"segments": len(store.segments), "records": len(store)}))
+    elif args.command == "stats":
+        print(json.dumps({**store.manifest, "records": len(store)}, indent=2))
+    else:
+        for hit in store.search(args.query, limit=args.limit):
+            print(f"{hit['score']:>3}  {hit['entry']['uid']:<14} {hit['entry']['name']}  (matched {hit['matched']!r})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Parsers for the official sanctions bulk files.
+
+Each parser streams one publication and yields watchlist records::
+
+    {"uid": "ofac:36", "name": ..., "schema": "Person" | "Organization" | "Vessel" | "Aircraft",
+     "aliases": [...], "datasets": ["us_ofac_sdn"], "programs": [...], "countries": ["RU", ...]}
+
+``uid`` is stable across publications, which is what delta updates key on.
+Countries are mapped to ISO alpha-2 codes through the geo_risk index where
+possible. XML is read with ``iterparse`` and cleared as it goes, so a full
+list never sits in memory as a tree.
+
+Sources:
+    OFAC SDN   https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/SDN.XML
+               (or the legacy SDN.CSV + ALT.CSV pair)
+    UN SC      https://scsanctions.un.org/resources/xml/en/consolidated.xml
+    EU FSF     https://webgate.ec.europa.eu/fsd/fsf/public/files/xmlFullSanctionsList_1_1/content
+"""
+
+import csv
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Iterator
+
+from ..geo_risk import country_code
+
+OFAC_DATASET = "us_ofac_sdn"
+UN_DATASET = "un_sc_sanctions"
+EU_DATASET = "eu_fsf"
+
+OFAC_SCHEMAS = {"individual": "Person", "entity": "Organization", "vessel": "Vessel", "aircraft": "Aircraft"}
+EU_SCHEMAS = {"person": "Person", "enterprise": "Organization", "vessel": "Vessel", "aircraft": "Aircraft"}
+OFAC_CSV_NULL = "-0-"
+EU_UNKNOWN_COUNTRIES = frozenset({"", "00", "UNKNOWN"})
+
+Record = dict[str, Any]
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(elem: ET.Element, name: str) -> str:
+    for child in elem:
+        if _local(child.tag) == name:
+            return (child.text or "").strip()
+    return ""
+
+
+def _descendants(elem: ET.Element, name: str) -> Iterator[ET.Element]:
+    return (e for e in elem.iter() if _local(e.tag) == name)
+
+
+def _join(*parts: str) -> str:
+    return " ".join(p for p in parts if p)
+
+
+def _unique(values) -> list[str]:
+    return list(dict.fromkeys(v for v in values if v))
+
+
+def _record(uid: str, name: str, schema: str, dataset: str, aliases, programs, countries) -> Record:
+    return {
+        "uid": uid,
+        "name": name,
+        "schema": schema,
+        "aliases": [a for a in _unique(aliases) if a != name],
+        "datasets": [dataset],
+        "programs": _unique(programs),
+        "countries": _unique(country_code(c) for c in countries),
+    }
+
+
+def _iter_elements(path: Path | str, names: set[str]) -> Iterator[ET.Element]:
+    """Yield each complete element named in ``names``, clearing it after use."""
+    for _, elem in ET.iterparse(path, events=("end",)):
+        if _local(elem.tag) in names:
+            yield elem
+            elem.clear()
+
+
+def parse_ofac_xml(path: Path | str) -> Iterator[Record]:
+    """OFAC SDN list in the ``sdnList`` XML format (SDN.XML)."""
+    for entry in _iter_elements(path, {"sdnEntry"}):
+        schema = OFAC_SCHEMAS.get(_child_text(entry, "sdnType").lower(), "Organization")
+        name = _join(_child_text(entry, "firstName"), _child_text(entry, "lastName"))
+        aliases = [
+            _join(_child_text(aka, "firstName"), _child_text(aka, "lastName")) for aka in _descendants(entry, "aka")
+        ]
+        countries = [
+            _child_text(e, "country")
+            for tag in ("address", "nationality", "citizenship")
+            for e in _descendants(entry, tag)
+        ]
+        programs = [(p.text or "").strip() for p in _descendants(entry, "program")]
+        yield _record(f"ofac:{_child_text(entry, 'uid')}", name, schema, OFAC_DATASET, aliases, programs, countries)
+
+
+def _ofac_csv_name(name: str, schema: str) -> str:
+    """``"PUTIN, Vladimir Vladimirovich"`` -> ``"Vladimir Vladimirovich PUTIN"`` for individuals."""
+    if schema == "Person" and ", " in name:
+        last, first = name.split(", ", 1)
+        return f"{first} {last}"
+    return name
+
+
+def _csv_value(value: str) -> str:
+    value = value.strip()
+    return "" if value == OFAC_CSV_NULL else value
+
+
+def parse_ofac_csv(sdn_path: Path | str, alt_path: Path | str | None = None) -> Iterator[Record]:
+    """OFAC SDN list in the legacy SDN.CSV format, with aliases from ALT.CSV."""
+    aliases: dict[str, list[str]] = {}
+    if alt_path:
+        with open(alt_path, newline="", encoding="utf-8", errors="replace") as f:
+            for row in csv.reader(f):
+                if len(row) >= 4 and _csv_value(row[3]):
+                    aliases.setdefault(row[0].strip(), []).append(_csv_value(row[3]))
+
+    with open(sdn_path, newline="", encoding="utf-8", errors="replace") as f:
+        for row in csv.reader(f):
+            if len(row) < 4 or not row[0].strip().isdigit():
+                continue
+            ent_num = row[0].strip()
+            schema = OFAC_SCHEMAS.get(_csv_value(row[2]).lower(), "Organization")
+            name = _ofac_csv_name(_csv_value(row[1]), schema)
+            entry_aliases = [_ofac_csv_name(a, schema) for a in aliases.get(ent_num, [])]
+            programs = [p.strip(" []") for p in _csv_value(row[3]).split("] [")]
+            yield _record(f"ofac:{ent_num}", name, schema, OFAC_DATASET, entry_aliases, programs, [])
+
+
+def parse_un_xml(path: Path | str) -> Iterator[Record]:
+    """UN Security Council consolidated list (consolidated.xml)."""
+    for elem in _iter_elements(path, {"INDIVIDUAL", "ENTITY"}):
+        is_person = _local(elem.tag) == "INDIVIDUAL"
+        name = _join(*(_child_text(elem, f) for f in ("FIRST_NAME", "SECOND_NAME", "THIRD_NAME", "FOURTH_NAME")))
+        aliases = [(a.text or "").strip() for a in _descendants(elem, "ALIAS_NAME")]
+        aliases.append(_child_text(elem, "NAME_ORIGINAL_SCRIPT"))
+        countries = [
+            (v.text or "").strip() for n in _descendants(elem, "NATIONALITY") for v in _descendants(n, "VALUE")
+        ]
+        countries += [(c.text or "").strip() for c in _descendants(elem, "COUNTRY")]
+        yield _record(
+            f"un:{_child_text(elem, 'DATAID')}",
+            name,
+            "Person" if is_person else "Organization",
+            UN_DATASET,
+            aliases,
+            [_child_text(elem, "UN_LIST_TYPE")],
+            countries,
+        )
+
+
+def parse_eu_xml(path: Path | str) -> Iterator[Record]:
+    """EU Financial Sanctions Files consolidated list (XML 1.1)."""
+    for entity in _iter_elements(path, {"sanctionEntity"}):
+        subject = next(_descendants(entity, "subjectType"), None)
+        schema = EU_SCHEMAS.get(subject.get("code", "") if subject is not None else "", "Organization")
+        names = _unique(
+            (a.get("wholeName") or _join(a.get("firstName", ""), a.get("lastName", ""))).strip()
+            for a in _descendants(entity, "nameAlias")
+        )
+        if not names:
+            continue
+        countries = [
+            e.get("countryIso2Code") or e.get("countryDescription", "")
+            for tag in ("citizenship", "address", "birthdate")
+            for e in _descendants(entity, tag)
+        ]
+        countries = [c for c in countries if c not in EU_UNKNOWN_COUNTRIES]
+        programs = [r.get("programme", "") for r in _descendants(entity, "regulation")]
+        yield _record(f"eu:{entity.get('logicalId')}", names[0], schema, EU_DATASET, names[1:], programs, countries)
+
+
+PARSERS = {
+    "ofac": parse_ofac_xml,
+    "ofac-csv": parse_ofac_csv,
+    "un": parse_un_xml,
+    "eu": parse_eu_xml,
+}
+
+# uid prefix each source owns; a delta for one source never touches another's records.
+SOURCE_PREFIXES = {"ofac": "ofac:", "ofac-csv": "ofac:", "un": "un:", "eu": "eu:"}
@@ -0,0 +1,257 @@
+"""Columnar, memory-mapped watchlist segments.
+
+A segment file holds a set of watchlist records plus the inverted index the
+matcher needs, laid out as flat columns::
+
+    MAGIC | u32 header length | JSON header {column: [offset, length]} | columns...
+
+Strings are stored Arrow-style as a ``u32`` offsets column and a UTF-8 data
+column. Term dictionaries (tokens, phonetic keys, trigrams) are sorted string
+columns with a parallel postings-offsets column into one ``u32`` alias-id
+column, so a lookup is a binary search plus a slice. Readers ``mmap`` the
+file read-only: every worker process shares the same page-cache copy, and
+nothing is decoded until a query touches it.
+
+:class:`MappedNameIndex` exposes a segment through the same attributes
+:class:`~src.tools.matching.NameIndex` searches, so scoring is shared.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Iterable
+
+from ..matching import PHONETIC_VERSION, NameIndex, _Alias
+
+MAGIC = b"SCOLOWL1"
+U32 = "I"
+ENTRY_FIELDS = ("uid", "name", "schema", "aliases", "datasets", "programs", "countries", "digest")
+LIST_FIELDS = frozenset({"aliases", "datasets", "programs", "countries"})
+LIST_SEP = "\x1f"
+TERM_KINDS = {"token": "_by_token", "key": "_by_key", "gram": "_by_gram"}
+
+assert array(U32).itemsize == 4
+
+
+def _string_column(values: Iterable[str]) -> tuple[bytes, bytes]:
+    offsets = array(U32, [0])
+    data = bytearray()
+    for value in values:
+        data += value.encode("utf-8")
+        offsets.append(len(data))
+    return offsets.tobytes(), bytes(data)
+
+
+def write_segment(path: Path | str, records: Iterable[dict[str, Any]], tombstones: Iterable[str] = ()) -> int:
+    """Write ``records`` (each with a ``digest``) and ``tombstones`` to a new segment file.
+
+    Returns the number of records written. The file is written next to
+    ``path`` and renamed into place, so readers never see a partial segment.
+    """
+    index = NameIndex()
+    for record in records:
+        index.add(record)
+
+    columns: dict[str, bytes] = {}
+    for field in ENTRY_FIELDS:
+        values = (
+            LIST_SEP.join(entry.get(field) or ()) if field in LIST_FIELDS else str(entry.get(field) or "")
+            for entry in index.entries
+        )
+        columns[f"entry.{field}.offsets"], columns[f"entry.{field}.data"] = _string_column(values)
+
+    aliases = index._aliases
+    columns["alias.entry"] = array(U32, (a.entry_id for a in aliases)).tobytes()
+    columns["alias.text.offsets"], columns["alias.text.data"] = _string_column(a.text for a in aliases)
+    columns["alias.tokens.offsets"], columns["alias.tokens.data"] = _string_column(" ".join(a.tokens) for a in aliases)
+
+    for kind, attr in TERM_KINDS.items():
+        postings: dict[str, list[int]] = getattr(index, attr)
+        terms = sorted(postings)
+        offsets, ids = array(U32, [0]), array(U32)
+        for term in terms:
+            ids.extend(postings[term])
+            offsets.append(len(ids))
+        columns[f"{kind}.terms.offsets"], columns[f"{kind}.terms.data"] = _string_column(terms)
+        columns[f"{kind}.postings"] = offsets.tobytes()
+        columns[f"{kind}.ids"] = ids.tobytes()
+
+    columns["tombstones.offsets"], columns["tombstones.data"] = _string_column(sorted(set(tombstones)))
+
+    _write_columns(Path(path), columns, {"records": len(index.entries), "aliases": len(aliases)})
+    return len(index.entries)
+
+
+def _write_columns(path: Path, columns: dict[str, bytes], counts: dict[str, int]) -> None:
+    layout: dict[str, list[int]] = {}
+    position = 0
+    for name, blob in columns.items():
+        position += -position % 8
+        layout[name] = [position, len(blob)]
+        position += len(blob)
+    if position >= 2**32:
+        raise ValueError(f"Segment too large for u32 offsets: {position} bytes")
+
+    header = json.dumps(
+        {"byteorder": sys.byteorder, "phonetic": PHONETIC_VERSION, "counts": counts, "columns": layout}
+    ).encode()
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    base = len(prefix) + (-len(prefix) % 8)
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(prefix.ljust(base, b"\0"))
+        for name, blob in columns.items():
+            f.seek(base + layout[name][0])
+            f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class _Strings(Sequence):
+    """Read-only view of a string column."""
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.raw(i).decode("utf-8")
+
+    def raw(self, i: int) -> bytes:
+        return self._data[self._offsets[i]:self._offsets[i + 1]].tobytes()
+
+    def find(self, value: str) -> int | None:
+        """Index of ``value`` in a sorted column (UTF-8 byte order equals code point order)."""
+        target = value.encode("utf-8")
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.raw(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < len(self) and self.raw(lo) == target else None
+
+
+class _Postings:
+    """``term -> alias ids`` lookup with the ``dict.get`` interface NameIndex uses."""
+
+    def __init__(self, terms: _Strings, offsets: memoryview, ids: memoryview):
+        self._terms = terms
+        self._offsets = offsets
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def get(self, term: str, default=None):
+        i = self._terms.find(term)
+        if i is None:
+            return default
+        return self._ids[self._offsets[i]:self._offsets[i + 1]]
+
+
+class _Aliases(Sequence):
+    def __init__(self, entry_ids: memoryview, texts: _Strings, tokens: _Strings):
+        self._entry_ids = entry_ids
+        self._texts = texts
+        self._tokens = tokens
+
+    def __len__(self) -> int:
+        return len(self._entry_ids)
+
+    def __getitem__(self, i: int) -> _Alias:
+        return _Alias(self._entry_ids[i], self._texts[i], tuple(self._tokens[i].split()))
+
+
+class _Entries(Sequence):
+    def __init__(self, fields: dict[str, _Strings]):
+        self._fields = fields
+        self._uids = fields["uid"]
+
+    def __len__(self) -> int:
+        return len(self._uids)
+
+    def __getitem__(self, i: int) -> dict[str, Any]:
+        entry = {}
+        for field, column in self._fields.items():
+            if field == "digest":
+                continue
+            value = column[i]
+            entry[field] = [v for v in value.split(LIST_SEP) if v] if field in LIST_FIELDS else value
+        return entry
+
+    def uid(self, i: int) -> str:
+        return self._uids[i]
+
+    def digest(self, i: int) -> str:
+        return self._fields["digest"][i]
+
+
+class Segment:
+    """A read-only, memory-mapped segment file."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mm)
+        if view[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a watchlist segment")
+        (header_len,) = struct.unpack_from("<I", view, len(MAGIC))
+        header = json.loads(view[len(MAGIC) + 4:len(MAGIC) + 4 + header_len].tobytes())
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{self.path} was written on a {header['byteorder']}-endian host")
+        prefix = len(MAGIC) + 4 + header_len
+        base = prefix + (-prefix % 8)
+        self.counts: dict[str, int] = header["counts"]
+        # Key postings written by an older phonetic_key no longer match query keys.
+        self.stale_keys = header.get("phonetic") != PHONETIC_VERSION
+
+        def column(name: str, u32: bool = False) -> memoryview:
+            offset, length = header["columns"][name]
+            blob = view[base + offset:base + offset + length]
+            return blob.cast(U32) if u32 else blob
+
+        def strings(name: str) -> _Strings:
+            return _Strings(column(f"{name}.offsets", u32=True), column(f"{name}.data"))
+
+        self.entries = _Entries({field: strings(f"entry.{field}") for field in ENTRY_FIELDS})
+        self.aliases = _Aliases(column("alias.entry", u32=True), strings("alias.text"), strings("alias.tokens"))
+        self.postings = {
+            kind: _Postings(
+                strings(f"{kind}.terms"), column(f"{kind}.postings", u32=True), column(f"{kind}.ids", u32=True)
+            )
+            for kind in TERM_KINDS
+        }
+        tombstones = strings("tombstones")
+        self.tombstones = frozenset(tombstones[i] for i in range(len(tombstones)))
+        self.index = MappedNameIndex(self)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class MappedNameIndex(NameIndex):
+    """A :class:`NameIndex` whose entries and postings live in a mapped segment."""
+
+    def __init__(self, segment: Segment):
+        self.entries = segment.entries
+        self._aliases = segment.aliases
+        for kind, attr in TERM_KINDS.items():
+            setattr(self, attr, segment.postings[kind])
+        if segment.stale_keys:
+            self._by_key = {}
+
+    def add(self, entry: dict[str, Any], names: Iterable[str] = ()) -> int:
+        raise TypeError("Mapped segments are read-only; ingest a delta instead")
@@ -0,0 +1,154 @@
+"""On-disk watchlist made of a base segment plus daily delta segments.
+
+``manifest.json`` lists the live segments oldest first. Ingesting a new
+publication of one source (OFAC, UN or EU) diffs it against the live
+records of that source by ``uid`` and content digest and writes only the
+difference as a new delta segment: added and changed records, plus
+tombstones for changed and removed uids. A record in one segment is hidden
+by a tombstone for its uid in any later segment. Once more than
+``max_deltas`` deltas pile up, everything is compacted into a fresh base.
+
+Writers replace the manifest atomically and never modify a segment in
+place; readers call :meth:`WatchlistStore.refresh` to pick up a new manifest.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .parsers import SOURCE_PREFIXES
+from .segment import Segment, write_segment
+
+MANIFEST = "manifest.json"
+MAX_DELTAS = int(os.getenv("SANCTIONS_STORE_MAX_DELTAS", "30"))
+
+
+def record_digest(record: dict[str, Any]) -> str:
+    content = {k: v for k, v in record.items() if k != "digest"}
+    return hashlib.blake2b(json.dumps(content, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+
+class WatchlistStore:
+    """Searchable view over the live segments of a watchlist directory."""
+
+    def __init__(self, root: Path | str, max_deltas: int = MAX_DELTAS):
+        self.root = Path(root)
+        self.max_deltas = max_deltas
+        self.manifest: dict[str, Any] = {"generation": 0, "segments": [], "sources": {}}
+        self.segments: list[Segment] = []
+        self._hidden: list[frozenset[str]] = []
+        self._manifest_stamp: tuple[int, int] | None = None
+        self.refresh()
+
+    @property
+    def sources(self) -> dict[str, dict[str, Any]]:
+        return self.manifest["sources"]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._live())
+
+    def refresh(self) -> bool:
+        """Reopen the segments if the manifest changed; returns True if it did."""
+        path = self.root / MANIFEST
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+        # The manifest is replaced, never rewritten, so a new inode means a new manifest.
+        stamp = (stat.st_ino, stat.st_mtime_ns)
+        if stamp == self._manifest_stamp:
+            return False
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        segments = [Segment(self.root / s["file"]) for s in manifest["segments"]]
+        hidden: list[frozenset[str]] = []
+        later: frozenset[str] = frozenset()
+        for segment in reversed(segments):
+            hidden.append(later)
+            later = later | segment.tombstones
+        self.manifest, self.segments, self._hidden = manifest, segments, hidden[::-1]
+        self._manifest_stamp = stamp
+        return True
+
+    def search(self, query: str, limit: int = 5, min_score: int = 50) -> list[dict[str, Any]]:
+        """Search every live segment; same hit format as :meth:`NameIndex.search`."""
+        hits = []
+        for segment, hidden in zip(self.segments, self._hidden):
+            # Over-fetch a little so superseded records do not crowd out live ones.
+            for hit in segment.index.search(query, limit=limit + min(len(hidden), limit * 4), min_score=min_score):
+                if hit["entry"]["uid"] not in hidden:
+                    hits.append(hit)
+        hits.sort(key=lambda hit: -hit["score"])
+        return hits[:limit]
+
+    def records(self, prefix: str = "") -> Iterator[dict[str, Any]]:
+        """Yield every live record (with its digest) whose uid starts with ``prefix``."""
+        for segment, i in self._live(prefix):
+            yield {**segment.entries[i], "digest": segment.entries.digest(i)}
+
+    def ingest(self, source: str, records: Iterable[dict[str, Any]], published: str | None = None) -> dict[str, int]:
+        """Bring ``source``'s records in line with a full publication, writing only the difference."""
+        prefix = SOURCE_PREFIXES[source]
+        live = {segment.entries.uid(i): segment.entries.digest(i) for segment, i in self._live(prefix)}
+
+        incoming: dict[str, dict[str, Any]] = {}
+        for record in records:
+            if not record["uid"].startswith(prefix):
+                raise ValueError(f"Record {record['uid']!r} does not belong to source {source!r}")
+            incoming[record["uid"]] = {**record, "digest": record_digest(record)}
+
+        changed = [r for uid, r in incoming.items() if live.get(uid) != r["digest"]]
+        removed = [uid for uid in live if uid not in incoming]
+        stats = {
+            "added": sum(1 for r in changed if r["uid"] not in live),
+            "updated": sum(1 for r in changed if r["uid"] in live),
+            "removed": len(removed),
+            "total": len(incoming),
+        }
+        source_info = {
+            prefix.rstrip(":"): {"records": len(incoming), "published": published, "ingested_at": time.time()}
+        }
+        if changed or removed:
+            tombstones = removed + [r["uid"] for r in changed if r["uid"] in live]
+            kind = "delta" if self.segments else "base"
+            self._commit(self.manifest["segments"] + [self._write(kind, changed, tombstones)], source_info)
+            if len(self.segments) - 1 > self.max_deltas:
+                self.compact()
+        else:
+            self._commit(self.manifest["segments"], source_info)
+        return stats
+
+    def compact(self) -> None:
+        """Merge all live records into a single new base segment."""
+        old = [self.root / s["file"] for s in self.manifest["segments"]]
+        self._commit([self._write("base", self.records(), ())], {})
+        for path in old:
+            path.unlink(missing_ok=True)
+
+    def _live(self, prefix: str = "") -> Iterator[tuple[Segment, int]]:
+        for segment, hidden in zip(self.segments, self._hidden):
+            for i in range(len(segment)):
+                uid = segment.entries.uid(i)
+                if uid.startswith(prefix) and uid not in hidden:
+                    yield segment, i
+
+    def _write(self, kind: str, records: Iterable[dict[str, Any]], tombstones: Iterable[str]) -> dict[str, Any]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        generation = self.manifest["generation"] + 1
+        self.manifest["generation"] = generation
+        name = f"{generation:06d}.{kind}.seg"
+        count = write_segment(self.root / name, records, tombstones)
+        return {"file": name, "kind": kind, "records": count, "created_at": time.time()}
+
+    def _commit(self, segments: list[dict[str, Any]], sources: dict[str, dict[str, Any]]) -> None:
+        manifest = {
+            "generation": self.manifest["generation"],
+            "segments": segments,
+            "sources": {**self.manifest["sources"], **sources},
+        }
+        tmp = self.root / f"{MANIFEST}.tmp"
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp, self.root / MANIFEST)
+        self.refresh()
@@ -0,0 +1,180 @@
+"""Background writer for per-project JSONL trace logs.
+
+``ClaudeService`` logs every agent message. Doing the open/append/close on the
+event loop showed up as SSE jitter, so entries are queued here and a writer
+thread serializes them, batches writes, keeps recently used files open and
+rotates files that grow past a size limit.
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import IO
+
+from src.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+MAX_QUEUE = int(os.getenv("TRACE_LOG_MAX_QUEUE", "10000"))
+MAX_OPEN_FILES = int(os.getenv("TRACE_LOG_MAX_OPEN_FILES", "64"))
+MAX_FILE_BYTES = int(os.getenv("TRACE_LOG_MAX_BYTES", str(50 * 1024 * 1024)))
+COMPRESS_ROTATED = os.getenv("TRACE_LOG_COMPRESS", "1") != "0"
+FLUSH_INTERVAL = 0.1
+BATCH_SIZE = 512
+
+# Entry types that may be dropped under back-pressure; everything else is lifecycle.
+DROPPABLE_TYPES = frozenset({"message", "trace"})
+
+
+class TraceWriter:
+    """Bounded, batched, thread-backed JSONL writer.
+
+    When the queue is full, new ``message`` entries are dropped first; a
+    lifecycle entry (prompt, tool_result, complete, error, ...) evicts the
+    oldest queued droppable entry instead. Lifecycle entries are only dropped
+    once the queue holds twice ``max_queue`` of them.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        max_queue: int = MAX_QUEUE,
+        max_open_files: int = MAX_OPEN_FILES,
+        max_bytes: int = MAX_FILE_BYTES,
+        compress_rotated: bool = COMPRESS_ROTATED,
+    ):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.max_queue = max_queue
+        self.max_open_files = max_open_files
+        self.max_bytes = max_bytes
+        self.compress_rotated = compress_rotated
+        self.dropped = 0
+        self._queue: deque[tuple[str, str | None, dict | str]] = deque()
+        self._droppable_queued = 0
+        self._cond = threading.Condition()
+        self._files: OrderedDict[str, IO[str]] = OrderedDict()
+        self._closed = False
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread: threading.Thread | None = None
+
+    def path_for(self, project_id: str) -> Path:
+        return self.log_dir / f"{project_id}.jsonl"
+
+    def write(self, project_id: str, entry: dict) -> bool:
+        """Queue ``entry`` for ``project_id``; returns False if it was dropped."""
+        return self._enqueue(project_id, entry.get("type"), entry)
+
+    def write_line(self, project_id: str, entry_type: str, line: str) -> bool:
+        """Queue an entry the caller already serialized to a single JSON line."""
+        return self._enqueue(project_id, entry_type, line)
+
+    def _enqueue(self, project_id: str, entry_type: str | None, entry: dict | str) -> bool:
+        droppable = entry_type in DROPPABLE_TYPES
+        with self._cond:
+            if len(self._queue) >= self.max_queue:
+                if droppable or not self._evict_droppable():
+                    if droppable or len(self._queue) >= 2 * self.max_queue:
+                        self.dropped += 1
+                        return False
+            self._queue.append((project_id, entry_type, entry))
+            self._droppable_queued += droppable
+            self._idle.clear()
+            self._ensure_thread()
+            if len(self._queue) >= BATCH_SIZE:
+                self._cond.notify()
+        return True
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until everything queued so far is on disk."""
+        with self._cond:
+            if self._thread is None:
+                return
+            self._cond.notify()
+        self._idle.wait(timeout)
+
+    def close(self) -> None:
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._close_files()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="trace-writer", daemon=True)
+            self._thread.start()
+
+    def _evict_droppable(self) -> bool:
+        if not self._droppable_queued:
+            return False
+        for i, (_, entry_type, _) in enumerate(self._queue):
+            if entry_type in DROPPABLE_TYPES:
+                del self._queue[i]
+                self._droppable_queued -= 1
+                self.dropped += 1
+                return True
+        return False
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._queue:
+                    self._idle.set()
+                    if self._closed:
+                        return
+                    self._cond.wait(FLUSH_INTERVAL)
+                    continue
+                batch = [self._queue.popleft() for _ in range(min(BATCH_SIZE, len(self._queue)))]
+                self._droppable_queued -= sum(1 for _, t, _ in batch if t in DROPPABLE_TYPES)
+            try:
+                self._write_batch(batch)
+            except Exception:
+                logger.exception("Failed to write %d trace entries", len(batch))
+
+    def _write_batch(self, batch: list[tuple[str, str | None, dict | str]]) -> None:
+        lines: dict[str, list[str]] = {}
+        for project_id, _, entry in batch:
+            line = entry if isinstance(entry, str) else dumps(entry)
+            lines.setdefault(project_id, []).append(line + "\n")
+        for project_id, project_lines in lines.items():
+            f = self._file(project_id)
+            f.writelines(project_lines)
+            f.flush()
+            if f.tell() >= self.max_bytes:
+                self._rotate(project_id)
+
+    def _file(self, project_id: str) -> IO[str]:
+        f = self._files.get(project_id)
+        if f is not None:
+            self._files.move_to_end(project_id)
+            return f
+        while len(self._files) >= self.max_open_files:
+            _, oldest = self._files.popitem(last=False)
+            oldest.close()
+        f = open(self.path_for(project_id), "a", encoding="utf-8")
+        self._files[project_id] = f
+        return f
+
+    def _rotate(self, project_id: str) -> None:
+        self._files.pop(project_id).close()
+        path = self.path_for(project_id)
+        rotated = path.with_name(f"{project_id}.{int(time.time() * 1000)}.jsonl")
+        path.rename(rotated)
+        if self.compress_rotated:
+            with open(rotated, "rb") as src, gzip.open(f"{rotated}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            rotated.unlink()
+
+    def _close_files(self) -> None:
+        while self._files:
+            _, f = self._files.popitem()
+            f.close()
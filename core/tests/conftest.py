@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def trace_writer(tmp_path, monkeypatch):
+    """Send trace logs to a per-test directory instead of core/logs/."""
+    from src import claude_service
+    from src.trace_log import TraceWriter
+
+    writer = TraceWriter(tmp_path / "logs")
+    monkeypatch.setattr(claude_service, "trace_writer", writer)
+    yield writer
+    writer.close()
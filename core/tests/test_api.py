@@ -1,6 +1,10 @@
+import re
+
+import pytest
 from fastapi.testclient import TestClient
 
 from src.api.main import app
+from src.store import project_store
 
 client = TestClient(app)
 
@@ -49,3 +53,240 @@ class TestProjectsAPI:
         assert response.status_code == 200
         data = response.json()
         assert data["tools"] == ["sanctions", "pep_check"]
+
+
+class TestProjectStores:
+    def test_memory_store_evicts_finished_projects(self):
+        from src.store import MemoryProjectStore
+
+        store = MemoryProjectStore(ttl=0)
+        store.create("a", {"id": "a", "status": "completed", "started_at": 1})
+        store.create("b", {"id": "b", "status": "running", "started_at": 2})
+        assert store.get("a") is None
+        assert store.get("b")["status"] == "running"
+
+    def test_sqlite_store_is_shared_between_instances(self, tmp_path):
+        from src.store import SQLiteProjectStore
+
+        path = str(tmp_path / "projects.db")
+        writer, reader = SQLiteProjectStore(path), SQLiteProjectStore(path)
+        try:
+            writer.create("p1", {"id": "p1", "entity_name": "Acme", "status": "pending", "started_at": 1})
+            assert reader.get("p1")["entity_name"] == "Acme"
+
+            writer.update("p1", {"status": "running"})
+            assert writer.get("p1")["status"] == "running"
+            writer.flush()
+            assert reader.get("p1")["status"] == "running"
+            assert [p["id"] for p in reader.list(status="running")] == ["p1"]
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_sqlite_store_lets_one_worker_claim_a_run(self, tmp_path):
+        import time
+
+        from src.store import SQLiteProjectStore
+
+        path = str(tmp_path / "projects.db")
+        first, second = SQLiteProjectStore(path), SQLiteProjectStore(path)
+        try:
+            first.create("p1", {"id": "p1", "entity_name": "Acme", "status": "pending", "started_at": 1})
+            assert first.claim_run("p1", "worker-1", lease=30)
+            assert first.claim_run("p1", "worker-1", lease=30)
+            assert not second.claim_run("p1", "worker-2", lease=30)
+
+            time.sleep(0.01)
+            assert second.claim_run("p1", "worker-2", lease=0)  # worker-1's heartbeat has expired
+            second.update("p1", {"status": "completed"})
+            second.flush()
+            assert not first.claim_run("p1", "worker-1", lease=0)
+        finally:
+            first.close()
+            second.close()
+
+    def test_buffered_updates_do_not_read_the_project_back(self, tmp_path, monkeypatch):
+        from src.store import SQLiteProjectStore
+
+        store = SQLiteProjectStore(str(tmp_path / "projects.db"))
+        try:
+            store.create("p1", {"id": "p1", "entity_name": "Acme", "status": "pending", "started_at": 1})
+            monkeypatch.setattr(store, "_select", lambda project_id: pytest.fail("read before a buffered update"))
+            assert store.update("p1", {"status": "running"})["entity_name"] == "Acme"
+            assert store.update("p1", {"risk_level": "low"})["status"] == "running"
+        finally:
+            store.close()
+
+    def test_sqlite_store_appends_events_by_position(self, tmp_path):
+        from src.store import SQLiteProjectStore
+
+        store = SQLiteProjectStore(str(tmp_path / "projects.db"))
+        try:
+            store.create("p1", {"id": "p1", "entity_name": "Acme", "status": "running", "started_at": 1})
+            assert store.load_events("p1") is None
+            store.append_events("p1", 0, ["a", "b"])
+            store.append_events("p1", 1, ["b", "c"])
+            assert store.load_events("p1") == ["a", "b", "c"]
+            assert store.load_events("p1", after=2) == ["c"]
+        finally:
+            store.close()
+
+    def test_list_projects_endpoint(self):
+        start_response = client.post("/api/projects/start", json={"entity_name": "Listed Company"})
+        project_id = start_response.json()["project_id"]
+
+        response = client.get("/api/projects", params={"status": "pending"})
+        assert response.status_code == 200
+        assert project_id in [p["id"] for p in response.json()]
+
+
+class TestProjectStreams:
+    def test_stream_resumes_and_replays_without_rerunning(self, monkeypatch):
+        from src.claude_service import claude_service
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.setattr(claude_service, "api_key", None)
+        runs = []
+        run_project = claude_service.run_project
+
+        async def counting_run_project(**kwargs):
+            runs.append(kwargs["project_id"])
+            async for chunk in run_project(**kwargs):
+                yield chunk
+
+        monkeypatch.setattr(claude_service, "run_project", counting_run_project)
+
+        with TestClient(app) as live_client:
+            project_id = live_client.post("/api/projects/start", json={
+                "entity_name": "Vladimir Putin",
+                "tools": ["sanctions", "geo_risk"],
+                "mode": "direct",
+            }).json()["project_id"]
+
+            first = live_client.get(f"/api/projects/{project_id}/stream").text
+            ids = [int(i) for i in re.findall(r"^id: (\d+)$", first, re.M)]
+            assert ids == list(range(1, len(ids) + 1))
+            assert "project_complete" in first
+
+            resumed = live_client.get(f"/api/projects/{project_id}/stream", headers={"Last-Event-ID": "2"}).text
+            assert [int(i) for i in re.findall(r"^id: (\d+)$", resumed, re.M)] == ids[2:]
+
+            project_store.flush()
+            assert project_store.get(project_id)["status"] == "completed"
+            assert project_store.load_events(project_id)
+
+        assert runs == [project_id]
+
+    def test_start_can_run_without_a_viewer(self, monkeypatch):
+        import time
+
+        from src.claude_service import claude_service
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.setattr(claude_service, "api_key", None)
+        with TestClient(app) as live_client:
+            project_id = live_client.post("/api/projects/start", json={
+                "entity_name": "Acme Holdings",
+                "tools": ["geo_risk"],
+                "country": "Iran",
+                "mode": "direct",
+                "run": True,
+            }).json()["project_id"]
+
+            deadline = time.monotonic() + 5
+            while project_store.get(project_id)["status"] != "completed" and time.monotonic() < deadline:
+                live_client.get("/health")
+                time.sleep(0.05)
+
+            project = project_store.get(project_id)
+            assert project["status"] == "completed"
+            assert project["risk_level"] == "high"
+
+            replay = live_client.get(f"/api/projects/{project_id}/stream").text
+            assert "project_complete" in replay
+
+    async def test_other_worker_tails_the_run_instead_of_starting_one(self, tmp_path, monkeypatch):
+        import asyncio
+
+        from src import runs
+        from src.claude_service import format_sse_event
+        from src.events import EventHub
+        from src.jobs import JobScheduler
+        from src.store import SQLiteProjectStore
+
+        monkeypatch.setattr(runs, "RUN_HEARTBEAT", 0.01)
+        release = asyncio.Event()
+        started = []
+
+        class Service:
+            async def run_project(self, project_id, **kwargs):
+                started.append(project_id)
+                yield format_sse_event("project_start", project_id)
+                await release.wait()
+                yield format_sse_event("project_complete", project_id, payload={
+                    "risk_level": "low", "total_findings": 0, "tools_completed": 0,
+                })
+
+        path = str(tmp_path / "projects.db")
+        stores = SQLiteProjectStore(path), SQLiteProjectStore(path)
+        owner, other = (runs.RunManager(EventHub(store), store, JobScheduler(), Service()) for store in stores)
+        try:
+            stores[0].create("p1", {
+                "id": "p1", "entity_name": "Acme", "entity_type": "company", "tools": [], "status": "pending",
+                "started_at": 1,
+            })
+            assert owner.start("p1") is not None
+            assert other.start("p1") is None
+
+            tail = other.tail("p1")
+            assert '"type": "project_start"' in await anext(tail)
+            release.set()
+            rest = [chunk async for chunk in tail]
+            assert rest[-1].startswith("id: 2\n") and '"type": "project_complete"' in rest[-1]
+            assert started == ["p1"]
+        finally:
+            for store in stores:
+                store.close()
+
+    async def test_gzip_events_flushes_each_event(self):
+        import zlib
+
+        from src.events import gzip_events
+
+        async def chunks():
+            yield "data: {\"type\": \"project_start\"}\n\n"
+            yield "data: {\"type\": \"project_complete\"}\n\n"
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        parts = [decompressor.decompress(part) async for part in gzip_events(chunks())]
+        assert parts[0] == b'data: {"type": "project_start"}\n\n'
+        assert b"".join(parts).count(b"data: ") == 2
+
+
+class TestMetricsEndpoint:
+    def test_tool_histograms_and_status_counters(self):
+        from src.tools import geo_risk
+
+        geo_risk.check("Russia")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        lines = response.text.splitlines()
+        assert "# TYPE scolo_tool_duration_seconds histogram" in lines
+        assert any(line.startswith('scolo_tool_duration_seconds_bucket{tool="geo_risk",le="+Inf"} ') for line in lines)
+        assert any(line.startswith('scolo_tool_results_total{tool="geo_risk",status="high"} ') for line in lines)
+        assert any(line.startswith("scolo_sessions_queued ") for line in lines)
+
+    def test_histogram_buckets_are_cumulative(self):
+        from src.metrics import Histogram
+
+        histogram = Histogram("h_seconds", "test", ["tool"], buckets=(0.1, 1))
+        for value in (0.05, 0.5, 0.5, 3):
+            histogram.observe(value, "x")
+        assert histogram.render()[2:] == [
+            'h_seconds_bucket{tool="x",le="0.1"} 1',
+            'h_seconds_bucket{tool="x",le="1"} 3',
+            'h_seconds_bucket{tool="x",le="+Inf"} 4',
+            'h_seconds_sum{tool="x"} 4.05',
+            'h_seconds_count{tool="x"} 4',
+        ]
@@ -0,0 +1,104 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+
+client = TestClient(app)
+
+
+def read_ndjson(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+class TestBatchesAPI:
+    def test_json_batch_streams_each_entity(self):
+        response = client.post("/api/batches", json={
+            "entities": [
+                {"entity_name": "Kim Jong Un", "country": "North Korea"},
+                {"entity_name": "Plain Bakery Ltd", "country": "Germany"},
+            ],
+            "tools": ["sanctions", "geo_risk"],
+        })
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        rows = read_ndjson(response)
+        results = {r["entity_name"]: r for r in rows if r["type"] == "entity_result"}
+        assert results["Kim Jong Un"]["risk_level"] == "high"
+        assert results["Kim Jong Un"]["results"]["sanctions"]["status"] == "match"
+        assert results["Plain Bakery Ltd"]["results"]["geo_risk"]["status"] == "low"
+
+        summary = rows[-1]
+        assert summary["type"] == "batch_complete"
+        assert summary["entities"] == 2
+        assert summary["risk_levels"]["high"] == 1
+
+    def test_csv_upload(self):
+        csv_body = "name,country,reference\nSergei Lavrov,Russia,cust-1\nAcme Widgets,US,cust-2\n"
+        response = client.post(
+            "/api/batches",
+            files={"file": ("customers.csv", csv_body, "text/csv")},
+            data={"tools": "sanctions,geo_risk", "format": "sse"},
+        )
+        assert response.status_code == 200
+        events = [json.loads(chunk.removeprefix("data: ")) for chunk in response.text.split("\n\n") if chunk]
+        by_ref = {e["payload"]["reference"]: e["payload"] for e in events if e["type"] == "entity_result"}
+        assert by_ref["cust-1"]["risk_level"] == "high"
+        assert by_ref["cust-2"]["results"]["sanctions"]["status"] == "clear"
+        assert events[-1]["type"] == "batch_complete"
+
+    def test_rejects_invalid_body(self):
+        response = client.post("/api/batches", json={"tools": ["sanctions"]})
+        assert response.status_code == 422
+
+    def test_rejects_unknown_tools(self):
+        response = client.post("/api/batches", json={
+            "entities": [{"entity_name": "Acme"}],
+            "tools": ["sanctions", "horoscope"],
+        })
+        assert response.status_code == 400
+        assert "horoscope" in response.json()["detail"]
+
+    def test_oversized_batches(self, monkeypatch):
+        from src import batch_service
+        from src.api.routes import batches
+
+        monkeypatch.setattr(batches, "MAX_BATCH_ENTITIES", 1)
+        response = client.post("/api/batches", json={
+            "entities": [{"entity_name": "Acme"}, {"entity_name": "Globex"}],
+            "tools": ["geo_risk"],
+        })
+        assert response.status_code == 413
+
+        monkeypatch.setattr(batch_service, "MAX_BATCH_ENTITIES", 1)
+        response = client.post(
+            "/api/batches",
+            files={"file": ("customers.csv", "name\nAcme\nGlobex\nInitech\n", "text/csv")},
+            data={"tools": "geo_risk"},
+        )
+        summary = read_ndjson(response)[-1]
+        assert (summary["entities"], summary["truncated"]) == (1, 2)
+
+    def test_failed_tool_makes_the_risk_incomplete(self, monkeypatch):
+        from src.tools.scheduler import scheduler
+
+        async def gather(calls):
+            return {"sanctions": RuntimeError("upstream down"), "geo_risk": {"status": "low", "findings": []}}
+
+        monkeypatch.setattr(scheduler, "gather", gather)
+        response = client.post("/api/batches", json={
+            "entities": [{"entity_name": "Acme", "country": "US"}],
+            "tools": ["sanctions", "geo_risk"],
+        })
+        result, summary = read_ndjson(response)
+        assert result["risk_level"] == "incomplete"
+        assert result["errors"] == {"sanctions": "upstream down"}
+        assert summary["risk_levels"] == {"high": 0, "medium": 0, "low": 0, "incomplete": 1}
+
+    def test_rejects_non_utf8_upload(self):
+        response = client.post(
+            "/api/batches",
+            files={"file": ("customers.csv", "name\nSoci\xe9t\xe9 G\xe9n\xe9rale\n".encode("latin-1"), "text/csv")},
+        )
+        assert response.status_code == 400
@@ -0,0 +1,257 @@
+import json
+
+from src.claude_service import (
+    ClaudeService,
+    build_trace_message,
+    detect_tool_from_command,
+    detect_tools_from_command,
+    format_sse_event,
+    iter_json_objects,
+    parse_sse_event,
+    parse_tool_result,
+    parse_tool_results,
+    sse_event_type,
+)
+
+
+def parse_events(chunks: list[str]) -> list[dict]:
+    return [json.loads(chunk.removeprefix("data: ")) for chunk in chunks]
+
+
+class TestDirectMode:
+    async def test_runs_tools_in_process(self, monkeypatch):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        service = ClaudeService()
+        tools = [
+            {"id": "t1", "key": "sanctions", "name": "Sanctions Check"},
+            {"id": "t2", "key": "geo_risk", "name": "Geographic Risk"},
+        ]
+
+        chunks = [
+            chunk async for chunk in service.run_project(
+                "proj-direct", "Vladimir Putin", "individual", tools, country="Russia", mode="direct"
+            )
+        ]
+        events = parse_events(chunks)
+
+        assert events[0]["type"] == "project_start"
+        assert [e["agent_id"] for e in events if e["type"] == "agent_start"] == ["t1", "t2"]
+        completed = {e["payload"]["tool_key"]: e["payload"] for e in events if e["type"] == "agent_complete"}
+        assert completed["sanctions"]["status"] == "match"
+        assert completed["geo_risk"]["status"] == "high"
+        assert events[-1]["type"] == "project_complete"
+        assert events[-1]["payload"]["risk_level"] == "high"
+        assert "summary" not in events[-1]["payload"]
+
+    async def test_early_exit_skips_low_priority_tools(self, monkeypatch):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        tools = [
+            {"id": "t1", "key": "sanctions", "name": "Sanctions Check"},
+            {"id": "t2", "key": "social_media", "name": "Social Media"},
+        ]
+
+        chunks = [
+            chunk async for chunk in ClaudeService().run_project(
+                "proj-early", "Vladimir Putin", "individual", tools, mode="direct", early_exit="cancel"
+            )
+        ]
+        events = parse_events(chunks)
+        types = [e["type"] for e in events]
+
+        assert types.index("risk_update") < types.index("project_complete")
+        update = next(e for e in events if e["type"] == "risk_update")
+        assert update["payload"]["risk_level"] == "high"
+        assert update["payload"]["decided_by"] == "sanctions"
+        skipped = next(e for e in events if e.get("agent_id") == "t2" and e["type"] == "agent_complete")
+        assert skipped["payload"]["skipped"] is True
+        assert events[-1]["payload"]["tools_completed"] == 1
+
+
+class TestTraceWriter:
+    def test_batches_entries_per_project(self, tmp_path):
+        from src.trace_log import TraceWriter
+
+        writer = TraceWriter(tmp_path)
+        for i in range(3):
+            writer.write("p1", {"type": "message", "n": i})
+        writer.write("p2", {"type": "complete"})
+        writer.flush()
+
+        lines = (tmp_path / "p1.jsonl").read_text().splitlines()
+        assert [json.loads(line)["n"] for line in lines] == [0, 1, 2]
+        assert (tmp_path / "p2.jsonl").exists()
+        writer.close()
+
+    def test_drops_trace_before_lifecycle(self, tmp_path):
+        from src.trace_log import TraceWriter
+
+        writer = TraceWriter(tmp_path, max_queue=2)
+        writer._ensure_thread = lambda: None
+        assert writer.write("p", {"type": "message", "n": 1})
+        assert writer.write("p", {"type": "message", "n": 2})
+        assert not writer.write("p", {"type": "message", "n": 3})
+        assert writer.write("p", {"type": "complete"})
+        assert [e["type"] for _, _, e in writer._queue] == ["message", "complete"]
+        assert writer.dropped == 2
+
+    def test_rotates_and_compresses(self, tmp_path):
+        from src.trace_log import TraceWriter
+
+        writer = TraceWriter(tmp_path, max_bytes=100)
+        writer.write("p", {"type": "complete", "payload": "x" * 200})
+        writer.flush()
+        writer.close()
+        assert list(tmp_path.glob("p.*.jsonl.gz"))
+
+
+class TestTraceEvents:
+    MESSAGE = {
+        "model": "claude-sonnet-4-5",
+        "usage": {"input_tokens": 1200},
+        "content": [
+            {"text": "Running the screening tools now."},
+            {"id": "tu1", "name": "Bash", "input": {"command": 'python -m src.tools.sanctions "X"', "timeout": 60}},
+            {"tool_use_id": "tu1", "content": "y" * 5000, "is_error": False},
+            {"thinking": "...", "signature": "sig"},
+        ],
+    }
+
+    def test_summary_keeps_only_what_the_canvas_reads(self):
+        trace = build_trace_message(self.MESSAGE, "summary", max_text=100)
+        assert trace == {
+            "model": "claude-sonnet-4-5",
+            "content": [
+                {"text": "Running the screening tools now."},
+                {"id": "tu1", "name": "Bash", "input": {"command": 'python -m src.tools.sanctions "X"'}},
+                {"tool_use_id": "tu1", "is_error": False},
+            ],
+        }
+        assert build_trace_message(self.MESSAGE, "off") is None
+
+    def test_full_truncates_long_strings(self):
+        trace = build_trace_message(self.MESSAGE, "full", max_text=100)
+        assert trace["usage"] == {"input_tokens": 1200}
+        assert trace["content"][2]["content"].startswith("y" * 100 + "... [4900 chars")
+
+    def test_preencoded_payload_matches_format_sse_event(self):
+        payload = {"message": {"content": [{"text": "hi"}]}}
+        assert format_sse_event("trace", "p", payload_json=json.dumps(payload)) == format_sse_event(
+            "trace", "p", payload=payload
+        )
+
+    def test_event_type_is_read_without_the_payload(self):
+        chunk = format_sse_event("project_complete", "p", payload={"note": '"type": "error"'})
+        assert sse_event_type(chunk) == "project_complete"
+        assert parse_sse_event(chunk)["payload"]["note"] == '"type": "error"'
+        assert sse_event_type(": keep-alive\n\n") is None
+
+    async def test_trace_event_and_log_share_one_encoding(self, monkeypatch):
+        from src import claude_service as module
+
+        async def fake_query(prompt, options):
+            yield self.MESSAGE
+
+        monkeypatch.setattr(module, "query", fake_query)
+        service = ClaudeService(api_key="test", trace_level="summary")
+        chunks = [c async for c in service._stream_agent("prompt", "proj-trace", {}, {}, set(), [])]
+        module.trace_writer.flush()
+
+        trace = parse_events(chunks)[0]
+        logged = json.loads(module.trace_writer.path_for("proj-trace").read_text().splitlines()[-1])
+        assert trace["type"] == "trace"
+        assert logged["type"] == "message"
+        assert logged["content"] == trace["payload"]["message"]
+        assert "usage" not in logged["content"]
+
+
+class TestToolDetection:
+    def test_module_and_script_forms(self):
+        assert detect_tools_from_command('python -m src.tools.sanctions "Vladimir Putin"') == [
+            ("sanctions", "Vladimir Putin")
+        ]
+        assert detect_tools_from_command("python3 src/tools/geo_risk.py RU") == [("geo_risk", "RU")]
+
+    def test_chained_commands(self):
+        command = 'cd /app && python -m src.tools.pep_check "A && B" && python -m src.tools.geo_risk \'RU\''
+        assert detect_tools_from_command(command) == [("pep_check", "A && B"), ("geo_risk", "RU")]
+
+    def test_ignores_non_tool_commands(self):
+        assert detect_tools_from_command("ls src/tools") == []
+        assert detect_tools_from_command("python -m pytest tests/") == []
+        assert detect_tool_from_command('python -m src.tools.adverse_media "sanctions evasion"') == "adverse_media"
+
+
+class TestToolResultParsing:
+    RESULT = {"id": "r1", "tool": "sanctions", "entity": "X", "status": "clear", "confidence": 95, "findings": []}
+
+    def test_ignores_braces_in_surrounding_noise(self):
+        content = "warning: {not json}\n" + json.dumps(self.RESULT, indent=2) + "\ntrailing {"
+        assert parse_tool_result(content)["confidence"] == 95
+
+    def test_ndjson_output(self):
+        lines = [json.dumps({**self.RESULT, "tool": tool}) for tool in ("sanctions", "geo_risk")]
+        assert [r["tool"] for r in parse_tool_results("\n".join(lines))] == ["sanctions", "geo_risk"]
+
+    def test_skips_objects_that_are_not_tool_results(self):
+        content = '{"error": "Usage: python -m src.tools.sanctions"}'
+        assert list(iter_json_objects(content)) == [{"error": "Usage: python -m src.tools.sanctions"}]
+        assert parse_tool_result(content) is None
+
+    def test_chained_results_attributed_by_tool_field(self):
+        service = ClaudeService.__new__(ClaudeService)
+        tool_map = {key: {"id": f"agent-{key}", "name": key} for key in ("sanctions", "geo_risk")}
+        pending = {"t1": ["sanctions", "geo_risk"]}
+        content = json.dumps({**self.RESULT, "tool": "geo_risk", "status": "high"}) + "\n" + json.dumps(self.RESULT)
+        results: list = []
+        events = service._handle_tool_result({"tool_use_id": "t1", "content": content}, "p", tool_map, pending, results)
+        assert [json.loads(e[6:])["agent_id"] for e in events] == ["agent-geo_risk", "agent-sanctions"]
+        assert [r["status"] for r in results] == ["high", "clear"]
+
+
+class TestScriptedBackend:
+    TOOLS = [
+        {"id": "t1", "key": "sanctions", "name": "Sanctions Check"},
+        {"id": "t2", "key": "geo_risk", "name": "Geographic Risk"},
+    ]
+
+    async def run(self, service: ClaudeService) -> list[dict]:
+        chunks = [
+            chunk async for chunk in service.run_project(
+                "proj-scripted", "Vladimir Putin", "individual", self.TOOLS, country="Russia", mode="agent"
+            )
+        ]
+        return parse_events(chunks)
+
+    async def test_synthesized_turn_runs_the_tools(self, monkeypatch):
+        from src.agent_backend import ScriptedBackend
+        from src.tools import sanctions
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.setattr(sanctions, "SIMULATED_LATENCY", 0)
+        events = await self.run(ClaudeService(backend=ScriptedBackend()))
+
+        assert [e["agent_id"] for e in events if e["type"] == "agent_start"] == ["t1", "t2"]
+        completed = {e["payload"]["tool_key"]: e["payload"] for e in events if e["type"] == "agent_complete"}
+        assert completed["sanctions"]["status"] == "match"
+        assert completed["geo_risk"]["status"] == "high"
+        assert events[-1]["type"] == "project_complete"
+        assert events[-1]["payload"]["tools_completed"] == 2
+
+    async def test_replays_recorded_log(self, tmp_path):
+        from src.agent_backend import ScriptedBackend
+
+        geo = {"id": "g1", "tool": "geo_risk", "entity": "Russia", "status": "high", "confidence": 90,
+               "findings": [], "sources": []}
+        messages = [
+            {"model": "claude-sonnet-4-5", "content": [
+                {"id": "tu1", "name": "Bash", "input": {"command": 'python -m src.tools.geo_risk "Russia"'}},
+            ]},
+            {"content": [{"tool_use_id": "tu1", "content": json.dumps(geo), "is_error": False}]},
+        ]
+        log = tmp_path / "proj-recorded.jsonl"
+        log.write_text("".join(json.dumps({"type": "message", "content": m}) + "\n" for m in messages))
+
+        events = await self.run(ClaudeService(backend=ScriptedBackend.from_logs([log])))
+        completed = [e["payload"] for e in events if e["type"] == "agent_complete"]
+        assert [(c["tool_key"], c["status"]) for c in completed] == [("geo_risk", "high")]
+        assert events[-1]["type"] == "project_complete"
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from src.jobs import JobScheduler, QueueFullError
+
+
+class TestJobScheduler:
+    def test_admits_up_to_session_cap(self):
+        jobs = JobScheduler(max_sessions=2, tenant_max_sessions=2)
+        tickets = [jobs.submit("a") for _ in range(3)]
+        assert [t.admitted for t in tickets] == [True, True, False]
+        assert jobs.position(tickets[2]) == 1
+
+        jobs.release(tickets[0])
+        assert tickets[2].admitted
+
+    def test_tenant_quota_lets_other_tenants_through(self):
+        jobs = JobScheduler(max_sessions=4, tenant_max_sessions=1)
+        first, second = jobs.submit("a"), jobs.submit("a")
+        other = jobs.submit("b")
+        assert first.admitted and not second.admitted and other.admitted
+
+    def test_interactive_jobs_overtake_batch_backlog(self):
+        jobs = JobScheduler(max_sessions=1, tenant_max_sessions=10)
+        running = jobs.submit("batch-tenant", "batch")
+        backlog = [jobs.submit("batch-tenant", "batch") for _ in range(5)]
+        analyst = jobs.submit("analyst", "interactive")
+        assert jobs.position(analyst) < jobs.position(backlog[1])
+
+        jobs.release(running)
+        assert backlog[0].admitted or analyst.admitted
+
+    def test_fair_between_tenants_of_same_priority(self):
+        jobs = JobScheduler(max_sessions=1, tenant_max_sessions=10)
+        running = jobs.submit("a")
+        burst = [jobs.submit("a") for _ in range(10)]
+        late = jobs.submit("b")
+        assert jobs.position(late) == 1
+        jobs.release(running)
+        assert late.admitted and not burst[0].admitted
+
+    def test_queue_limit(self):
+        jobs = JobScheduler(max_sessions=1, max_queued=1)
+        jobs.submit("a")
+        jobs.submit("a")
+        with pytest.raises(QueueFullError):
+            jobs.submit("a")
+
+    async def test_wait_reports_positions_until_admitted(self):
+        jobs = JobScheduler(max_sessions=1, tenant_max_sessions=10)
+        running = jobs.submit("a")
+        ahead = jobs.submit("a")
+        ticket = jobs.submit("a")
+
+        positions = []
+
+        async def consume():
+            async for position in jobs.wait(ticket):
+                positions.append(position)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        jobs.release(running)
+        await asyncio.sleep(0)
+        jobs.release(ahead)
+        await asyncio.wait_for(task, 1)
+        assert positions == [2, 1]
+        assert ticket.admitted
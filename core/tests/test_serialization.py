@@ -0,0 +1,67 @@
+import json
+from datetime import datetime
+
+from claude_agent_sdk.types import AssistantMessage, TextBlock, ToolUseBlock
+
+from src import serialization
+from src.serialization import dumps, to_builtin
+from src.tools.models import ToolResult
+
+MESSAGE = AssistantMessage(
+    [TextBlock("Running tools."), ToolUseBlock("tu1", "Bash", {"command": "python -m src.tools.sanctions X"})],
+    "claude-sonnet-4-5",
+)
+
+
+class Opaque:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<opaque>"
+
+
+class TestToBuiltin:
+    def test_sdk_message(self):
+        assert to_builtin(MESSAGE) == {
+            "content": [
+                {"text": "Running tools."},
+                {"id": "tu1", "name": "Bash", "input": {"command": "python -m src.tools.sanctions X"}},
+            ],
+            "model": "claude-sonnet-4-5",
+            "parent_tool_use_id": None,
+            "error": None,
+        }
+
+    def test_does_not_share_mutable_state(self):
+        converted = to_builtin(MESSAGE)
+        converted["content"][1]["input"]["command"] = "changed"
+        assert MESSAGE.content[1].input["command"] == "python -m src.tools.sanctions X"
+
+    def test_caches_one_converter_per_type(self):
+        to_builtin(MESSAGE)
+        assert (AssistantMessage, True) in serialization._converters
+        assert (TextBlock, True) in serialization._converters
+
+    def test_other_objects(self):
+        result = ToolResult(id="r", tool="sanctions", entity="X", status="clear")
+        assert to_builtin({"r": result, "t": (1, 2), "o": Opaque()}) == {
+            "r": result.model_dump(mode="json"),
+            "t": [1, 2],
+            "o": "<opaque>",
+        }
+
+
+class TestDumps:
+    def test_matches_to_builtin(self):
+        assert json.loads(dumps(MESSAGE)) == to_builtin(MESSAGE)
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(serialization, "orjson", None)
+        when = datetime(2025, 1, 2, 3, 4, 5)
+        assert json.loads(dumps({"message": MESSAGE, "at": when})) == {
+            "message": to_builtin(MESSAGE),
+            "at": "2025-01-02T03:04:05",
+        }
+
+    def test_wide_integers(self):
+        assert dumps({"n": 2**70}) == '{"n": 1180591620717411303424}'
@@ -1,3 +1,9 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
 from src.tools import adverse_media, business_registry, geo_risk, pep_check, sanctions
 
 
@@ -23,6 +29,59 @@ class TestSanctions:
         assert "findings" in result
         assert "sources" in result
 
+    def test_reordered_and_transliterated_names(self):
+        assert sanctions.check("Putin, Vladimir")["status"] == "match"
+        assert sanctions.check("Путин Владимир")["status"] == "match"
+        assert sanctions.check("Sergey Lavrov")["status"] == "match"
+
+    def test_short_fragment_is_not_a_match(self):
+        assert sanctions.check("put")["status"] == "clear"
+
+    def test_sound_alikes_are_not_matches(self):
+        for name in ("Button", "Patton", "Pitino", "Joe Biden"):
+            assert sanctions.check(name)["status"] == "clear", name
+        assert sanctions.check("Ali Khan")["status"] != "match"
+
+    def test_one_shared_given_name_is_not_reported(self):
+        for name in ("Vladimir Smith", "Ali Khan", "Mohammed Ali", "Vladimir", "Kim", "Jong"):
+            assert sanctions.check(name)["status"] == "clear", name
+        assert sanctions.check("Khamenei")["status"] == "potential"
+
+    def test_list_file_is_not_throttled_and_keeps_namesakes(self, tmp_path, monkeypatch):
+        path = tmp_path / "sdn.csv"
+        path.write_text("name,datasets\nIvan PETROV,us_ofac_sdn\nIvan PETROV,eu_fsf\n")
+        monkeypatch.setattr(sanctions, "SANCTIONS_LIST_PATH", str(path))
+        monkeypatch.setattr(sanctions, "_index", None)
+        monkeypatch.setattr(sanctions.time, "sleep", lambda seconds: pytest.fail("slept on a real list"))
+
+        result = sanctions.check("Ivan Petrov")
+        assert [f["datasets"] for f in result["findings"]] == [["us_ofac_sdn"], ["eu_fsf"]]
+        assert result["sources"] == ["sdn.csv (eu_fsf, us_ofac_sdn)"]
+
+
+class TestNameIndex:
+    def test_load_csv_watchlist(self, tmp_path):
+        from src.tools.matching import NameIndex
+
+        path = tmp_path / "sdn.csv"
+        path.write_text(
+            "name,aliases,datasets\nIvan PETROV,Ivan Petrof;I. Petrov,us_ofac_sdn\nAcme Trading LLC,,eu_fsf\n"
+        )
+        index = NameIndex.load(path)
+
+        hits = index.search("Petrov Ivan")
+        assert hits[0]["entry"]["name"] == "Ivan PETROV"
+        assert hits[0]["score"] == 100
+        assert index.search("Ivan Petroff")[0]["entry"]["datasets"] == ["us_ofac_sdn"]
+        assert index.search("Acme Trading")[0]["score"] >= 80
+
+    def test_lone_token_must_be_the_surname(self):
+        from src.tools.matching import NameIndex
+
+        index = NameIndex.from_records([{"name": "KIM Jong Un"}, {"name": "Joseph R. Biden Jr."}])
+        assert index.search("Jong") == index.search("Kim") == []
+        assert [hit["entry"]["name"] for hit in index.search("Biden")] == ["Joseph R. Biden Jr."]
+
 
 class TestPepCheck:
     def test_known_pep(self):
@@ -35,12 +94,79 @@ class TestPepCheck:
         result = pep_check.check("Random Person Nobody")
         assert result["status"] == "clear"
 
+    def test_sound_alikes_are_not_reported(self):
+        assert [f["name"] for f in pep_check.check("Vladimir Putin")["findings"]] == ["Vladimir Putin"]
+        assert pep_check.check("Button")["status"] == "clear"
+
+    def test_surname_ranks_its_own_pep_first(self):
+        assert [f["name"] for f in pep_check.check("Putin")["findings"]] == ["Vladimir Putin"]
+        assert pep_check.check("Biden")["findings"][0]["name"] == "Joseph R. Biden Jr."
+
     def test_result_structure(self):
         result = pep_check.check("Test Person")
         assert "id" in result
         assert "tool" in result
         assert result["tool"] == "pep_check"
 
+    def test_relatives_and_associates(self):
+        result = pep_check.check("Jill Biden")
+        rca = result["findings"][0]
+        assert rca["pep_level"] is None
+        assert [(p["name"], p["relation"]) for p in rca["rca_of"]] == [("Joseph R. Biden Jr.", "spouse")]
+        pep = pep_check.check("Joe Biden")["findings"][0]
+        assert {r["name"]: r["relation"] for r in pep["related"]} == {"Jill Biden": "spouse", "Hunter Biden": "child"}
+
+    def test_country_and_position_filters(self):
+        def statuses(names, **opts):
+            return [r["status"] for r in pep_check.check_many(names, **opts)]
+
+        assert statuses(["Emmanuel Macron", "Rishi Sunak"], country="France") == ["match", "clear"]
+        assert statuses(["Emmanuel Macron", "Rishi Sunak"], country="GB") == ["clear", "match"]
+        assert statuses(["Emmanuel Macron", "Rishi Sunak"], position="prime minister") == ["clear", "match"]
+
+    def test_check_many(self):
+        results = pep_check.check_many(["Владимир Путин", "Random Person Nobody", "Владимир Путин"])
+        assert [r["status"] for r in results] == ["match", "clear", "match"]
+        assert results[0]["findings"][0]["name"] == "Vladimir Putin"
+
+    def test_convert_wikidata_extract(self, tmp_path):
+        from src.tools.pep_data import PepIndex, convert_wikidata
+
+        def item(qid, label, claims=None, types=("Q5",)):
+            claims = dict(claims or {})
+            claims["P31"] = [snak(t) for t in types]
+            return {"id": qid, "labels": {"en": {"value": label}}, "claims": claims}
+
+        def snak(value, **qualifiers):
+            claim = {"mainsnak": {"snaktype": "value", "datavalue": {"value": value}}, "rank": "normal"}
+            if isinstance(value, str) and value.startswith("Q"):
+                claim["mainsnak"]["datavalue"]["value"] = {"id": value}
+            claim["qualifiers"] = {p: [{"snaktype": "value", "datavalue": {"value": {"time": t}}}]
+                                   for p, t in qualifiers.items()}
+            return claim
+
+        entities = [
+            item("Q1", "Olaf Example", {"P39": [snak("Q10", P580="+2021-12-08T00:00:00Z")], "P26": [snak("Q2")]}),
+            item("Q2", "Britta Example"),
+            item("Q3", "Unrelated Person"),
+            item("Q10", "Chancellor of Germany", {"P1001": [snak("Q20")]}, types=("Q4164871",)),
+            item("Q20", "Germany", {"P297": [snak("DE")]}, types=("Q6256",)),
+        ]
+        dump = tmp_path / "extract.json"
+        dump.write_text("[\n" + ",\n".join(json.dumps(e) for e in entities) + "\n]\n", encoding="utf-8")
+
+        records = convert_wikidata(dump)
+        assert sorted(r["id"] for r in records) == ["Q1", "Q2"]
+        olaf = next(r for r in records if r["id"] == "Q1")
+        assert olaf["positions"] == [
+            {"title": "Chancellor of Germany", "start": "2021-12-08", "end": None, "country": "DE"}
+        ]
+
+        index = PepIndex(records)
+        hit = index.search("Britta Example")[0]
+        assert hit["rca_of"][0]["name"] == "Olaf Example"
+        assert index.search("Olaf Example", country="Germany")[0]["pep_level"] == "high"
+
 
 class TestGeoRisk:
     def test_high_risk_country(self):
@@ -60,6 +186,42 @@ class TestGeoRisk:
         result = geo_risk.check("Unknown Country XYZ")
         assert result["status"] == "unknown"
 
+    def test_codes_and_name_variants(self):
+        for spelling in ("IR", "irn", "364", "Iran (Islamic Republic of)", "Islamic Republic of Iran", "IRAN."):
+            assert geo_risk.check(spelling)["findings"][0]["iso_code"] == "IR", spelling
+        assert geo_risk.check("Côte d’Ivoire")["findings"][0]["iso_code"] == "CI"
+        assert geo_risk.check("Korea, Republic of")["findings"][0]["iso_code"] == "KR"
+        assert geo_risk.check("St. Kitts & Nevis")["findings"][0]["iso_code"] == "KN"
+        assert geo_risk.check("Россия")["status"] == "high"
+
+    def test_ambiguous_names_stay_unknown(self):
+        assert geo_risk.check("Korea")["status"] == "unknown"
+        assert geo_risk.check("Virgin Islands")["status"] == "unknown"
+
+    def test_covers_every_iso_country(self):
+        index = geo_risk.get_index()
+        assert len(index) == 249
+        assert geo_risk.check("Kiribati")["status"] != "unknown"
+
+    def test_check_many(self):
+        results = geo_risk.check_many(["Russia", "DE", "Nowhere", "Russia"])
+        assert [r["status"] for r in results] == ["high", "low", "unknown", "high"]
+        assert len({r["id"] for r in results}) == 4
+
+    def test_compiled_index_matches_source(self, tmp_path):
+        import json
+
+        from src.tools.geo_data import DEFAULT_SOURCE, CountryIndex, compile_dataset
+
+        compiled = tmp_path / "countries.index.json"
+        compiled.write_text(json.dumps(compile_dataset(DEFAULT_SOURCE)))
+        assert CountryIndex.load(DEFAULT_SOURCE, compiled).lookup("Bahamas, The")["alpha2"] == "BS"
+
+        stale = json.loads(compiled.read_text())
+        stale.update(source_sha256="outdated", names={})
+        compiled.write_text(json.dumps(stale))
+        assert CountryIndex.load(DEFAULT_SOURCE, compiled).lookup("Bahamas, The")["alpha2"] == "BS"
+
 
 class TestAdverseMedia:
     def test_result_structure(self):
@@ -70,6 +232,95 @@ class TestAdverseMedia:
         assert "status" in result
         assert "findings" in result
 
+    def test_classifier(self):
+        from src.tools.media import classify
+
+        charged = classify("Acme CEO charged in money laundering probe")
+        assert charged["sentiment"] == "negative"
+        assert set(charged["categories"]) == {"financial_crime", "legal"}
+        assert classify("Acme CEO acquitted of fraud")["sentiment"] == "neutral"
+        assert classify("Acme not charged after review")["terms"] == []
+        assert classify("Acme opens new plant in Ohio", tone=4.5)["sentiment"] == "positive"
+
+    def test_dedupe_syndicated_copies(self):
+        from src.tools.media import Deduplicator, canonical_url
+
+        assert canonical_url("https://www.example.com/story/?utm_source=x&id=3#top") == "example.com/story?id=3"
+        seen = Deduplicator()
+        headline = "Acme CEO charged with fraud by prosecutors"
+        assert seen.add({"url": "https://a.com/1", "title": f"{headline} - Reuters"}) is None
+        assert seen.add({"url": "https://b.com/x", "title": f"{headline} | BBC"}) == 0
+        assert seen.add({"url": "https://m.a.com/1/amp", "title": "Different headline"}) == 0
+        assert seen.add({"url": "https://c.com/2", "title": "Acme opens new plant in Ohio"}) is None
+
+    async def test_screen_streams_updates(self):
+        from src.tools.media import screen
+
+        def article(title, url):
+            return {"title": title, "url": url, "source": "example.com", "date": "2024-01-01", "tone": -5.0}
+
+        async def fast():
+            return [article("Acme charged with bribery", "https://a.com/1"), article("Acme wins award", "https://a.com/2")]
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return [article("Acme charged with bribery - wire", "https://b.com/1")]
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        async def hung():
+            await asyncio.sleep(10)
+
+        fetches = [("fast", fast), ("slow", slow), ("broken", broken), ("hung", hung)]
+        updates = [u async for u in screen("Acme", fetches=fetches, budget=0.2)]
+
+        by_fetch = {u["fetch"]: u for u in updates}
+        assert [f["title"] for f in by_fetch["fast"]["findings"]] == ["Acme charged with bribery", "Acme wins award"]
+        assert by_fetch["slow"]["findings"] == [] and by_fetch["slow"]["duplicates"] == 1
+        assert by_fetch["fast"]["findings"][0]["syndicated"] == 1
+        assert by_fetch["broken"]["error"] == "RuntimeError: boom"
+        assert by_fetch["hung"]["error"].startswith("Timed out")
+        assert [u["done"] for u in updates] == [1, 2, 3, 4]
+
+    async def test_progress_reaches_scheduler(self, monkeypatch):
+        from src.tools.media import score_article
+        from src.tools.scheduler import ToolScheduler
+
+        async def fake_screen(entity):
+            finding = score_article({"title": f"{entity} indicted for fraud", "url": "https://a.com/1"})
+            yield {"fetch": "a", "findings": [finding], "error": None, "done": 1, "total": 2}
+            yield {"fetch": "b", "findings": [], "error": "HTTPError: 503", "done": 2, "total": 2}
+
+        monkeypatch.setattr(adverse_media, "screen", fake_screen)
+        updates = [u async for u in ToolScheduler().as_completed({"adverse_media": ("Acme",)}, progress=True)]
+
+        (_, partial, _), (_, final, _) = updates
+        assert partial["partial"] and partial["status"] == "running" and partial["progress"] == 50
+        assert final["status"] == "alert"
+        assert final["failed_fetches"] == {"b": "HTTPError: 503"}
+
+    async def test_all_fetches_failing_is_an_error(self, monkeypatch):
+        async def failing_screen(entity):
+            yield {"fetch": "a", "findings": [], "error": "ConnectError", "done": 1, "total": 1}
+
+        monkeypatch.setattr(adverse_media, "screen", failing_screen)
+        result = await adverse_media.acheck("Acme")
+        assert result["status"] == "error"
+
+    async def test_sync_check_inside_a_running_loop(self, monkeypatch):
+        from src.tools import http_client
+
+        clients = []
+
+        async def one_article_screen(entity):
+            clients.append(http_client.get_async_client())
+            yield {"fetch": "a", "findings": [], "error": None, "done": 1, "total": 1}
+
+        monkeypatch.setattr(adverse_media, "screen", one_article_screen)
+        assert adverse_media.check("Acme")["status"] == "clear"
+        assert clients[0].is_closed
+
 
 class TestBusinessRegistry:
     def test_result_structure(self):
@@ -78,3 +329,258 @@ class TestBusinessRegistry:
         assert "tool" in result
         assert result["tool"] == "business_registry"
         assert "status" in result
+
+
+class TestAsyncTools:
+    def test_every_tool_has_async_variant(self):
+        from src.tools import ATOOLS, TOOLS
+
+        assert set(ATOOLS) == set(TOOLS)
+
+    async def test_acheck_matches_check(self):
+        result = await sanctions.acheck("Vladimir Putin")
+        assert result["status"] == sanctions.check("Vladimir Putin")["status"]
+
+    async def test_scheduler_gather(self):
+        from src.tools.scheduler import ToolScheduler
+
+        results = await ToolScheduler(max_concurrency=2).gather({
+            "sanctions": ("Kim Jong Un",),
+            "geo_risk": ("Iran",),
+        })
+        assert results["sanctions"]["status"] == "match"
+        assert results["geo_risk"]["status"] == "critical"
+
+    async def test_scheduler_timeout(self):
+        from src.tools.scheduler import ToolScheduler, ToolTimeoutError
+
+        results = await ToolScheduler(timeouts={"court_records": 0.01}).gather({"court_records": ("John Smith",)})
+        assert isinstance(results["court_records"], ToolTimeoutError)
+
+
+class TestLazyRegistry:
+    def test_tools_resolve_on_access(self):
+        import src.tools
+        from src.tools import TOOLS
+
+        assert getattr(TOOLS["geo_risk"], "__wrapped__", TOOLS["geo_risk"]) is src.tools.geo_risk.check
+        assert "unknown_tool" not in TOOLS
+
+    def test_sync_tools_go_through_the_cache(self):
+        from src.tools import TOOLS
+
+        TOOLS["geo_risk"]("North Korea")
+        assert TOOLS["geo_risk"]("north korea")["cache"]["hit"] is True
+
+    async def test_weave_imported_on_first_call(self, monkeypatch):
+        import sys
+        import types
+
+        import src.tools
+
+        calls = []
+        fake = types.ModuleType("weave")
+        fake.init = lambda project: calls.append(("init", project))
+        fake.op = lambda: lambda func: func
+        monkeypatch.setitem(sys.modules, "weave", fake)
+        monkeypatch.setattr(src.tools, "WEAVE_PROJECT", "test-project")
+        monkeypatch.setattr(src.tools, "_weave", None)
+
+        @src.tools.weave_op
+        async def traced(x):
+            return x * 2
+
+        assert calls == []
+        assert await traced(2) == 4
+        assert calls == [("init", "test-project")]
+
+
+class TestHttpClient:
+    def test_client_is_shared(self):
+        from src.tools import http_client
+
+        assert http_client.get_client() is http_client.get_client()
+
+    def test_per_host_timeout(self):
+        from src.tools import http_client
+
+        assert http_client.timeout_for(adverse_media.GDELT_DOC_API) == http_client.HOST_TIMEOUTS["api.gdeltproject.org"]
+        assert http_client.timeout_for("https://example.com/x") == http_client.DEFAULT_TIMEOUT
+
+
+class TestToolCache:
+    def test_memory_hit_after_miss(self, tmp_path):
+        from src.tools.cache import ToolCache
+
+        cache = ToolCache(directory=None)
+        first = cache.call("geo_risk", geo_risk.check, "Russia")
+        second = cache.call("geo_risk", geo_risk.check, "  RUSSIA ")
+        assert first["cache"] == {"hit": False}
+        assert second["cache"]["hit"] is True
+        assert second["cache"]["tier"] == "memory"
+        assert second["status"] == first["status"]
+
+    def test_disk_tier_survives_memory_eviction(self, tmp_path):
+        from src.tools.cache import ToolCache
+
+        cache = ToolCache(directory=str(tmp_path), max_entries=1)
+        cache.call("geo_risk", geo_risk.check, "Iran")
+        cache.call("geo_risk", geo_risk.check, "Syria")
+        result = cache.call("geo_risk", geo_risk.check, "Iran")
+        assert result["cache"]["tier"] == "disk"
+
+    def test_agent_commands_are_cached(self, tmp_path):
+        import os
+        import subprocess
+        import sys
+
+        env = {**os.environ, "SCOLO_CACHE_DIR": str(tmp_path)}
+        command = [sys.executable, "-m", "src.tools.geo_risk", "Iran"]
+        outputs = [json.loads(subprocess.run(command, env=env, capture_output=True, check=True).stdout) for _ in "ab"]
+        assert outputs[0]["cache"] == {"hit": False}
+        assert outputs[1]["cache"]["tier"] == "disk"
+
+    def test_case_sensitive_tools_keep_case(self):
+        from src.tools.cache import cache_key
+
+        assert cache_key("crypto_trace", ("AbC",), {}) != cache_key("crypto_trace", ("abc",), {})
+        assert cache_key("sanctions", ("AbC",), {}) == cache_key("sanctions", ("abc",), {})
+
+    async def test_stale_while_revalidate(self, monkeypatch):
+        from src.tools import cache as cache_module
+
+        monkeypatch.setitem(cache_module.TOOL_TTLS, "business_registry", 0)
+        cache = cache_module.ToolCache(directory=None)
+        answers = iter([{"status": "found", "n": 1}, {"status": "found", "n": 2}])
+        refreshed = asyncio.Event()
+
+        async def lookup(entity):
+            result = next(answers)
+            if result["n"] == 2:
+                refreshed.set()
+            return result
+
+        assert (await cache.acall("business_registry", lookup, "Acme"))["n"] == 1
+        stale = await cache.acall("business_registry", lookup, "Acme")
+        assert stale["n"] == 1 and stale["stale"] is True and stale["cache"]["stale"] is True
+        await asyncio.wait_for(refreshed.wait(), 1)
+        await asyncio.sleep(0)
+        assert (await cache.acall("business_registry", lookup, "Acme"))["n"] == 2
+
+    def test_stale_result_served_when_refresh_fails(self, monkeypatch):
+        from src.tools import cache as cache_module
+
+        monkeypatch.setitem(cache_module.TOOL_TTLS, "business_registry", 0)
+        cache = cache_module.ToolCache(directory=None)
+        cache.call("business_registry", lambda entity: {"status": "found"}, "Acme")
+        result = cache.call("business_registry", lambda entity: {"status": "error"}, "Acme")
+        assert result["status"] == "found" and result["stale"] is True
+        fresh = cache.call("business_registry", lambda entity: {"status": "not_found"}, "Acme")
+        assert fresh["status"] == "not_found" and fresh["cache"]["revalidated"] is True
+
+    def test_screening_results_are_never_served_stale(self, monkeypatch):
+        from src.tools import cache as cache_module
+
+        monkeypatch.setitem(cache_module.TOOL_TTLS, "sanctions", 0)
+        cache = cache_module.ToolCache(directory=None)
+        cache.call("sanctions", lambda entity: {"status": "clear"}, "Acme")
+        assert cache.lookup("sanctions", ("Acme",), {}) == (None, {"hit": False})
+        assert cache.call("sanctions", lambda entity: {"status": "error"}, "Acme")["status"] == "error"
+
+
+class TestResilience:
+    @staticmethod
+    def failure(status: int = 503):
+        request = httpx.Request("GET", "https://upstream.test/")
+        return httpx.HTTPStatusError("upstream", request=request, response=httpx.Response(status, request=request))
+
+    async def test_plain_text_reply_counts_as_a_failure(self, monkeypatch):
+        from src.tools import http_client, resilience
+
+        monkeypatch.setattr(resilience, "RETRY_BACKOFF", 0)
+        monkeypatch.setitem(resilience._upstreams, "test", resilience.Upstream("test"))
+
+        async def throttled(url, **kwargs):
+            request = httpx.Request("GET", url)
+            return httpx.Response(200, text="Please limit requests to one every 5 seconds", request=request)
+
+        monkeypatch.setattr(http_client, "aget", throttled)
+        with pytest.raises(resilience.UnexpectedContentError):
+            await resilience.aget("test", "https://upstream.test/", content_type="json")
+        assert resilience.upstream("test").breaker.failures == 2
+
+    async def test_breaker_opens_and_probes(self, monkeypatch):
+        from src.tools import resilience
+
+        monkeypatch.setattr(resilience, "RETRY_BACKOFF", 0)
+        up = resilience.Upstream("test", breaker=resilience.CircuitBreaker("test", threshold=2, reset_timeout=0.05))
+        calls = 0
+
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            raise self.failure()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await up.call(flaky, hedge=False)
+        assert calls == 2 and up.breaker.state == "open"
+        with pytest.raises(resilience.CircuitOpenError):
+            await up.call(flaky, hedge=False)
+        assert calls == 2
+
+        await asyncio.sleep(0.06)
+        assert up.breaker.state == "half_open"
+
+        async def healthy():
+            return "ok"
+
+        assert await up.call(healthy, hedge=False) == "ok"
+        assert up.breaker.state == "closed"
+
+    async def test_client_errors_are_not_retried(self):
+        from src.tools import resilience
+
+        up = resilience.Upstream("test")
+        calls = 0
+
+        async def not_found():
+            nonlocal calls
+            calls += 1
+            raise self.failure(404)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await up.call(not_found, hedge=False)
+        assert calls == 1 and up.breaker.failures == 0
+
+    async def test_retry_budget_is_bounded(self, monkeypatch):
+        from src.tools import resilience
+
+        monkeypatch.setattr(resilience, "RETRY_BACKOFF", 0)
+        up = resilience.Upstream(
+            "test",
+            breaker=resilience.CircuitBreaker("test", threshold=1000),
+            budget=resilience.RetryBudget(ratio=0.1, reserve=2),
+        )
+
+        async def down():
+            raise self.failure()
+
+        for _ in range(20):
+            with pytest.raises(httpx.HTTPStatusError):
+                await up.call(down, hedge=False)
+        # The reserve plus a tenth of the first attempts, not one retry per call.
+        assert up.retries <= 2 + 20 * 0.1
+
+    async def test_slow_call_is_hedged(self, monkeypatch):
+        from src.tools import resilience
+
+        up = resilience.Upstream("test")
+        monkeypatch.setattr(up.latency, "hedge_delay", lambda: 0.01)
+        delays = iter([1.0, 0.0])
+
+        async def sometimes_slow():
+            await asyncio.sleep(next(delays))
+            return "fast copy"
+
+        assert await asyncio.wait_for(up.call(sometimes_slow), 0.5) == "fast copy"
+        assert up.hedges == 1
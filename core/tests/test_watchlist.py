@@ -0,0 +1,149 @@
+from src.tools import sanctions
+from src.tools.matching import NameIndex
+from src.tools.watchlist import PARSERS, Segment, WatchlistStore, record_digest, write_segment
+
+OFAC_XML = """<?xml version="1.0" encoding="utf-8"?>
+<sdnList xmlns="http://tempuri.org/sdnList.xsd">
+  <sdnEntry>
+    <uid>1</uid><firstName>Vladimir Vladimirovich</firstName><lastName>PUTIN</lastName><sdnType>Individual</sdnType>
+    <programList><program>RUSSIA-EO14024</program></programList>
+    <akaList><aka><lastName>PUTIN</lastName><firstName>Vladimir</firstName></aka></akaList>
+    <nationalityList><nationality><country>Russia</country></nationality></nationalityList>
+  </sdnEntry>
+  <sdnEntry>
+    <uid>2</uid><lastName>GAZPROMBANK</lastName><sdnType>Entity</sdnType>
+    <programList><program>UKRAINE-EO13662</program></programList>
+    <addressList><address><country>Russia</country></address></addressList>
+  </sdnEntry>
+  {extra}
+</sdnList>
+"""
+
+UN_XML = """<CONSOLIDATED_LIST>
+  <INDIVIDUALS><INDIVIDUAL>
+    <DATAID>6908555</DATAID><FIRST_NAME>KIM</FIRST_NAME><SECOND_NAME>JONG UN</SECOND_NAME>
+    <UN_LIST_TYPE>DPRK</UN_LIST_TYPE>
+    <NATIONALITY><VALUE>Democratic People's Republic of Korea</VALUE></NATIONALITY>
+  </INDIVIDUAL></INDIVIDUALS>
+  <ENTITIES/>
+</CONSOLIDATED_LIST>
+"""
+
+EU_XML = """<export xmlns="http://eu.europa.ec/fpi/fsd/export">
+  <sanctionEntity logicalId="13">
+    <regulation programme="IRQ"/>
+    <subjectType code="person"/>
+    <nameAlias wholeName="Saddam Hussein Al-Tikriti"/>
+    <nameAlias firstName="Saddam" lastName="Hussein"/>
+    <citizenship countryIso2Code="IQ"/>
+  </sanctionEntity>
+</export>
+"""
+
+
+def write_ofac(tmp_path, extra=""):
+    path = tmp_path / "SDN.XML"
+    path.write_text(OFAC_XML.replace("{extra}", extra), encoding="utf-8")
+    return path
+
+
+class TestParsers:
+    def test_ofac_xml(self, tmp_path):
+        records = list(PARSERS["ofac"](write_ofac(tmp_path)))
+        assert [r["uid"] for r in records] == ["ofac:1", "ofac:2"]
+        putin = records[0]
+        assert putin["name"] == "Vladimir Vladimirovich PUTIN"
+        assert putin["schema"] == "Person"
+        assert putin["aliases"] == ["Vladimir PUTIN"]
+        assert putin["countries"] == ["RU"]
+        assert records[1]["schema"] == "Organization"
+
+    def test_un_and_eu_xml(self, tmp_path):
+        (tmp_path / "un.xml").write_text(UN_XML, encoding="utf-8")
+        (tmp_path / "eu.xml").write_text(EU_XML, encoding="utf-8")
+        (kim,) = PARSERS["un"](tmp_path / "un.xml")
+        assert (kim["uid"], kim["name"], kim["countries"]) == ("un:6908555", "KIM JONG UN", ["KP"])
+        (saddam,) = PARSERS["eu"](tmp_path / "eu.xml")
+        assert saddam["uid"] == "eu:13"
+        assert saddam["name"] == "Saddam Hussein Al-Tikriti"
+        assert saddam["aliases"] == ["Saddam Hussein"]
+        assert saddam["programs"] == ["IRQ"]
+
+
+class TestSegment:
+    def test_mapped_search_matches_name_index(self, tmp_path):
+        records = list(PARSERS["ofac"](write_ofac(tmp_path)))
+        digested = [{**r, "digest": record_digest(r)} for r in records]
+        write_segment(tmp_path / "base.seg", digested, tombstones=["ofac:9"])
+        segment = Segment(tmp_path / "base.seg")
+
+        assert len(segment) == 2
+        assert segment.tombstones == {"ofac:9"}
+        assert segment.entries[0] == records[0]
+        assert segment.entries.digest(0) == record_digest(records[0])
+        for query in ("Putin Vladimir", "Vladmir Puttin", "Gazprombank"):
+            assert segment.index.search(query) == NameIndex.from_records(records).search(query)
+
+    def test_key_postings_from_older_phonetic_version_are_ignored(self, tmp_path, monkeypatch):
+        from src.tools.watchlist import segment as segment_module
+
+        records = list(PARSERS["ofac"](write_ofac(tmp_path)))
+        monkeypatch.setattr(segment_module, "PHONETIC_VERSION", 1)
+        write_segment(tmp_path / "old.seg", [{**r, "digest": record_digest(r)} for r in records])
+        monkeypatch.undo()
+        segment = Segment(tmp_path / "old.seg")
+
+        assert segment.stale_keys
+        assert segment.index.search("Vladmir Puttin")[0]["entry"]["name"] == "Vladimir Vladimirovich PUTIN"
+
+
+class TestWatchlistStore:
+    def test_delta_ingest_and_compaction(self, tmp_path):
+        store = WatchlistStore(tmp_path / "store")
+        stats = store.ingest("ofac", PARSERS["ofac"](write_ofac(tmp_path)), published="2025-01-01")
+        assert stats == {"added": 2, "updated": 0, "removed": 0, "total": 2}
+        assert [s["kind"] for s in store.manifest["segments"]] == ["base"]
+
+        # Next day: Gazprombank delisted, Putin gains a country, a new entry appears.
+        extra = "<sdnEntry><uid>3</uid><lastName>SOVCOMFLOT</lastName><sdnType>Entity</sdnType></sdnEntry>"
+        updated = [r for r in PARSERS["ofac"](write_ofac(tmp_path, extra)) if r["uid"] != "ofac:2"]
+        updated[0]["countries"].append("BY")
+        stats = store.ingest("ofac", updated, published="2025-01-02")
+        assert stats == {"added": 1, "updated": 1, "removed": 1, "total": 2}
+        assert [s["kind"] for s in store.manifest["segments"]] == ["base", "delta"]
+
+        assert not store.search("Gazprombank")
+        (hit,) = store.search("Vladimir Putin")
+        assert hit["entry"]["countries"] == ["RU", "BY"]
+        assert store.search("Sovcomflot")[0]["entry"]["uid"] == "ofac:3"
+
+        # A reader opened earlier picks the new manifest up on refresh.
+        reader = WatchlistStore(tmp_path / "store")
+        store.compact()
+        assert reader.refresh()
+        assert [s["kind"] for s in reader.manifest["segments"]] == ["base"]
+        assert sorted(r["uid"] for r in reader.records()) == ["ofac:1", "ofac:3"]
+        assert sorted(p.name for p in (tmp_path / "store").glob("*.seg")) == ["000003.base.seg"]
+
+    def test_sources_are_independent(self, tmp_path):
+        (tmp_path / "un.xml").write_text(UN_XML, encoding="utf-8")
+        store = WatchlistStore(tmp_path / "store", max_deltas=0)
+        store.ingest("ofac", PARSERS["ofac"](write_ofac(tmp_path)))
+        store.ingest("un", PARSERS["un"](tmp_path / "un.xml"))
+        # max_deltas=0 compacts after every delta.
+        assert len(store.segments) == 1
+        assert len(store) == 3
+        assert store.ingest("un", []) == {"added": 0, "updated": 0, "removed": 1, "total": 0}
+        assert sorted(r["uid"] for r in store.records()) == ["ofac:1", "ofac:2"]
+        assert set(store.sources) == {"ofac", "un"}
+
+    def test_sanctions_check_uses_store(self, tmp_path, monkeypatch):
+        store_path = tmp_path / "store"
+        WatchlistStore(store_path).ingest("ofac", PARSERS["ofac"](write_ofac(tmp_path)), published="2025-01-01")
+        monkeypatch.setattr(sanctions, "SANCTIONS_STORE_PATH", str(store_path))
+        monkeypatch.setattr(sanctions, "_index", None)
+
+        result = sanctions.check("Putin Vladimir")
+        assert result["status"] == "match"
+        assert result["findings"][0]["uid"] == "ofac:1"
+        assert result["sources"] == ["OFAC (2025-01-01)"]
@@ -61,6 +61,11 @@ export async function POST(request: Request) {
         country,
         status,
       })
+      // The backend's project store may already have inserted this row.
+      .onConflictDoUpdate({
+        target: projects.id,
+        set: { userId: user.id, name: projectName, updatedAt: new Date() },
+      })
       .returning();
 
     return NextResponse.json(project, { status: 201 });
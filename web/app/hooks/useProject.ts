@@ -120,6 +120,12 @@ export function useProject() {
         };
 
         eventSource.onerror = () => {
+          // While CONNECTING the browser retries by itself and the backend
+          // resumes after the Last-Event-ID it sends, so keep the stream open.
+          if (eventSource.readyState === EventSource.CONNECTING) {
+            setSSEConnected(false);
+            return;
+          }
           eventSource.close();
           eventSourceRef.current = null;
           setSSEConnected(false);
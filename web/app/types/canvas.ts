@@ -54,6 +54,15 @@ export interface ProjectCompletePayload {
   results: ToolResult[];
 }
 
+export interface RiskUpdatePayload {
+  risk_level: RiskLevel;
+  provisional: boolean;
+  decided_by: string;
+  tool_name: string;
+  total_findings: number;
+  tools_completed: number;
+}
+
 export interface AgentPayload {
   task?: string;
   progress?: number;
@@ -80,6 +89,7 @@ export type SSEMessage =
   | { type: 'agent_progress'; project_id: string; agent_id: string; payload: AgentPayload }
   | { type: 'agent_complete'; project_id: string; agent_id: string; payload: AgentPayload }
   | { type: 'agent_error'; project_id: string; agent_id: string; payload: AgentPayload }
+  | { type: 'risk_update'; project_id: string; payload: RiskUpdatePayload }
   | { type: 'trace'; project_id: string; payload: TracePayload };
 
 export type ProjectStatus = 'pending' | 'running' | 'completed' | 'failed' | 'archived';
@@ -0,0 +1,7 @@
+CREATE TABLE "project_events" (
+	"project_id" text PRIMARY KEY NOT NULL,
+	"events" jsonb DEFAULT '[]'::jsonb NOT NULL,
+	"updated_at" timestamp DEFAULT now() NOT NULL
+);
+--> statement-breakpoint
+ALTER TABLE "project_events" ADD CONSTRAINT "project_events_project_id_projects_id_fk" FOREIGN KEY ("project_id") REFERENCES "public"."projects"("id") ON DELETE cascade ON UPDATE no action;
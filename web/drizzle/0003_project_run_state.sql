@@ -0,0 +1,3 @@
+ALTER TABLE "projects" ADD COLUMN "run_state" jsonb DEFAULT '{}'::jsonb NOT NULL;--> statement-breakpoint
+CREATE INDEX "projects_status_idx" ON "projects" USING btree ("status");--> statement-breakpoint
+CREATE INDEX "projects_created_at_idx" ON "projects" USING btree ("created_at");
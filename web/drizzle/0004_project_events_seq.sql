@@ -0,0 +1,9 @@
+DROP TABLE "project_events";--> statement-breakpoint
+CREATE TABLE "project_events" (
+	"project_id" text NOT NULL,
+	"seq" integer NOT NULL,
+	"event" text NOT NULL,
+	CONSTRAINT "project_events_project_id_seq_pk" PRIMARY KEY("project_id","seq")
+);
+--> statement-breakpoint
+ALTER TABLE "project_events" ADD CONSTRAINT "project_events_project_id_projects_id_fk" FOREIGN KEY ("project_id") REFERENCES "public"."projects"("id") ON DELETE cascade ON UPDATE no action;
@@ -1,4 +1,4 @@
-import { pgTable, text, timestamp, jsonb, integer, boolean, real } from 'drizzle-orm/pg-core';
+import { pgTable, text, timestamp, jsonb, integer, boolean, real, index, primaryKey } from 'drizzle-orm/pg-core';
 
 export const projects = pgTable('projects', {
   id: text('id').primaryKey(),
@@ -11,9 +11,14 @@ export const projects = pgTable('projects', {
   riskLevel: text('risk_level'),
   totalFindings: integer('total_findings').default(0),
   toolsCompleted: integer('tools_completed').default(0),
+  // Backend run settings and state (mode, priority, tenant, run owner, timings, error)
+  runState: jsonb('run_state').notNull().default({}),
   createdAt: timestamp('created_at').defaultNow().notNull(),
   updatedAt: timestamp('updated_at').defaultNow().notNull(),
-});
+}, (table) => [
+  index('projects_status_idx').on(table.status),
+  index('projects_created_at_idx').on(table.createdAt),
+]);
 
 export const nodes = pgTable('nodes', {
   id: text('id').primaryKey(),
@@ -49,6 +54,14 @@ export const investigations = pgTable('investigations', {
   completedAt: timestamp('completed_at'),
 });
 
+export const projectEvents = pgTable('project_events', {
+  projectId: text('project_id').notNull().references(() => projects.id, { onDelete: 'cascade' }),
+  seq: integer('seq').notNull(),
+  event: text('event').notNull(),
+}, (table) => [
+  primaryKey({ columns: [table.projectId, table.seq] }),
+]);
+
 export type Project = typeof projects.$inferSelect;
 export type NewProject = typeof projects.$inferInsert;
 export type Node = typeof nodes.$inferSelect;
@@ -57,3 +70,4 @@ export type Edge = typeof edges.$inferSelect;
 export type NewEdge = typeof edges.$inferInsert;
 export type Investigation = typeof investigations.$inferSelect;
 export type NewInvestigation = typeof investigations.$inferInsert;
+export type ProjectEvents = typeof projectEvents.$inferSelect;